@@ -0,0 +1,32 @@
+"""Benchmarks of the registered JSON backends on serialized Transactions.
+
+`util.use_serializer` refuses backends that don't serialize
+`util.CONFORMANCE_CORPUS` like the reference backend, unless `unsafe` is set.
+"""
+import pytest
+
+from bigchaindb_common.util import SERIALIZERS
+
+
+@pytest.fixture(params=sorted(SERIALIZERS))
+def serializer(request):
+    return SERIALIZERS[request.param]
+
+
+@pytest.fixture
+def tx_dict(shape):
+    return shape.build().sign(shape.private_keys).to_dict()
+
+
+def bench_dumps(benchmark, serializer, tx_dict):
+    benchmark(serializer.dumps, tx_dict)
+
+
+def bench_dumps_bytes(benchmark, serializer, tx_dict):
+    benchmark(serializer.dumps_bytes, tx_dict)
+
+
+def bench_loads(benchmark, serializer, tx_dict):
+    raw = serializer.dumps_bytes(tx_dict)
+    assert serializer.loads(raw) == tx_dict
+    benchmark(serializer.loads, raw)
@@ -0,0 +1,68 @@
+"""Benchmarks of the Transaction model's most frequently used methods.
+
+Run them with `make benchmark`. Results are saved as JSON in `.benchmarks/`
+and can be compared with `py.test benchmarks --benchmark-compare`.
+"""
+from bigchaindb_common.transaction import Transaction
+from bigchaindb_common.util import serialize
+
+
+def signed(shape):
+    return shape.build().sign(shape.private_keys)
+
+
+def bench_build(benchmark, record_allocations, shape):
+    benchmark(shape.build)
+    record_allocations(shape.build)
+
+
+def bench_sign(benchmark, record_allocations, shape):
+    def setup():
+        return (shape.build(),), {}
+
+    def sign(tx):
+        return tx.sign(shape.private_keys)
+
+    benchmark.pedantic(sign, setup=setup, rounds=20)
+    record_allocations(sign, shape.build())
+
+
+def bench_to_dict(benchmark, record_allocations, shape):
+    tx = signed(shape)
+    benchmark(tx.to_dict)
+    record_allocations(tx.to_dict)
+
+
+def bench_id(benchmark, record_allocations, shape):
+    tx = signed(shape)
+
+    def setup():
+        # NOTE: Assigning a hashed attribute invalidates the cached id
+        tx.timestamp = tx.timestamp
+        return (), {}
+
+    def get_id():
+        return tx.id
+
+    benchmark.pedantic(get_id, setup=setup, rounds=50)
+    setup()
+    record_allocations(get_id)
+
+
+def bench_from_dict(benchmark, record_allocations, shape):
+    tx_dict = signed(shape).to_dict()
+    benchmark(Transaction.from_dict, tx_dict)
+    record_allocations(Transaction.from_dict, tx_dict)
+
+
+def bench_from_json(benchmark, record_allocations, shape):
+    raw = serialize(signed(shape).to_dict())
+    benchmark(Transaction.from_json, raw)
+    record_allocations(Transaction.from_json, raw)
+
+
+def bench_fulfillments_valid(benchmark, record_allocations, shape):
+    tx = signed(shape)
+    result = benchmark(tx.fulfillments_valid, shape.input_conditions)
+    assert result is True
+    record_allocations(tx.fulfillments_valid, shape.input_conditions)
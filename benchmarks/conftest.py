@@ -0,0 +1,122 @@
+"""Transaction shapes shared by all benchmarks.
+
+Every shape provides a function that builds an unsigned Transaction, the
+private keys needed to sign it and the Conditions its Fulfillments spend.
+"""
+import tracemalloc
+from collections import namedtuple
+
+import pytest
+
+from bigchaindb_common.crypto import generate_key_pair
+from bigchaindb_common.transaction import Asset, Transaction
+
+
+Shape = namedtuple('Shape', ('build', 'private_keys', 'input_conditions'))
+
+# NOTE: The number of owners, inputs or levels of a shape
+WIDTH = 10
+INPUTS = 20
+METADATA_SIZE = 100000
+
+
+def gen_keys(count):
+    """Returns `count` private keys and their public keys."""
+    key_pairs = [generate_key_pair() for _ in range(count)]
+    return [pair[0] for pair in key_pairs], [pair[1] for pair in key_pairs]
+
+
+def single_io():
+    private_keys, public_keys = gen_keys(1)
+    return Shape(lambda: Transaction.create(public_keys, public_keys),
+                 private_keys, None)
+
+
+def threshold_transfer():
+    """A transfer of an asset locked by a `WIDTH`-of-`WIDTH` Condition."""
+    private_keys, public_keys = gen_keys(WIDTH)
+    tx = Transaction.create(public_keys[:1], public_keys)
+    tx.sign(private_keys[:1])
+    inputs = tx.to_inputs()
+    return Shape(lambda: Transaction.transfer(inputs, public_keys[:1],
+                                              tx.asset),
+                 private_keys, tx.conditions)
+
+
+def multiple_inputs_transfer():
+    """A transfer spending the outputs of `INPUTS` Transactions."""
+    private_keys, public_keys = gen_keys(1)
+    txs = [Transaction.create(public_keys, public_keys).sign(private_keys)
+           for _ in range(INPUTS)]
+    inputs = [tx.to_inputs()[0] for tx in txs]
+    input_conditions = [tx.conditions[0] for tx in txs]
+    return Shape(lambda: Transaction.transfer(inputs,
+                                              [public_keys] * INPUTS,
+                                              txs[0].asset),
+                 private_keys, input_conditions)
+
+
+def deep_threshold():
+    """A Transaction locking an asset with `WIDTH` nested thresholds.
+
+        Note:
+            cryptoconditions can't encode the Condition of threshold trees
+            nested deeper than two levels, which is why this tree grows in
+            width instead.
+    """
+    private_keys, public_keys = gen_keys(2 * WIDTH)
+    owners_after = [public_keys[index:index + 2]
+                    for index in range(0, 2 * WIDTH, 2)]
+    return Shape(lambda: Transaction.create(public_keys[:1], owners_after),
+                 private_keys[:1], None)
+
+
+def large_metadata():
+    private_keys, public_keys = gen_keys(1)
+    metadata = {'data': 'x' * METADATA_SIZE,
+                'list': list(range(METADATA_SIZE // 100))}
+    return Shape(lambda: Transaction.create(public_keys, public_keys, metadata,
+                                            Asset({'data': metadata})),
+                 private_keys, None)
+
+
+SHAPES = {
+    '1-1': single_io,
+    '1-N-threshold': threshold_transfer,
+    'N-input-transfer': multiple_inputs_transfer,
+    'deep-threshold': deep_threshold,
+    'large-metadata': large_metadata,
+}
+
+
+@pytest.fixture(scope='session', params=sorted(SHAPES))
+def shape(request):
+    return SHAPES[request.param]()
+
+
+@pytest.fixture
+def record_allocations(benchmark):
+    """Runs a function once more while tracing its memory allocations.
+
+        The peak number of bytes allocated during the call and the number
+        of bytes and blocks still held once it returned, including its
+        result, are stored in the benchmark's `extra_info` and hence in its
+        JSON report.
+    """
+    def record(func, *args):
+        # NOTE: Tracing starts from zero, so the peak is the call's own
+        tracemalloc.start()
+        try:
+            result = func(*args)
+            retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        del result
+
+        stats = snapshot.statistics('filename')
+        benchmark.extra_info['allocated_bytes'] = peak_bytes
+        benchmark.extra_info['retained_bytes'] = retained_bytes
+        benchmark.extra_info['retained_blocks'] = sum(stat.count
+                                                      for stat in stats)
+    return record
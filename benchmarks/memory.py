@@ -0,0 +1,81 @@
+"""Measures the memory used per instance of the transaction model classes.
+
+Every class is compared to a subclass of itself without `__slots__`, which
+stores its attributes in a per-instance `__dict__` like the classes did
+before they declared `__slots__`.
+
+Usage::
+
+    python benchmarks/memory.py [--count N]
+"""
+import argparse
+import tracemalloc
+
+from cryptoconditions import Ed25519Fulfillment
+
+from bigchaindb_common.transaction import (Asset, Condition, Fulfillment,
+                                           Metadata, Transaction,
+                                           TransactionLink)
+
+
+PUBLIC_KEY = 'JEAkEJqLbbgDRAtMm8YAjGp759Aq2qTn9eaEHUj2XePE'
+
+
+def with_dict(cls):
+    """Returns a subclass of `cls` that has a per-instance `__dict__`."""
+    return type(cls.__name__ + 'WithDict', (cls,), {})
+
+
+def factories():
+    """Returns a constructor for every class to measure.
+
+        Note:
+            Shared arguments are created upfront, so that only the memory of
+            the instances themselves is measured.
+    """
+    ccffill = Ed25519Fulfillment(public_key=PUBLIC_KEY)
+    owners = [PUBLIC_KEY]
+    asset = Asset()
+    return [
+        (TransactionLink, lambda cls, i: cls('a transaction id', i)),
+        (Fulfillment, lambda cls, i: cls(ccffill, owners)),
+        (Condition, lambda cls, i: cls(ccffill, owners, i)),
+        (Asset, lambda cls, i: cls(None, 'an asset id')),
+        (Metadata, lambda cls, i: cls(None, 'a metadata id')),
+        (Transaction, lambda cls, i: cls(Transaction.TRANSFER, asset, None,
+                                         None, None, '0', 1)),
+    ]
+
+
+def bytes_per_object(cls, factory, count):
+    """Returns the average number of bytes allocated per instance."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(cls, i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # NOTE: The list holding the objects is not part of the measurement
+    allocated = sum(stat.size_diff for stat
+                    in after.compare_to(before, 'filename'))
+    allocated -= objects.__sizeof__()
+    return allocated / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000,
+                        help='the number of instances to create per class')
+    args = parser.parse_args()
+
+    print('{:<16} {:>12} {:>12} {:>8}'.format('class', '__dict__',
+                                              '__slots__', 'saved'))
+    for cls, factory in factories():
+        before = bytes_per_object(with_dict(cls), factory, args.count)
+        after = bytes_per_object(cls, factory, args.count)
+        print('{:<16} {:>10.0f} B {:>10.0f} B {:>7.0%}'
+              .format(cls.__name__, before, after, 1 - after / before))
+
+
+if __name__ == '__main__':
+    main()
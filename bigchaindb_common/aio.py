@@ -0,0 +1,290 @@
+"""Coroutines that parse, sign and validate Transactions off the event loop.
+
+    Note:
+        Parsing, signing and validating are CPU-bound. Running them inline
+        blocks an `asyncio` event loop for as long as they take. The
+        coroutines of this module run them on an executor instead. If it is a
+        :class:`concurrent.futures.ProcessPoolExecutor`, only serialized
+        payloads are sent to its workers, like in
+        :func:`~bigchaindb_common.transaction.validate_many`. Otherwise, the
+        Transactions are passed to the executor as they are.
+
+        The module level coroutines use a default :class:`Offloader`, which
+        can be replaced with :func:`configure`.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from bigchaindb_common.crypto import Keyring
+from bigchaindb_common.transaction import (Transaction, _apply_signed_uris,
+                                           _sign_chunk,
+                                           _to_signing_payload,
+                                           _validate_payload)
+from bigchaindb_common.util import serialize
+
+
+class Offloader(object):
+    """Runs Transaction operations on an executor.
+
+        Note:
+            Concurrent requests for the same work, e.g. validating the same
+            Transaction twice, are coalesced: the work is done once and all
+            callers receive its result. Requests are keyed by the
+            Transaction's id and its Fulfillments' URIs, so Transactions with
+            the same id but different signatures are never coalesced. The
+            key is computed off the event loop as well.
+
+            At most `max_in_flight` operations are submitted to the executor
+            at once. Further requests wait until a slot is freed, so that a
+            burst of requests can't pile up an unbounded backlog of work.
+    """
+
+    def __init__(self, executor=None, max_in_flight=64):
+        """Creates an Offloader.
+
+            Args:
+                executor (:class:`concurrent.futures.Executor`, optional): The
+                    executor to run operations on. Defaults to the event
+                    loop's default executor.
+                max_in_flight (int): The maximum number of operations
+                    submitted to the executor at once.
+
+            Raises:
+                ValueError: If `max_in_flight` is not a positive integer.
+        """
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise ValueError('`max_in_flight` must be a positive integer')
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+
+        # NOTE: Payloads are only serialized for workers in other processes.
+        #       Preparing them and applying results is done on a thread.
+        self._serialize = isinstance(executor, ProcessPoolExecutor)
+        self._local_executor = None if self._serialize else executor
+
+        self._loop = None
+        self._semaphore = None
+        self._pending = {}
+        self._in_flight = 0
+
+    @property
+    def in_flight(self):
+        """int: The number of operations currently submitted to the
+        executor."""
+        return self._in_flight
+
+    def _bind_loop(self):
+        loop = asyncio.get_event_loop()
+        if self._loop is not loop:
+            # NOTE: Primitives of asyncio are bound to a single event loop
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._pending = {}
+        return loop
+
+    async def _offload(self, executor, func, *args):
+        """Runs `func(*args)` on `executor`, once a slot is free."""
+        loop = self._bind_loop()
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            finally:
+                self._in_flight -= 1
+
+    def _run(self, key, func, *args):
+        """Returns an awaitable of `func(*args)` run on the executor, sharing
+        the work with a pending request for the same `key`."""
+        self._bind_loop()
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._offload(self.executor, func, *args))
+            self._pending[key] = future
+            future.add_done_callback(
+                lambda future: self._complete(key, future))
+        # NOTE: Cancelling one caller must not cancel the work of the others
+        return asyncio.shield(future)
+
+    def _complete(self, key, future):
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if not future.cancelled():
+            # NOTE: Mark the exception as retrieved, in case all callers
+            #       were cancelled
+            future.exception()
+
+    async def parse(self, raw):
+        """Transforms a JSON formatted Transaction to a Transaction object.
+
+            Note:
+                Callers parsing the same `raw` concurrently receive the same
+                Transaction object.
+
+            Args:
+                raw (str|bytes): The Transaction as JSON formatted string.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Transaction`
+
+            Raises:
+                InvalidHash: If the Transaction's id is missing or invalid.
+        """
+        return await self._run(('parse', raw), Transaction.from_json, raw)
+
+    async def sign(self, tx, private_keys):
+        """Signs a Transaction's Fulfillments.
+
+            Args:
+                tx (:class:`~bigchaindb_common.transaction.Transaction`): The
+                    Transaction to sign. Its Fulfillments are replaced with
+                    the signed ones.
+                private_keys (:obj:`list` of :obj:`str`|:class:`~.crypto.
+                    Keyring`): The private keys needed to sign all
+                    Fulfillments.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Transaction`: `tx`.
+
+            Raises:
+                KeypairMismatchException: If a Fulfillment can't be signed
+                    with `private_keys`.
+        """
+        keyring = None
+        if isinstance(private_keys, Keyring):
+            keyring = private_keys
+            private_keys = keyring.private_keys
+        private_keys = tuple(private_keys)
+
+        key, payload = await self._offload(self._local_executor,
+                                           _prepare_signing, tx,
+                                           private_keys, self._serialize)
+        if self._serialize:
+            uris, = await self._run(key, _sign_chunk,
+                                    (private_keys, [payload]))
+            return await self._offload(self._local_executor,
+                                       _apply_signed_uris, tx, uris)
+
+        signed = await self._run(key, _sign_fulfillments, tx,
+                                 keyring or private_keys)
+        for index, fulfillment in enumerate(signed):
+            tx.fulfillments[index] = fulfillment
+        return tx
+
+    async def validate(self, tx, input_conditions=None):
+        """Validates a Transaction's Fulfillments.
+
+            Args:
+                tx (:class:`~bigchaindb_common.transaction.Transaction`): The
+                    Transaction to validate.
+                input_conditions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Condition`, optional): The Conditions `tx`
+                    spends. Required if `tx` is a `TRANSFER` Transaction.
+
+            Returns:
+                bool: If all Fulfillments of `tx` are valid. `False` if `tx`
+                    doesn't spend as many Conditions as `input_conditions`
+                    holds.
+        """
+        key, payload = await self._offload(self._local_executor,
+                                           _prepare_validation, tx,
+                                           input_conditions, self._serialize)
+        if self._serialize:
+            return await self._run(key, _validate_payload, payload)
+        return await self._run(key, _validate_transaction, tx,
+                               input_conditions)
+
+
+def _fulfillment_uri(fulfillment):
+    try:
+        return fulfillment.serialize_uri()
+    except (TypeError, AttributeError):
+        # NOTE: Unsigned Fulfillments have no URI. They are never valid.
+        return None
+
+
+def _prepare_validation(tx, input_conditions, serialized):
+    """Returns the key of a validation request and, for workers in other
+    processes, its payload."""
+    condition_uris = None
+    if input_conditions is not None:
+        condition_uris = tuple(condition.condition_uri
+                               for condition in input_conditions)
+    key = ('validate', tx.id,
+           tuple(_fulfillment_uri(ffill) for ffill in tx.fulfillments),
+           condition_uris)
+
+    payload = None
+    if serialized:
+        if input_conditions is not None:
+            input_conditions = [condition.to_dict()
+                                for condition in input_conditions]
+        payload = (serialize(tx.to_dict()), serialize(input_conditions))
+    return key, payload
+
+
+def _validate_transaction(tx, input_conditions):
+    try:
+        return tx.fulfillments_valid(input_conditions)
+    except ValueError:
+        return False
+
+
+def _prepare_signing(tx, private_keys, serialized):
+    """Returns the key of a signing request and, for workers in other
+    processes, its payload."""
+    key = ('sign', tx.id,
+           tuple(ffill.fulfillment.condition_uri for ffill in tx.fulfillments),
+           private_keys)
+    payload = _to_signing_payload(tx) if serialized else None
+    return key, payload
+
+
+def _sign_fulfillments(tx, private_keys):
+    """Returns signed copies of a Transaction's Fulfillments."""
+    if isinstance(private_keys, Keyring):
+        keyring = private_keys
+    else:
+        keyring = Keyring(list(private_keys))
+    return [Transaction._sign_fulfillment(fulfillment, message, keyring)
+            for fulfillment, message
+            in zip(tx.fulfillments, tx._gen_partial_messages())]
+
+
+_offloader = Offloader()
+
+
+def configure(executor=None, max_in_flight=64):
+    """Replaces the Offloader used by the module level coroutines.
+
+        Args:
+            executor (:class:`concurrent.futures.Executor`, optional): The
+                executor to run operations on. Defaults to the event loop's
+                default executor.
+            max_in_flight (int): The maximum number of operations submitted
+                to the executor at once.
+
+        Returns:
+            :class:`~bigchaindb_common.aio.Offloader`: The new Offloader.
+    """
+    global _offloader
+    _offloader = Offloader(executor, max_in_flight)
+    return _offloader
+
+
+async def parse(raw):
+    """Parses a Transaction with the configured Offloader. See
+    :meth:`Offloader.parse`."""
+    return await _offloader.parse(raw)
+
+
+async def sign(tx, private_keys):
+    """Signs a Transaction with the configured Offloader. See
+    :meth:`Offloader.sign`."""
+    return await _offloader.sign(tx, private_keys)
+
+
+async def validate(tx, input_conditions=None):
+    """Validates a Transaction with the configured Offloader. See
+    :meth:`Offloader.validate`."""
+    return await _offloader.validate(tx, input_conditions)
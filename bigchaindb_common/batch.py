@@ -0,0 +1,101 @@
+"""Analysis of the dependencies between the Transactions of a batch."""
+from bigchaindb_common.exceptions import DoubleSpend
+
+
+class SpendGraph(object):
+    """Describes which Transactions of a batch spend each other's Conditions.
+
+        Note:
+            The graph is built in a single pass over the inputs of all
+            Transactions, without validating any signatures.
+
+        Attributes:
+            transactions (:obj:`list` of :class:`~bigchaindb_common.
+                transaction.Transaction`): The analyzed Transactions.
+            dependencies (dict): Maps the id of every Transaction to the
+                :obj:`set` of ids of the Transactions of the batch it spends
+                Conditions of.
+            external_inputs (:obj:`set` of :class:`~bigchaindb_common.
+                transaction.TransactionLink`): The inputs that spend
+                Conditions of Transactions outside of the batch.
+            order (:obj:`list` of :class:`~bigchaindb_common.transaction.
+                Transaction`): The Transactions in topological order, so that
+                every Transaction comes after the ones it depends on.
+            groups (:obj:`list` of :obj:`list` of :class:`~bigchaindb_common.
+                transaction.Transaction`): The Transactions split into groups
+                that only depend on Transactions of previous groups. The
+                Transactions of a group can be validated in parallel.
+    """
+
+    def __init__(self, transactions):
+        """Builds the spend graph of a batch of Transactions.
+
+            Args:
+                transactions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Transaction`): The Transactions to analyze.
+
+            Raises:
+                DoubleSpend: If two inputs of the batch spend the same
+                    Condition.
+                ValueError: If a Transaction is contained in the batch twice.
+        """
+        self.transactions = transactions
+        self.dependencies = {}
+        self.external_inputs = set()
+
+        tx_ids = [tx.id for tx in transactions]
+        if len(set(tx_ids)) != len(tx_ids):
+            raise ValueError('`transactions` must not contain a Transaction '
+                             'twice')
+        tx_ids_set = set(tx_ids)
+
+        spenders = {}
+        for tx_id, tx in zip(tx_ids, transactions):
+            dependencies = self.dependencies[tx_id] = set()
+            for fulfillment in tx.fulfillments:
+                link = fulfillment.tx_input
+                if not link:
+                    continue
+                if link in spenders:
+                    raise DoubleSpend('Input `{}` is spent by transaction '
+                                      '`{}` and `{}`'
+                                      .format(link.to_dict(),
+                                              spenders[link], tx_id))
+                spenders[link] = tx_id
+
+                if link.txid in tx_ids_set:
+                    dependencies.add(link.txid)
+                else:
+                    self.external_inputs.add(link)
+
+        self.groups = self._gen_groups(tx_ids)
+        self.order = [tx for group in self.groups for tx in group]
+
+    def _gen_groups(self, tx_ids):
+        """Splits the batch into groups of independent Transactions."""
+        transactions = dict(zip(tx_ids, self.transactions))
+        positions = {tx_id: index for index, tx_id in enumerate(tx_ids)}
+        dependents = {tx_id: [] for tx_id in tx_ids}
+        missing = {}
+        for tx_id in tx_ids:
+            for dependency in self.dependencies[tx_id]:
+                dependents[dependency].append(tx_id)
+            missing[tx_id] = len(self.dependencies[tx_id])
+
+        groups = []
+        group = [tx_id for tx_id in tx_ids if missing[tx_id] == 0]
+        while group:
+            groups.append([transactions[tx_id] for tx_id in group])
+            next_group = []
+            for tx_id in group:
+                for dependent in dependents[tx_id]:
+                    missing[dependent] -= 1
+                    if missing[dependent] == 0:
+                        next_group.append(dependent)
+            # NOTE: Keep the order of the batch within a group
+            group = sorted(next_group, key=positions.__getitem__)
+
+        if sum(len(group) for group in groups) != len(tx_ids):
+            raise ValueError('`transactions` must not depend on each other '
+                             'cyclically')
+        return groups
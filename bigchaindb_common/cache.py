@@ -0,0 +1,95 @@
+"""Bounded caches to avoid repeating expensive computations."""
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache(object):
+    """A bounded mapping that evicts its least recently used entries.
+
+        Attributes:
+            maxsize (int): The maximum number of entries held by the cache.
+            hits (int): The number of lookups that found an entry.
+            misses (int): The number of lookups that didn't find an entry.
+            evictions (int): The number of entries that were evicted to make
+                room for new ones.
+    """
+
+    def __init__(self, maxsize=1024):
+        """Creates an empty cache.
+
+            Args:
+                maxsize (int): The maximum number of entries held by the
+                    cache.
+
+            Raises:
+                ValueError: If `maxsize` is not a positive integer.
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('`maxsize` must be a positive integer')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Looks up an entry and marks it as recently used.
+
+            Args:
+                key: The key of the entry.
+                default (optional): Returned if there is no entry for `key`.
+
+            Returns:
+                The value of the entry or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Adds or replaces an entry, evicting the least recently used one if
+        the cache is full.
+
+            Args:
+                key: The key of the entry.
+                value: The value of the entry.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Removes all entries and resets all counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Returns the cache's counters.
+
+            Returns:
+                dict: The number of `hits`, `misses` and `evictions` as well as
+                    the current `size` and the `maxsize` of the cache.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
@@ -1,12 +1,19 @@
 # Separate all crypto code so that we can easily test several implementations
 
+from collections.abc import Mapping
+
 import sha3
 from cryptoconditions import crypto
 
 
 def hash_data(data):
     """Hash the provided data using SHA3-256"""
-    return sha3.sha3_256(data.encode()).hexdigest()
+    return hash_bytes(data.encode())
+
+
+def hash_bytes(data):
+    """Hash the provided bytes using SHA3-256, without encoding them first"""
+    return sha3.sha3_256(data).hexdigest()
 
 
 def generate_key_pair():
@@ -14,5 +21,50 @@ def generate_key_pair():
     private_key, public_key = crypto.ed25519_generate_key_pair()
     return private_key.decode(), public_key.decode()
 
+
 SigningKey = crypto.Ed25519SigningKey
 VerifyingKey = crypto.Ed25519VerifyingKey
+
+
+class Keyring(Mapping):
+    """Maps public keys to the SigningKeys of a list of private keys.
+
+        Note:
+            Decoding a private key and deriving its public key is done once,
+            when the Keyring is created. A Keyring can hence be reused to sign
+            many Transactions with the same keys.
+
+        Attributes:
+            private_keys (:obj:`list` of :obj:`str`): The base58 encoded
+                private keys held by the Keyring.
+    """
+
+    def __init__(self, private_keys):
+        """Creates a Keyring from base58 encoded private keys.
+
+            Args:
+                private_keys (:obj:`list` of :obj:`str`): The private keys to
+                    hold.
+
+            Raises:
+                TypeError: If `private_keys` is not a list instance.
+        """
+        if not isinstance(private_keys, list):
+            raise TypeError('`private_keys` must be a list instance')
+        self.private_keys = private_keys
+        self._key_pairs = {}
+        for private_key in private_keys:
+            signing_key = SigningKey(private_key)
+            # NOTE: Returned values from cc are always bytestrings so here we
+            #       need to decode to convert the bytestring into a python str
+            public_key = signing_key.get_verifying_key().encode().decode()
+            self._key_pairs[public_key] = signing_key
+
+    def __getitem__(self, public_key):
+        return self._key_pairs[public_key]
+
+    def __iter__(self):
+        return iter(self._key_pairs)
+
+    def __len__(self):
+        return len(self._key_pairs)
@@ -22,6 +22,10 @@ class DoubleSpend(Exception):
     """Raised if a double spend is found"""
 
 
+class InputDoesNotExist(Exception):
+    """Raised if a transaction spends an output that is not known"""
+
+
 class InvalidHash(Exception):
     """Raised if there was an error checking the hash for a particular
     operation"""
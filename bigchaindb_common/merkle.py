@@ -0,0 +1,173 @@
+"""A Merkle tree committing to a list of Transaction ids."""
+import sha3
+
+
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+
+def _hash_leaf(tx_id):
+    return sha3.sha3_256(LEAF_PREFIX + tx_id.encode()).digest()
+
+
+def _hash_node(left, right):
+    return sha3.sha3_256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree(object):
+    """A Merkle tree over Transaction ids, e.g. the ones of a block.
+
+        Note:
+            Leaves and inner nodes are hashed with SHA3-256, as in
+            :func:`~bigchaindb_common.crypto.hash_data`, but with different
+            prefixes, so that an inner node can't be passed off as a leaf.
+
+            A node without a sibling is promoted to the next level unchanged.
+            Hence, appending to the tree only rehashes the path from the new
+            leaf to the root.
+    """
+
+    def __init__(self, tx_ids=None):
+        """Creates a Merkle tree.
+
+            Args:
+                tx_ids (:obj:`iterable` of :obj:`str`, optional): The ids of
+                    the Transactions to commit to.
+
+            Raises:
+                ValueError: If an id is contained in `tx_ids` twice.
+        """
+        self._levels = [[]]
+        self._positions = {}
+        if tx_ids:
+            self.extend(tx_ids)
+
+    def __len__(self):
+        return len(self._levels[0])
+
+    def __contains__(self, tx_id):
+        return tx_id in self._positions
+
+    @property
+    def root(self):
+        """str: The hex encoded root hash of the tree."""
+        if not self._levels[0]:
+            return sha3.sha3_256(b'').hexdigest()
+        return self._levels[-1][0].hex()
+
+    def append(self, tx_id):
+        """Adds a Transaction id to the tree.
+
+            Args:
+                tx_id (str): The id of a Transaction.
+
+            Raises:
+                ValueError: If `tx_id` is already in the tree.
+        """
+        self.extend([tx_id])
+
+    def extend(self, tx_ids):
+        """Adds Transaction ids to the tree.
+
+            Note:
+                All ids are hashed before the inner nodes are, so that every
+                inner node is only rehashed once.
+
+            Args:
+                tx_ids (:obj:`iterable` of :obj:`str`): The ids of the
+                    Transactions.
+
+            Raises:
+                ValueError: If an id is already in the tree or contained in
+                    `tx_ids` twice. The tree is left unchanged in that case.
+        """
+        leaves = self._levels[0]
+        start = len(leaves)
+        positions = {}
+        for index, tx_id in enumerate(tx_ids, start):
+            if tx_id in self._positions or tx_id in positions:
+                raise ValueError('Transaction id `{}` is already in the tree'
+                                 .format(tx_id))
+            positions[tx_id] = index
+        if not positions:
+            return
+
+        self._positions.update(positions)
+        # NOTE: `tx_ids` may be an iterator. `positions` holds the ids in the
+        #       order they were passed in.
+        leaves.extend(_hash_leaf(tx_id) for tx_id in positions)
+        self._rehash(start)
+
+    def _rehash(self, start):
+        """Recomputes all inner nodes that depend on the leaves from index
+        `start` on."""
+        level = 0
+        while len(self._levels[level]) > 1:
+            children = self._levels[level]
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            parents = self._levels[level + 1]
+
+            start //= 2
+            del parents[start:]
+            for index in range(start * 2, len(children) - 1, 2):
+                parents.append(_hash_node(children[index],
+                                          children[index + 1]))
+            if len(children) % 2:
+                parents.append(children[-1])
+            level += 1
+
+    def proof(self, tx_id):
+        """Generates a proof that a Transaction id is in the tree.
+
+            Args:
+                tx_id (str): The id of a Transaction.
+
+            Returns:
+                :obj:`list` of :obj:`dict`: The siblings on the path from the
+                    leaf of `tx_id` to the root, each with the `position`
+                    (`'left'` or `'right'`) and the hex encoded `hash` of the
+                    sibling.
+
+            Raises:
+                KeyError: If `tx_id` is not in the tree.
+        """
+        index = self._positions[tx_id]
+        proof = []
+        for nodes in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(nodes):
+                proof.append({
+                    'position': 'left' if sibling < index else 'right',
+                    'hash': nodes[sibling].hex(),
+                })
+            index //= 2
+        return proof
+
+
+def verify_proof(tx_id, proof, root):
+    """Verifies that a Transaction id is committed to by a Merkle root.
+
+        Args:
+            tx_id (str): The id of a Transaction.
+            proof (:obj:`list` of :obj:`dict`): The proof, as generated by
+                :meth:`~.MerkleTree.proof`.
+            root (str): The hex encoded root hash of a
+                :class:`~.MerkleTree`.
+
+        Returns:
+            bool: If the proof is valid.
+    """
+    digest = _hash_leaf(tx_id)
+    try:
+        for step in proof:
+            sibling = bytes.fromhex(step['hash'])
+            if step['position'] == 'left':
+                digest = _hash_node(sibling, digest)
+            elif step['position'] == 'right':
+                digest = _hash_node(digest, sibling)
+            else:
+                return False
+    except (KeyError, TypeError, ValueError):
+        return False
+    return digest.hex() == root
@@ -0,0 +1,509 @@
+"""A staged pipeline that turns raw payloads into validated Transactions."""
+import asyncio
+from collections import namedtuple
+from inspect import isawaitable
+from time import monotonic
+
+from bigchaindb_common.exceptions import InvalidHash, InvalidSignature
+from bigchaindb_common.transaction import Transaction, _CC_PARSING_ERRORS
+from bigchaindb_common.util import deserialize
+
+
+STAGES = ('deserialize', 'id', 'structure', 'fulfillments')
+
+# NOTE: The exceptions that reject a payload in a stage. Any other exception
+#       is considered a bug and aborts the pipeline. Payloads are checked to
+#       have the shape of a Transaction explicitly (see `_check_shape`), so
+#       that no stage has to reject them on e.g. `KeyError` or `TypeError`.
+REJECTING_ERRORS = {
+    'deserialize': (ValueError, TypeError),
+    'id': (InvalidHash, ValueError),
+    'structure': (InvalidSignature, ValueError),
+    'fulfillments': (InvalidSignature, ValueError),
+}
+
+_NONE = type(None)
+
+# NOTE: The keys and value types of the objects a Transaction consists of.
+#       The second mapping of a shape holds optional keys.
+_OBJECT_SHAPE = ({}, {})
+_ENVELOPE_SHAPE = ({'id': str, 'transaction': dict}, {})
+_SIGNED_SHAPE = ({'fulfillments': list}, {})
+_TRANSACTION_SHAPE = ({'version': int, 'transaction': dict}, {})
+_BODY_SHAPE = ({'operation': str, 'timestamp': str, 'fulfillments': list,
+                'conditions': list, 'metadata': (dict, _NONE),
+                'asset': dict}, {})
+_FULFILLMENT_SHAPE = ({'owners_before': list, 'fulfillment': (str, dict),
+                       'input': (dict, _NONE)}, {'fid': int})
+_INPUT_SHAPE = ({'txid': str, 'cid': int}, {})
+_CONDITION_SHAPE = ({'owners_after': list, 'condition': dict,
+                     'amount': int}, {'cid': int})
+_CONDITION_DETAILS_SHAPE = ({'uri': str}, {'details': dict})
+_METADATA_SHAPE = ({'id': str, 'data': dict}, {})
+_ASSET_SHAPE = ({'id': str}, {'data': (dict, _NONE), 'divisible': bool,
+                              'updatable': bool, 'refillable': bool})
+
+
+class Result(namedtuple('Result', ('raw', 'transaction', 'stage', 'reason'))):
+    """The outcome of sending a payload through a :class:`Pipeline`.
+
+        Attributes:
+            raw: The payload as it was passed in.
+            transaction (:class:`~bigchaindb_common.transaction.Transaction`):
+                The accepted Transaction or `None`, if the payload was
+                rejected.
+            stage (str): The stage that rejected the payload or `None`, if it
+                was accepted.
+            reason (str): Why the payload was rejected or `None`, if it was
+                accepted.
+    """
+    __slots__ = ()
+
+    @property
+    def accepted(self):
+        """bool: If the payload passed all stages."""
+        return self.stage is None
+
+
+class StageStats(object):
+    """Measures the throughput and latency of a pipeline stage.
+
+        Attributes:
+            processed (int): The number of payloads that left the stage.
+            rejected (int): The number of payloads the stage rejected.
+            busy_time (float): The seconds spent processing payloads.
+            total_latency (float): The seconds between payloads being queued
+                for the stage and leaving it, summed up.
+            max_latency (float): The longest time a payload spent queued for
+                and in the stage, in seconds.
+    """
+
+    def __init__(self):
+        self.processed = 0
+        self.rejected = 0
+        self.busy_time = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._first_started = None
+        self._last_finished = None
+
+    def record(self, queued, started, finished, rejected=False):
+        """Records a payload that left the stage.
+
+            Args:
+                queued (float): When the payload was queued for the stage.
+                started (float): When the stage started processing it.
+                finished (float): When the stage finished processing it.
+                rejected (bool): If the stage rejected the payload.
+        """
+        self.processed += 1
+        self.rejected += rejected
+        self.busy_time += finished - started
+        latency = finished - queued
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if self._first_started is None:
+            self._first_started = started
+        self._last_finished = finished
+
+    @property
+    def mean_latency(self):
+        """float: The mean time a payload spent queued for and in the
+        stage, in seconds."""
+        if not self.processed:
+            return 0.0
+        return self.total_latency / self.processed
+
+    @property
+    def throughput(self):
+        """float: The payloads processed per second, between the first one
+        entering and the last one leaving the stage."""
+        if not self.processed:
+            return 0.0
+        elapsed = self._last_finished - self._first_started
+        return self.processed / elapsed if elapsed else float('inf')
+
+    def to_dict(self):
+        """Transforms the stats to a Python dictionary.
+
+            Returns:
+                dict
+        """
+        return {
+            'processed': self.processed,
+            'rejected': self.rejected,
+            'busy_time': self.busy_time,
+            'mean_latency': self.mean_latency,
+            'max_latency': self.max_latency,
+            'throughput': self.throughput,
+        }
+
+
+class Pipeline(object):
+    """Sends raw Transaction payloads through a series of checks.
+
+        Note:
+            Every payload passes the `STAGES` in order:
+
+            1. `deserialize`: Parses the payload with
+               :func:`~bigchaindb_common.util.deserialize`.
+            2. `id`: Verifies the Transaction's id, as
+               `Transaction.from_dict` does.
+            3. `structure`: Transforms the dictionary to a Transaction and
+               checks that it has as many Fulfillments as Conditions and
+               that all Fulfillments of a `TRANSFER` Transaction spend an
+               input.
+            4. `fulfillments`: Looks up the Conditions a `TRANSFER`
+               Transaction spends and validates all Fulfillments with
+               `Transaction.fulfillments_valid`.
+
+            A payload rejected by a stage leaves the pipeline right away.
+
+            Every stage runs `concurrency` workers that take payloads from a
+            queue holding at most `queue_size` of them. A full queue blocks
+            the stage before it, so a slow stage throttles the source instead
+            of buffering an unbounded number of payloads. The work of a stage
+            is run on `executor`, `input_lookup` in the calling thread.
+
+            Results are emitted in the order the payloads leave the pipeline,
+            which may differ from the order they were passed in.
+
+        Attributes:
+            stats (dict): Maps every stage to its
+                :class:`~bigchaindb_common.pipeline.StageStats`. The stats
+                accumulate over all runs of the pipeline.
+    """
+
+    def __init__(self, input_lookup=None, executor=None, concurrency=None,
+                 queue_size=None):
+        """Creates a pipeline.
+
+            Args:
+                input_lookup (callable, optional): Returns the
+                    :class:`~bigchaindb_common.transaction.Condition` a
+                    :class:`~bigchaindb_common.transaction.TransactionLink`
+                    points to, or `None` if it's not available (e.g.
+                    `UnspentOutputs.get_condition`). May also be a coroutine
+                    function. Without it, `TRANSFER` Transactions are
+                    rejected.
+                executor (:class:`concurrent.futures.Executor`, optional): The
+                    executor to run the stages on. Defaults to the event
+                    loop's default executor.
+                concurrency (dict, optional): Maps stages to their number of
+                    workers. Defaults to 1 for every stage.
+                queue_size (dict, optional): Maps stages to the size of their
+                    queue. Defaults to 64 for every stage.
+
+            Raises:
+                ValueError: If a stage is unknown or gets a size that is not a
+                    positive integer.
+        """
+        self.input_lookup = input_lookup
+        self.executor = executor
+        self.concurrency = self._stage_sizes(concurrency, 1, 'concurrency')
+        self.queue_size = self._stage_sizes(queue_size, 64, 'queue_size')
+        self.stats = {stage: StageStats() for stage in STAGES}
+
+    @staticmethod
+    def _stage_sizes(sizes, default, name):
+        stage_sizes = dict.fromkeys(STAGES, default)
+        for stage, size in (sizes or {}).items():
+            if stage not in stage_sizes:
+                raise ValueError('`{}` holds unknown stage `{}`'
+                                 .format(name, stage))
+            if not isinstance(size, int) or size < 1:
+                raise ValueError('`{}` must hold positive integers'
+                                 .format(name))
+            stage_sizes[stage] = size
+        return stage_sizes
+
+    def process(self, payloads):
+        """Sends payloads through the pipeline.
+
+            Note:
+                The pipeline runs on an event loop of its own while the
+                results are consumed. Use `process_async` from within a
+                running event loop.
+
+            Args:
+                payloads (iterable): The raw Transactions, as `str` or
+                    `bytes`.
+
+            Yields:
+                :class:`~bigchaindb_common.pipeline.Result`
+        """
+        loop = asyncio.new_event_loop()
+        results = self.process_async(payloads)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
+
+    def process_async(self, payloads):
+        """Sends payloads through the pipeline.
+
+            Args:
+                payloads (iterable|async iterable): The raw Transactions, as
+                    `str` or `bytes`.
+
+            Returns:
+                An asynchronous iterator of
+                :class:`~bigchaindb_common.pipeline.Result`. Closing it with
+                `aclose()` stops all stages.
+        """
+        return _PipelineRun(self, payloads)
+
+    async def _deserialize(self, raw):
+        return await self._run_in_executor(deserialize, raw)
+
+    async def _check_id(self, tx_body):
+        return await self._run_in_executor(_check_id, tx_body)
+
+    async def _check_structure(self, tx_body):
+        return await self._run_in_executor(_check_structure, tx_body)
+
+    async def _check_fulfillments(self, tx):
+        input_conditions = None
+        if tx.operation == Transaction.TRANSFER:
+            if self.input_lookup is None:
+                raise ValueError('`TRANSFER` Transactions are not accepted')
+            input_conditions = []
+            for fulfillment in tx.fulfillments:
+                condition = self.input_lookup(fulfillment.tx_input)
+                if isawaitable(condition):
+                    condition = await condition
+                if condition is None:
+                    raise ValueError('Input `{}` is not available'
+                                     .format(fulfillment.tx_input.to_dict()))
+                input_conditions.append(condition)
+        return await self._run_in_executor(_check_fulfillments, tx,
+                                           input_conditions)
+
+    def _run_in_executor(self, func, *args):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self.executor, func, *args)
+
+
+def _check_id(tx_body):
+    # NOTE: Only the parts the id is computed from are checked here
+    _check_shape(tx_body, 'Transaction', _ENVELOPE_SHAPE)
+    tx = _check_shape(tx_body['transaction'], 'transaction', _SIGNED_SHAPE)
+    for fulfillment in tx['fulfillments']:
+        _check_shape(fulfillment, 'fulfillment', _OBJECT_SHAPE)
+    Transaction._verify_id(tx_body)
+    return tx_body
+
+
+def _check_structure(tx_body):
+    _check_transaction_shape(tx_body)
+    # NOTE: `tx_body` was deserialized by the pipeline and is not shared
+    tx = Transaction._from_verified_dict(tx_body, copy_values=False)
+    if len(tx.fulfillments) != len(tx.conditions):
+        raise ValueError('Fulfillments and conditions must have the same '
+                         'count')
+    if tx.operation == Transaction.TRANSFER and \
+            not all(fulfillment.tx_input for fulfillment in tx.fulfillments):
+        raise ValueError('All fulfillments of a `TRANSFER` Transaction must '
+                         'spend an input')
+    _check_uris(tx)
+    return tx
+
+
+def _check_uris(tx):
+    """Checks that the URIs of all Conditions and Fulfillments of `tx` can be
+    computed.
+
+        Note:
+            The shape of a payload doesn't tell if cryptoconditions can
+            encode what it parsed. Later stages need the URIs, so they are
+            computed here once, to reject a malformed Transaction with a
+            reason.
+
+        Raises:
+            InvalidSignature: If a URI can't be computed.
+    """
+    for condition in tx.conditions:
+        try:
+            condition.condition_uri
+        except _CC_PARSING_ERRORS:
+            raise InvalidSignature("Condition URI couldn't be computed")
+    for fulfillment in tx.fulfillments:
+        try:
+            fulfillment.serialize_uri()
+        except _CC_PARSING_ERRORS:
+            raise InvalidSignature("Fulfillment URI couldn't be computed")
+
+
+def _check_transaction_shape(tx_body):
+    _check_shape(tx_body, 'Transaction', _TRANSACTION_SHAPE)
+    tx = _check_shape(tx_body['transaction'], 'transaction', _BODY_SHAPE)
+    for fulfillment in tx['fulfillments']:
+        _check_shape(fulfillment, 'fulfillment', _FULFILLMENT_SHAPE)
+        if fulfillment['input'] is not None:
+            _check_shape(fulfillment['input'], 'input', _INPUT_SHAPE)
+    for condition in tx['conditions']:
+        _check_shape(condition, 'condition', _CONDITION_SHAPE)
+        _check_shape(condition['condition'], 'condition',
+                     _CONDITION_DETAILS_SHAPE)
+    if tx['metadata'] is not None:
+        _check_shape(tx['metadata'], 'metadata', _METADATA_SHAPE)
+    _check_shape(tx['asset'], 'asset', _ASSET_SHAPE)
+
+
+def _check_shape(value, name, shape):
+    """Checks that `value` is a dict holding the keys of `shape`, with values
+    of the expected types.
+
+        Returns:
+            dict: `value`.
+
+        Raises:
+            ValueError: If `value` doesn't have the `shape`.
+    """
+    required, optional = shape
+    if not isinstance(value, dict):
+        raise ValueError('`{}` must be an object'.format(name))
+    for key, types in required.items():
+        if key not in value:
+            raise ValueError('`{}` is missing `{}`'.format(name, key))
+    for key, types in list(required.items()) + list(optional.items()):
+        if key in value and not isinstance(value[key], types):
+            raise ValueError('`{}.{}` has an invalid type'.format(name, key))
+    return value
+
+
+def _check_fulfillments(tx, input_conditions):
+    if not tx.fulfillments_valid(input_conditions):
+        raise InvalidSignature('Fulfillments are not valid')
+    return tx
+
+
+def _reason(exc):
+    message = str(exc)
+    if message:
+        return '{}: {}'.format(type(exc).__name__, message)
+    return type(exc).__name__
+
+
+class _Done(object):
+    """Marks the end of a queue."""
+
+
+class _Failure(object):
+    """Carries an exception that aborts a run to its consumer."""
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+class _PipelineRun(object):
+    """An asynchronous iterator over the results of a pipeline run."""
+
+    def __init__(self, pipeline, payloads):
+        self.pipeline = pipeline
+        self.payloads = payloads
+        self._tasks = None
+        self._output = None
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+        if self._tasks is None:
+            self._start()
+        result = await self._output.get()
+        if isinstance(result, _Failure):
+            await self.aclose()
+            raise result.exception
+        if result is _Done:
+            await self.aclose()
+            raise StopAsyncIteration
+        return result
+
+    async def aclose(self):
+        """Stops all stages of the run."""
+        self._closed = True
+        tasks, self._tasks = self._tasks or [], []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start(self):
+        pipeline = self.pipeline
+        # NOTE: The queues are created here, as they are bound to the event
+        #       loop they are first used with on older Python versions
+        queues = [asyncio.Queue(pipeline.queue_size[stage])
+                  for stage in STAGES]
+        self._output = asyncio.Queue(pipeline.queue_size[STAGES[-1]])
+        checks = [pipeline._deserialize, pipeline._check_id,
+                  pipeline._check_structure, pipeline._check_fulfillments]
+
+        self._tasks = [asyncio.ensure_future(self._feed(queues[0]))]
+        for index, stage in enumerate(STAGES):
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            self._tasks.append(asyncio.ensure_future(
+                self._run_stage(stage, checks[index], queues[index], outbox)))
+
+    async def _feed(self, queue):
+        try:
+            if hasattr(self.payloads, '__aiter__'):
+                async for raw in self.payloads:
+                    await queue.put((raw, raw, monotonic()))
+            else:
+                for raw in self.payloads:
+                    await queue.put((raw, raw, monotonic()))
+        except Exception as exc:
+            await self._output.put(_Failure(exc))
+            return
+        for _ in range(self.pipeline.concurrency[STAGES[0]]):
+            await queue.put(_Done)
+
+    async def _run_stage(self, stage, check, inbox, outbox):
+        workers = [self._work(stage, check, inbox, outbox)
+                   for _ in range(self.pipeline.concurrency[stage])]
+        workers = [asyncio.ensure_future(worker) for worker in workers]
+        self._tasks.extend(workers)
+        try:
+            await asyncio.gather(*workers)
+        except Exception as exc:
+            await self._output.put(_Failure(exc))
+            return
+
+        if outbox is None:
+            await self._output.put(_Done)
+        else:
+            next_stage = STAGES[STAGES.index(stage) + 1]
+            for _ in range(self.pipeline.concurrency[next_stage]):
+                await outbox.put(_Done)
+
+    async def _work(self, stage, check, inbox, outbox):
+        stats = self.pipeline.stats[stage]
+        rejecting_errors = REJECTING_ERRORS[stage]
+        while True:
+            item = await inbox.get()
+            if item is _Done:
+                return
+            raw, value, queued = item
+            started = monotonic()
+            try:
+                value = await check(value)
+            except rejecting_errors as exc:
+                stats.record(queued, started, monotonic(), rejected=True)
+                await self._output.put(Result(raw, None, stage,
+                                              _reason(exc)))
+                continue
+
+            finished = monotonic()
+            stats.record(queued, started, finished)
+            if outbox is None:
+                await self._output.put(Result(raw, value, None, None))
+            else:
+                await outbox.put((raw, value, finished))
@@ -1,16 +1,40 @@
-from copy import deepcopy
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
 from functools import reduce
+from threading import Lock
 from uuid import uuid4
 
 from cryptoconditions import (Fulfillment as CCFulfillment,
                               ThresholdSha256Fulfillment, Ed25519Fulfillment,
-                              PreimageSha256Fulfillment)
+                              PreimageSha256Fulfillment, TimeoutFulfillment)
 from cryptoconditions.exceptions import ParsingError
 
-from bigchaindb_common.crypto import SigningKey, hash_data
+from bigchaindb_common.cache import LRUCache
+from bigchaindb_common.crypto import (Keyring, VerifyingKey, hash_bytes,
+                                      hash_data)
 from bigchaindb_common.exceptions import (KeypairMismatchException,
                                           InvalidHash, InvalidSignature)
-from bigchaindb_common.util import serialize, gen_timestamp
+from bigchaindb_common.util import (serialize, serialize_bytes, deserialize,
+                                    gen_timestamp)
+
+# NOTE: The exceptions cryptoconditions raises for a malformed Fulfillment.
+_CC_PARSING_ERRORS = (KeyError, TypeError, ValueError, AttributeError,
+                      OverflowError, ParsingError)
+
+
+def _get_slots_state(obj):
+    return {name: getattr(obj, name) for name in obj.__slots__
+            if hasattr(obj, name)}
+
+
+def _set_slots_state(obj, state):
+    # NOTE: The custom `__setattr__`s reset cached values (e.g. `_uri` or
+    #       `_id`) when the attributes they're derived from are assigned.
+    #       The state is restored past them, so that copies and unpickled
+    #       objects keep their caches, independently of the slots' order.
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
 
 
 class Fulfillment(object):
@@ -24,8 +48,17 @@ class Fulfillment(object):
             tx_input (:class:`~bigchaindb_common.transaction. TransactionLink`,
                 optional): A link representing the input of a `TRANSFER`
                 Transaction.
+
+        Note:
+            A Fulfillment created by `from_dict` keeps the URI its
+            `fulfillment` was parsed from. It is reused for serialization and
+            validation instead of encoding `fulfillment` again, until
+            `fulfillment` is reassigned. Hence, `fulfillment` must not be
+            mutated in place after parsing.
     """
 
+    __slots__ = ('fulfillment', 'owners_before', 'tx_input', '_uri')
+
     def __init__(self, fulfillment, owners_before, tx_input=None):
         """Fulfillment shims a Cryptocondition Fulfillment for BigchainDB.
 
@@ -50,9 +83,37 @@ class Fulfillment(object):
         else:
             self.owners_before = owners_before
 
+    def __setattr__(self, name, value):
+        if name == 'fulfillment':
+            super().__setattr__('_uri', None)
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        return _get_slots_state(self)
+
+    def __setstate__(self, state):
+        _set_slots_state(self, state)
+
     def __eq__(self, other):
-        # TODO: If `other !== Fulfillment` return `False`
-        return self.to_dict() == other.to_dict()
+        # NOTE: Fulfillments are compared by their URIs, which is cheap for
+        #       Fulfillments that were parsed from one.
+        if not isinstance(other, Fulfillment):
+            return False
+        return self._to_key() == other._to_key()
+
+    def _to_key(self):
+        try:
+            fulfillment = self.serialize_uri()
+        except (TypeError, AttributeError):
+            # NOTE: See comment about this special case in
+            #       `Fulfillment.to_dict`
+            fulfillment = self.fulfillment.to_dict()
+
+        try:
+            tx_input = self.tx_input.to_dict()
+        except AttributeError:
+            tx_input = None
+        return fulfillment, self.owners_before, tx_input
 
     def to_dict(self, fid=None):
         """Transforms the object to a Python dictionary.
@@ -71,7 +132,7 @@ class Fulfillment(object):
                 dict: The Fulfillment as an alternative serialization format.
         """
         try:
-            fulfillment = self.fulfillment.serialize_uri()
+            fulfillment = self.serialize_uri()
         except (TypeError, AttributeError):
             # NOTE: When a non-signed transaction is casted to a dict,
             #       `self.fulfillments` value is lost, as in the node's
@@ -98,6 +159,20 @@ class Fulfillment(object):
             ffill['fid'] = fid
         return ffill
 
+    def serialize_uri(self):
+        """Returns the URI of the Fulfillment's `fulfillment`.
+
+            Note:
+                If the Fulfillment was parsed from a URI, that URI is returned
+                without encoding `fulfillment` again.
+
+            Returns:
+                str: The Fulfillment's URI.
+        """
+        if self._uri is None:
+            return self.fulfillment.serialize_uri()
+        return self._uri
+
     @classmethod
     def from_dict(cls, ffill):
         """Transforms a Python dictionary to a Fulfillment object.
@@ -113,19 +188,23 @@ class Fulfillment(object):
                 :class:`~bigchaindb_common.transaction.Fulfillment`
 
             Raises:
-                InvalidSignature: If a Fulfillment's URI couldn't be parsed.
+                InvalidSignature: If a Fulfillment's URI or details couldn't
+                    be parsed.
         """
         try:
             fulfillment = CCFulfillment.from_uri(ffill['fulfillment'])
-        except ValueError:
-            # TODO FOR CC: Throw an `InvalidSignature` error in this case.
-            raise InvalidSignature("Fulfillment URI couldn't been parsed")
         except TypeError:
             # NOTE: See comment about this special case in
             #       `Fulfillment.to_dict`
-            fulfillment = CCFulfillment.from_dict(ffill['fulfillment'])
+            fulfillment = _parse_fulfillment_details(ffill['fulfillment'])
+        except _CC_PARSING_ERRORS:
+            # TODO FOR CC: Throw an `InvalidSignature` error in this case.
+            raise InvalidSignature("Fulfillment URI couldn't been parsed")
         input_ = TransactionLink.from_dict(ffill['input'])
-        return cls(fulfillment, ffill['owners_before'], input_)
+        fulfillment_tx = cls(fulfillment, ffill['owners_before'], input_)
+        if isinstance(ffill['fulfillment'], str):
+            fulfillment_tx._uri = ffill['fulfillment']
+        return fulfillment_tx
 
 
 class TransactionLink(object):
@@ -137,6 +216,8 @@ class TransactionLink(object):
             `txid`.
     """
 
+    __slots__ = ('txid', 'cid')
+
     def __init__(self, txid=None, cid=None):
         """Used to point to a specific Condition of a Transaction.
 
@@ -159,8 +240,12 @@ class TransactionLink(object):
         return self.txid is not None and self.cid is not None
 
     def __eq__(self, other):
-        # TODO: If `other !== TransactionLink` return `False`
-        return self.to_dict() == self.to_dict()
+        if not isinstance(other, TransactionLink):
+            return False
+        return self.txid == other.txid and self.cid == other.cid
+
+    def __hash__(self):
+        return hash((self.txid, self.cid))
 
     @classmethod
     def from_dict(cls, link):
@@ -200,8 +285,21 @@ class Condition(object):
                 to extract a Condition from.
             owners_after (:obj:`list` of :obj:`str`, optional): A list of
                 owners before a Transaction was confirmed.
+
+        Note:
+            A Condition created by `generate` from a cached template keeps the
+            template's URI, until `fulfillment` is reassigned. Hence,
+            `fulfillment` must not be mutated in place afterwards.
     """
 
+    __slots__ = ('fulfillment', 'amount', 'owners_after', '_uri')
+    # NOTE: Bounded caches of the decoded VerifyingKey and condition URI of
+    #       public keys (`KEY_CACHE`) and of the Condition generated for an
+    #       `owners_after` structure (`TEMPLATE_CACHE`), used by `generate`
+    #       and `Transaction.create`. Set them to `None` to disable caching.
+    KEY_CACHE = LRUCache(4096)
+    TEMPLATE_CACHE = LRUCache(1024)
+
     def __init__(self, fulfillment, owners_after=None, amount=1):
         """Condition shims a Cryptocondition condition for BigchainDB.
 
@@ -225,9 +323,37 @@ class Condition(object):
         else:
             self.owners_after = owners_after
 
+    def __setattr__(self, name, value):
+        if name == 'fulfillment':
+            super().__setattr__('_uri', None)
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        return _get_slots_state(self)
+
+    def __setstate__(self, state):
+        _set_slots_state(self, state)
+
     def __eq__(self, other):
-        # TODO: If `other !== Condition` return `False`
-        return self.to_dict() == other.to_dict()
+        if not isinstance(other, Condition):
+            return False
+        return (self.condition_uri == other.condition_uri and
+                self.owners_after == other.owners_after and
+                self.amount == other.amount)
+
+    def __hash__(self):
+        return hash((self.condition_uri, self.amount))
+
+    @property
+    def condition_uri(self):
+        """str: The URI of the Condition."""
+        if self._uri is not None:
+            return self._uri
+        try:
+            return self.fulfillment.condition_uri
+        except AttributeError:
+            # NOTE: Hashlock condition case
+            return self.fulfillment
 
     def to_dict(self, cid=None):
         """Transforms the object to a Python dictionary.
@@ -253,10 +379,7 @@ class Condition(object):
         except AttributeError:
             pass
 
-        try:
-            condition['uri'] = self.fulfillment.condition_uri
-        except AttributeError:
-            condition['uri'] = self.fulfillment
+        condition['uri'] = self.condition_uri
 
         cond = {
             'owners_after': self.owners_after,
@@ -298,6 +421,27 @@ class Condition(object):
                 TypeError: If `owners_after` is not an instance of `list`.
                 TypeError: If `owners_after` is an empty list.
         """
+        cache = cls.TEMPLATE_CACHE
+        key = _owners_key(owners_after) if cache is not None else None
+        if key is not None:
+            template = cache.get(key)
+            if template is not None:
+                ffill, uri = template
+                if isinstance(owners_after, tuple):
+                    owners_after = owners_after[0]
+                condition = cls(_copy_fulfillment(ffill), owners_after)
+                condition._uri = uri
+                return condition
+
+        condition = cls._generate(owners_after)
+        if key is not None:
+            cache.put(key, (_copy_fulfillment(condition.fulfillment),
+                            condition.condition_uri))
+        return condition
+
+    @classmethod
+    def _generate(cls, owners_after):
+        """Generates a Condition without looking up a cached template."""
         # TODO: We probably want to remove the tuple logic for weights here
         #       again: https://github.com/bigchaindb/bigchaindb-common/issues/
         #       12#issuecomment-251665325
@@ -313,10 +457,12 @@ class Condition(object):
                              'owner')
         elif len(owners_after) == 1 and not isinstance(owners_after[0], list):
             try:
-                ffill = Ed25519Fulfillment(public_key=owners_after[0])
+                ffill, uri = _gen_ed25519_fulfillment(owners_after[0])
             except TypeError:
-                ffill = owners_after[0]
-            return cls(ffill, owners_after)
+                return cls(owners_after[0], owners_after)
+            condition = cls(ffill, owners_after)
+            condition._uri = uri
+            return condition
         else:
             initial_cond = ThresholdSha256Fulfillment(threshold=threshold)
             threshold_cond = reduce(cls._gen_condition, owners_after,
@@ -361,7 +507,7 @@ class Condition(object):
             except AttributeError:
                 pass
             try:
-                ffill = Ed25519Fulfillment(public_key=owners_after)
+                ffill, _ = _gen_ed25519_fulfillment(owners_after)
             except TypeError:
                 # NOTE: Instead of submitting base58 encoded addresses, a user
                 #       of this class can also submit fully instantiated
@@ -388,12 +534,17 @@ class Condition(object):
 
             Returns:
                 :class:`~bigchaindb_common.transaction.Condition`
+
+            Raises:
+                InvalidSignature: If the Condition's details couldn't be
+                    parsed.
         """
-        try:
-            fulfillment = CCFulfillment.from_dict(cond['condition']['details'])
-        except KeyError:
+        condition = cond['condition']
+        if 'details' in condition:
+            fulfillment = _parse_fulfillment_details(condition['details'])
+        else:
             # NOTE: Hashlock condition case
-            fulfillment = cond['condition']['uri']
+            fulfillment = condition['uri']
         return cls(fulfillment, cond['owners_after'], cond['amount'])
 
 
@@ -414,6 +565,8 @@ class Asset(object):
             refillable (bool): A flag indicating if an Asset can be refilled.
     """
 
+    __slots__ = ('data', 'data_id', 'divisible', 'updatable', 'refillable')
+
     def __init__(self, data=None, data_id=None, divisible=False,
                  updatable=False, refillable=False):
         """An Asset is not required to contain any extra data from outside."""
@@ -481,6 +634,8 @@ class Asset(object):
 class Metadata(object):
     """Metadata is used to store a dictionary and its hash in a Transaction."""
 
+    __slots__ = ('data_id', 'data')
+
     def __init__(self, data=None, data_id=None):
         """Metadata stores a payload `data` as well as data's hash, `data_id`.
 
@@ -567,6 +722,23 @@ class Transaction(object):
     GENESIS = 'GENESIS'
     ALLOWED_OPERATIONS = (CREATE, TRANSFER, GENESIS)
     VERSION = 1
+    # NOTE: Attributes that are part of a Transaction's hashed body.
+    #       Assigning to any of them invalidates the cached id.
+    HASHED_ATTRIBUTES = ('version', 'timestamp', 'operation', 'asset',
+                         'fulfillments', 'conditions', 'metadata')
+    __slots__ = HASHED_ATTRIBUTES + ('_id',)
+    # NOTE: An optional `bigchaindb_common.cache.LRUCache` remembering
+    #       Fulfillments that were successfully validated. Set it to enable
+    #       caching, e.g. `Transaction.VERIFICATION_CACHE = LRUCache(10000)`.
+    VERIFICATION_CACHE = None
+    # NOTE: `_fulfillment_valid` runs these stages in order, stopping at the
+    #       first one rejecting a Fulfillment. `REJECTIONS` counts the
+    #       rejected Fulfillments per stage (in the current process only).
+    #       Fulfillments may be validated on many threads at once, hence it
+    #       is only updated while holding `_REJECTIONS_LOCK`.
+    VALIDATION_STAGES = ('structure', 'condition', 'owners', 'signature')
+    REJECTIONS = Counter(dict.fromkeys(VALIDATION_STAGES, 0))
+    _REJECTIONS_LOCK = Lock()
 
     def __init__(self, operation, asset, fulfillments=None, conditions=None,
                  metadata=None, timestamp=None, version=None):
@@ -681,7 +853,7 @@ class Transaction(object):
             # NOTE: Standard case, one owner before, one after.
             # NOTE: For this case its sufficient to use the same
             #       fulfillment for the fulfillment and condition.
-            ffill = Ed25519Fulfillment(public_key=owners_before[0])
+            ffill, _ = _gen_ed25519_fulfillment(owners_before[0])
             ffill_tx = Fulfillment(ffill, owners_before)
             cond_tx = Condition.generate(owners_after)
             return cls(cls.CREATE, asset, [ffill_tx], [cond_tx], metadata)
@@ -699,7 +871,7 @@ class Transaction(object):
         elif len(owners_before) == 1 and len(owners_after) > 1:
             # NOTE: Multiple owners case
             cond_tx = Condition.generate(owners_after)
-            ffill = Ed25519Fulfillment(public_key=owners_before[0])
+            ffill, _ = _gen_ed25519_fulfillment(owners_before[0])
             ffill_tx = Fulfillment(ffill, owners_before)
             return cls(cls.CREATE, asset, [ffill_tx], [cond_tx], metadata)
 
@@ -708,7 +880,7 @@ class Transaction(object):
             # NOTE: Hashlock condition case
             hashlock = PreimageSha256Fulfillment(preimage=secret)
             cond_tx = Condition(hashlock.condition_uri)
-            ffill = Ed25519Fulfillment(public_key=owners_before[0])
+            ffill, _ = _gen_ed25519_fulfillment(owners_before[0])
             ffill_tx = Fulfillment(ffill, owners_before)
             return cls(cls.CREATE, asset, [ffill_tx], [cond_tx], metadata)
 
@@ -782,15 +954,127 @@ class Transaction(object):
                              "same")
 
         metadata = Metadata(metadata)
-        inputs = deepcopy(inputs)
+        # NOTE: The Fulfillments are copied, so that the Transaction and the
+        #       caller can reassign their attributes independently. Signing
+        #       replaces them with signed copies, so their cryptoconditions
+        #       are shared until then.
+        inputs = [copy(fulfillment) for fulfillment in inputs]
         return cls(cls.TRANSFER, asset, inputs, conditions, metadata)
 
+    @classmethod
+    def create_many(cls, specs):
+        """Generates many `CREATE` Transactions at once.
+
+            Note:
+                All Transactions share one timestamp. Public keys are decoded
+                and Conditions are generated only once per distinct key or
+                owner structure, as long as `Condition.KEY_CACHE` and
+                `Condition.TEMPLATE_CACHE` are enabled.
+
+            Args:
+                specs (:obj:`list` of tuple): For every Transaction, its
+                    `owners_before`, `owners_after` and optionally its
+                    `metadata` and `asset`, as passed to `create`.
+
+            Returns:
+                :obj:`list` of :class:`~bigchaindb_common.transaction.
+                    Transaction`: The Transactions, in the order of `specs`.
+        """
+        timestamp = gen_timestamp()
+        transactions = []
+        for spec in specs:
+            tx = cls.create(*spec)
+            tx.timestamp = timestamp
+            transactions.append(tx)
+        return transactions
+
+    @classmethod
+    def sign_many(cls, transactions, private_keys, workers=None,
+                  executor=None, chunksize=16):
+        """Signs many Transactions with the same private keys.
+
+            Note:
+                The private keys are decoded only once for all
+                `transactions`.
+                If `workers` or `executor` is given, signing is spread over a
+                process pool. Its workers are only sent the unsigned
+                Fulfillments and the parts of the messages to sign, not the
+                Transactions. The parts all messages of a Transaction share,
+                e.g. its asset and metadata, are sent once. The private keys
+                are sent and decoded once per chunk of `chunksize`
+                Transactions, and aren't kept in the workers afterwards. The
+                workers return the signed Fulfillments' URIs, which are put
+                back into the original Transactions.
+
+            Args:
+                transactions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Transaction`): The Transactions to sign.
+                private_keys (:obj:`list` of :obj:`str`|:class:`~.crypto.
+                    Keyring`): All private keys needed to sign all
+                    Fulfillments of all `transactions`.
+                workers (int, optional): The number of worker processes.
+                executor (:class:`concurrent.futures.Executor`, optional): An
+                    executor to use instead of starting a new process pool.
+                chunksize (int): The number of Transactions sent to a worker
+                    at once.
+
+            Returns:
+                :obj:`list` of :class:`~bigchaindb_common.transaction.
+                    Transaction`: `transactions`, signed.
+
+            Raises:
+                KeypairMismatchException: If a Fulfillment can't be signed
+                    with `private_keys`.
+        """
+        if isinstance(private_keys, Keyring):
+            keyring = private_keys
+        else:
+            keyring = Keyring(private_keys)
+
+        if workers is None and executor is None:
+            return [tx.sign(keyring) for tx in transactions]
+
+        # NOTE: The private keys are sent once per chunk, not with every
+        #       Transaction
+        private_keys = tuple(keyring.private_keys)
+        payloads = [_to_signing_payload(tx) for tx in transactions]
+        chunks = [(private_keys, payloads[start:start + chunksize])
+                  for start in range(0, len(payloads), chunksize)]
+        if executor is not None:
+            results = list(executor.map(_sign_chunk, chunks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_sign_chunk, chunks))
+
+        fulfillment_uris = (uris for chunk in results for uris in chunk)
+        for tx, uris in zip(transactions, fulfillment_uris):
+            _apply_signed_uris(tx, uris)
+        return transactions
+
+    def __setattr__(self, name, value):
+        if name in self.__class__.HASHED_ATTRIBUTES:
+            super().__setattr__('_id', None)
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        return _get_slots_state(self)
+
+    def __setstate__(self, state):
+        _set_slots_state(self, state)
+
     def __eq__(self, other):
+        # NOTE: As the id covers everything but the signatures, comparing it
+        #       and the Fulfillments is sufficient. The ids are computed
+        #       again, as the cached ones don't reflect changes to nested
+        #       objects.
         try:
-            other = other.to_dict()
+            return (self.to_dict()['id'] == other.to_dict()['id'] and
+                    self.fulfillments == other.fulfillments)
         except AttributeError:
             return False
-        return self.to_dict() == other
+
+    def __hash__(self):
+        return hash(self.id)
 
     def to_inputs(self, condition_indices=None):
         """Converts a Transaction's Conditions to spendable Fulfillments.
@@ -838,6 +1122,7 @@ class Transaction(object):
         if not isinstance(fulfillment, Fulfillment):
             raise TypeError('`fulfillment` must be a Fulfillment instance')
         self.fulfillments.append(fulfillment)
+        self._id = None
 
     def add_condition(self, condition):
         """Adds a Condition to a Transaction's list of Conditions.
@@ -850,6 +1135,7 @@ class Transaction(object):
         if not isinstance(condition, Condition):
             raise TypeError('`condition` must be a Condition instance or None')
         self.conditions.append(condition)
+        self._id = None
 
     def sign(self, private_keys):
         """Fulfills a previous Transaction's Condition by signing Fulfillments.
@@ -864,53 +1150,86 @@ class Transaction(object):
                 will cause this method to fail.
 
             Args:
-                private_keys (:obj:`list` of :obj:`str`): A complete list of
-                    all private keys needed to sign all Fulfillments of this
-                    Transaction.
+                private_keys (:obj:`list` of :obj:`str`|:class:`~.crypto.
+                    Keyring`): A complete list of all private keys needed to
+                    sign all Fulfillments of this Transaction.
 
             Returns:
                 :class:`~bigchaindb_common.transaction.Transaction`
         """
         # TODO: Singing should be possible with at least one of all private
         #       keys supplied to this method.
-        if private_keys is None or not isinstance(private_keys, list):
-            raise TypeError('`private_keys` must be a list instance')
-
-        # NOTE: Generate public keys from private keys and match them in a
-        #       dictionary:
-        #                   key:     public_key
-        #                   value:   private_key
-        def gen_public_key(private_key):
-            # TODO FOR CC: Adjust interface so that this function becomes
-            #              unnecessary
-
-            # cc now provides a single method `encode` to return the key
-            # in several different encodings.
-            public_key = private_key.get_verifying_key().encode()
-            # Returned values from cc are always bytestrings so here we need
-            # to decode to convert the bytestring into a python str
-            return public_key.decode()
-
-        key_pairs = {gen_public_key(SigningKey(private_key)):
-                     SigningKey(private_key) for private_key in private_keys}
-
-        zippedIO = enumerate(zip(self.fulfillments, self.conditions))
-        for index, (fulfillment, condition) in zippedIO:
-            # NOTE: We clone the current transaction but only add the condition
-            #       and fulfillment we're currently working on plus all
-            #       previously signed ones.
-            tx_partial = Transaction(self.operation, self.asset, [fulfillment],
-                                     [condition], self.metadata,
-                                     self.timestamp, self.version)
-
-            tx_partial_dict = tx_partial.to_dict()
-            tx_partial_dict = Transaction._remove_signatures(tx_partial_dict)
-            tx_serialized = Transaction._to_str(tx_partial_dict)
-            self._sign_fulfillment(fulfillment, index, tx_serialized,
-                                   key_pairs)
+        if isinstance(private_keys, Keyring):
+            key_pairs = private_keys
+        elif private_keys is None or not isinstance(private_keys, list):
+            raise TypeError('`private_keys` must be a list instance or a '
+                            'Keyring')
+        else:
+            # NOTE: Generate public keys from private keys and match them in
+            #       a dictionary-like Keyring:
+            #                   key:     public_key
+            #                   value:   private_key
+            key_pairs = Keyring(private_keys)
+
+        # NOTE: All messages are built before signing, as signing replaces
+        #       the Fulfillments in `self.fulfillments`.
+        messages = list(self._gen_partial_messages())
+        zippedIO = enumerate(zip(self.fulfillments, messages))
+        for index, (fulfillment, tx_serialized) in zippedIO:
+            self.fulfillments[index] = self._sign_fulfillment(fulfillment,
+                                                              tx_serialized,
+                                                              key_pairs)
         return self
 
-    def _sign_fulfillment(self, fulfillment, index, tx_serialized, key_pairs):
+    def _gen_partial_messages(self):
+        """Generates the message to sign for every Fulfillment/Condition pair.
+
+            Note:
+                Every Fulfillment signs a partial Transaction that contains
+                only itself and the Condition with the same index, serialized
+                without signatures and including the partial Transaction's id.
+                The parts all partial Transactions share (asset, metadata,
+                operation, timestamp and version) are serialized only once and
+                each Fulfillment/Condition pair is spliced in between. The
+                result is identical to serializing every partial Transaction
+                in full, since `serialize` sorts keys and emits no whitespace.
+                All parts are encoded once and spliced as bytes, so that the
+                messages can be signed and verified without encoding them
+                again.
+
+            Returns:
+                generator of bytes: The serialized partial Transactions, in
+                    the order of `self.fulfillments`.
+        """
+        return _splice_partial_messages(*self._partial_message_parts())
+
+    def _partial_message_parts(self):
+        """Serializes the parts `_gen_partial_messages` splices together.
+
+            Returns:
+                tuple: The head and the tail all partial Transactions share,
+                    and a generator of the serialized Condition and
+                    Fulfillment of every pair.
+        """
+        version = serialize_bytes(self.version)
+        head = b''.join((b'{"asset":', serialize_bytes(self._asset_to_dict()),
+                         b',"conditions":['))
+        tail = b''.join((b'],"metadata":',
+                         serialize_bytes(self._metadata_to_dict()),
+                         b',"operation":',
+                         serialize_bytes(str(self.operation)),
+                         b',"timestamp":', serialize_bytes(self.timestamp),
+                         b'},"version":', version, b'}'))
+        return head, tail, self._gen_partial_pairs()
+
+    def _gen_partial_pairs(self):
+        for fulfillment, condition in zip(self.fulfillments, self.conditions):
+            ffill = fulfillment.to_dict(0)
+            ffill['fulfillment'] = None
+            yield serialize_bytes(condition.to_dict(0)), serialize_bytes(ffill)
+
+    @staticmethod
+    def _sign_fulfillment(fulfillment, tx_serialized, key_pairs):
         """Signs a single Fulfillment with a partial Transaction as message.
 
             Note:
@@ -922,64 +1241,74 @@ class Transaction(object):
             Args:
                 fulfillment (:class:`~bigchaindb_common.transaction.
                     Fulfillment`) The Fulfillment to be signed.
-                index (int): The index (or `fid`) of the Fulfillment to be
-                    signed.
-                tx_serialized (str): The Transaction to be used as message.
-                key_pairs (dict): The keys to sign the Transaction with.
+                tx_serialized (bytes): The Transaction to be used as message.
+                key_pairs (:class:`~bigchaindb_common.crypto.Keyring`): The
+                    keys to sign the Transaction with.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Fulfillment`: A signed
+                    copy of `fulfillment`.
         """
         if isinstance(fulfillment.fulfillment, Ed25519Fulfillment):
-            self._sign_simple_signature_fulfillment(fulfillment, index,
-                                                    tx_serialized, key_pairs)
+            return Transaction._sign_simple_signature_fulfillment(
+                fulfillment, tx_serialized, key_pairs)
         elif isinstance(fulfillment.fulfillment, ThresholdSha256Fulfillment):
-            self._sign_threshold_signature_fulfillment(fulfillment, index,
-                                                       tx_serialized,
-                                                       key_pairs)
+            return Transaction._sign_threshold_signature_fulfillment(
+                fulfillment, tx_serialized, key_pairs)
         else:
             raise ValueError("Fulfillment couldn't be matched to "
                              'Cryptocondition fulfillment type.')
 
-    def _sign_simple_signature_fulfillment(self, fulfillment, index,
-                                           tx_serialized, key_pairs):
+    @staticmethod
+    def _sign_simple_signature_fulfillment(fulfillment, tx_serialized,
+                                           key_pairs):
         """Signs a Ed25519Fulfillment.
 
             Args:
                 fulfillment (:class:`~bigchaindb_common.transaction.
                     Fulfillment`) The Fulfillment to be signed.
-                index (int): The index (or `fid`) of the Fulfillment to be
-                    signed.
-                tx_serialized (str): The Transaction to be used as message.
-                key_pairs (dict): The keys to sign the Transaction with.
+                tx_serialized (bytes): The Transaction to be used as message.
+                key_pairs (:class:`~bigchaindb_common.crypto.Keyring`): The
+                    keys to sign the Transaction with.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Fulfillment`: A signed
+                    copy of `fulfillment`.
         """
         # NOTE: To eliminate the dangers of accidentally signing a condition by
-        #       reference, we remove the reference of fulfillment here
+        #       reference, we sign a copy of the fulfillment here
         #       intentionally. If the user of this class knows how to use it,
         #       this should never happen, but then again, never say never.
-        fulfillment = deepcopy(fulfillment)
+        fulfillment = Transaction._copy_for_signing(fulfillment)
         owner_before = fulfillment.owners_before[0]
         try:
             # cryptoconditions makes no assumptions of the encoding of the
             # message to sign or verify. It only accepts bytestrings
-            fulfillment.fulfillment.sign(tx_serialized.encode(),
+            fulfillment.fulfillment.sign(tx_serialized,
                                          key_pairs[owner_before])
         except KeyError:
             raise KeypairMismatchException('Public key {} is not a pair to '
                                            'any of the private keys'
                                            .format(owner_before))
-        self.fulfillments[index] = fulfillment
+        return fulfillment
 
-    def _sign_threshold_signature_fulfillment(self, fulfillment, index,
-                                              tx_serialized, key_pairs):
+    @staticmethod
+    def _sign_threshold_signature_fulfillment(fulfillment, tx_serialized,
+                                              key_pairs):
         """Signs a ThresholdSha256Fulfillment.
 
             Args:
                 fulfillment (:class:`~bigchaindb_common.transaction.
                     Fulfillment`) The Fulfillment to be signed.
-                index (int): The index (or `fid`) of the Fulfillment to be
-                    signed.
-                tx_serialized (str): The Transaction to be used as message.
-                key_pairs (dict): The keys to sign the Transaction with.
+                tx_serialized (bytes): The Transaction to be used as message.
+                key_pairs (:class:`~bigchaindb_common.crypto.Keyring`): The
+                    keys to sign the Transaction with.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Fulfillment`: A signed
+                    copy of `fulfillment`.
         """
-        fulfillment = deepcopy(fulfillment)
+        fulfillment = Transaction._copy_for_signing(fulfillment)
         for owner_before in fulfillment.owners_before:
             try:
                 # TODO: CC should throw a KeypairMismatchException, instead of
@@ -1006,8 +1335,28 @@ class Transaction(object):
 
             # cryptoconditions makes no assumptions of the encoding of the
             # message to sign or verify. It only accepts bytestrings
-            subffill.sign(tx_serialized.encode(), private_key)
-        self.fulfillments[index] = fulfillment
+            subffill.sign(tx_serialized, private_key)
+        return fulfillment
+
+    @staticmethod
+    def _copy_for_signing(fulfillment):
+        """Copies a Fulfillment, so that signing it doesn't mutate the
+        original.
+
+            Note:
+                Only the parts of the cryptoconditions Fulfillment that
+                signing mutates are copied (see `_copy_fulfillment`).
+
+            Args:
+                fulfillment (:class:`~bigchaindb_common.transaction.
+                    Fulfillment`) The Fulfillment to be signed.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Fulfillment`: A
+                    Fulfillment without a cached URI.
+        """
+        return Fulfillment(_copy_fulfillment(fulfillment.fulfillment),
+                           fulfillment.owners_before, fulfillment.tx_input)
 
     def fulfillments_valid(self, input_conditions=None):
         """Validates the Fulfillments in the Transaction against given
@@ -1026,16 +1375,28 @@ class Transaction(object):
             Returns:
                 bool: If all Fulfillments are valid.
         """
+        return self._fulfillments_valid(
+            self._input_condition_uris(input_conditions))
+
+    def _input_condition_uris(self, input_conditions=None):
+        """Maps the Conditions a Transaction spends to their URIs.
+
+            Args:
+                input_conditions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Condition`): A list of Conditions to check the
+                    Fulfillments against.
+
+            Returns:
+                :obj:`list` of :obj:`str`
+        """
         if self.operation in (Transaction.CREATE, Transaction.GENESIS):
             # NOTE: Since in the case of a `CREATE`-transaction we do not have
             #       to check for input_conditions, we're just submitting dummy
             #       values to the actual method. This simplifies it's logic
             #       greatly, as we do not have to check against `None` values.
-            return self._fulfillments_valid(['dummyvalue'
-                                             for cond in self.fulfillments])
+            return ['dummyvalue' for cond in self.fulfillments]
         elif self.operation == Transaction.TRANSFER:
-            return self._fulfillments_valid([cond.fulfillment.condition_uri
-                                             for cond in input_conditions])
+            return [cond.condition_uri for cond in input_conditions]
         else:
             allowed_ops = ', '.join(self.__class__.ALLOWED_OPERATIONS)
             raise TypeError('`operation` must be one of {}'
@@ -1059,17 +1420,10 @@ class Transaction(object):
         fulfillments_count = len(self.fulfillments)
         conditions_count = len(self.conditions)
 
-        def gen_tx(fulfillment, condition, input_condition_uri=None):
-            """Splits multiple IO Transactions into partial single IO
-            Transactions.
+        def gen_tx(fulfillment, tx_serialized, input_condition_uri=None):
+            """Validates a Fulfillment against its partial single IO
+            Transaction.
             """
-            tx = Transaction(self.operation, self.asset, [fulfillment],
-                             [condition], self.metadata, self.timestamp,
-                             self.version)
-            tx_dict = tx.to_dict()
-            tx_dict = Transaction._remove_signatures(tx_dict)
-            tx_serialized = Transaction._to_str(tx_dict)
-
             # TODO: Use local reference to class, not `Transaction.`
             return Transaction._fulfillment_valid(fulfillment, self.operation,
                                                   tx_serialized,
@@ -1081,7 +1435,8 @@ class Transaction(object):
                              'input_condition_uris must have the same count')
         else:
             partial_transactions = map(gen_tx, self.fulfillments,
-                                       self.conditions, input_condition_uris)
+                                       self._gen_partial_messages(),
+                                       input_condition_uris)
             return all(partial_transactions)
 
     @staticmethod
@@ -1097,7 +1452,7 @@ class Transaction(object):
                 fulfillment (:class:`~bigchaindb_common.transaction.
                     Fulfillment`) The Fulfillment to be signed.
                 operation (str): The type of Transaction.
-                tx_serialized (str): The Transaction used as a message when
+                tx_serialized (bytes): The Transaction used as a message when
                     initially signing it.
                 input_condition_uri (str, optional): A Condition to check the
                     Fulfillment against.
@@ -1105,45 +1460,141 @@ class Transaction(object):
             Returns:
                 bool: If the Fulfillment is valid.
         """
-        ccffill = fulfillment.fulfillment
         try:
-            parsed_ffill = CCFulfillment.from_uri(ccffill.serialize_uri())
+            fulfillment_uri = fulfillment.serialize_uri()
         except (TypeError, ValueError, ParsingError):
+            return Transaction._reject('structure')
+
+        cache = Transaction.VERIFICATION_CACHE
+        if cache is not None:
+            cache_key = (input_condition_uri, hash_bytes(tx_serialized),
+                         fulfillment_uri)
+            if cache.get(cache_key, False):
+                return True
+
+        parsed_ffill = Transaction._precheck_fulfillment(fulfillment,
+                                                         operation,
+                                                         input_condition_uri,
+                                                         fulfillment_uri)
+        if parsed_ffill is None:
             return False
 
-        if operation in (Transaction.CREATE, Transaction.GENESIS):
-            # NOTE: In the case of a `CREATE` or `GENESIS` transaction, the
-            #       input condition is always validate to `True`.
-            input_cond_valid = True
-        else:
-            input_cond_valid = input_condition_uri == ccffill.condition_uri
-
         # NOTE: We pass a timestamp to `.validate`, as in case of a timeout
         #       condition we'll have to validate against it
 
         # cryptoconditions makes no assumptions of the encoding of the
         # message to sign or verify. It only accepts bytestrings
-        return parsed_ffill.validate(message=tx_serialized.encode(),
-                                     now=gen_timestamp()) and input_cond_valid
+        if not parsed_ffill.validate(message=tx_serialized,
+                                     now=gen_timestamp()):
+            return Transaction._reject('signature')
 
-    def to_dict(self):
-        """Transforms the object to a Python dictionary.
+        # NOTE: Only positive results are cached. Results of Fulfillments
+        #       that depend on the current time must not be cached at all.
+        if cache is not None and not _is_time_dependent(parsed_ffill):
+            cache.put(cache_key, True)
+        return True
+
+    @staticmethod
+    def _precheck_fulfillment(fulfillment, operation, input_condition_uri,
+                              fulfillment_uri=None):
+        """Runs all validation stages of a Fulfillment that come before
+        verifying its signatures.
+
+            Note:
+                The stages are run from the cheapest to the most expensive
+                one and stop at the first one rejecting the Fulfillment:
+
+                - `structure`: The Fulfillment can be parsed from its URI and
+                  Ed25519 signatures have the right length.
+                - `condition`: The Fulfillment matches the Condition it
+                  spends.
+                - `owners`: All public keys of the Fulfillment are in its
+                  `owners_before`.
+
+            Args:
+                fulfillment (:class:`~bigchaindb_common.transaction.
+                    Fulfillment`) The Fulfillment to be checked.
+                operation (str): The type of Transaction.
+                input_condition_uri (str, optional): A Condition to check the
+                    Fulfillment against.
+                fulfillment_uri (str, optional): The URI of the Fulfillment.
+                    If given and the Fulfillment wasn't parsed from it, it is
+                    parsed to make sure it is well-formed.
 
             Returns:
-                dict: The Transaction as an alternative serialization format.
+                :class:`cryptoconditions.Fulfillment`: The parsed Fulfillment
+                    or `None`, if it was rejected.
         """
-        try:
-            metadata = self.metadata.to_dict()
-        except AttributeError:
-            # NOTE: metadata can be None and that's OK
-            metadata = None
+        ccffill = fulfillment.fulfillment
+        if fulfillment_uri is None or fulfillment._uri is not None:
+            parsed_ffill = ccffill
+        else:
+            try:
+                parsed_ffill = CCFulfillment.from_uri(fulfillment_uri)
+            except (TypeError, ValueError, ParsingError):
+                return Transaction._reject('structure', None)
+        if isinstance(parsed_ffill, Ed25519Fulfillment) and \
+           len(parsed_ffill.signature or b'') != \
+           Ed25519Fulfillment.SIGNATURE_LENGTH:
+            return Transaction._reject('structure', None)
+
+        if not Transaction._input_condition_valid(ccffill, operation,
+                                                  input_condition_uri):
+            return Transaction._reject('condition', None)
+
+        owners_before = set(_gen_owners(fulfillment.owners_before))
+        if not all(public_key in owners_before for public_key
+                   in _gen_public_keys(parsed_ffill)):
+            return Transaction._reject('owners', None)
+        return parsed_ffill
 
-        if self.operation in (self.__class__.GENESIS, self.__class__.CREATE):
-            asset = self.asset.to_dict()
+    @staticmethod
+    def _reject(stage, result=False):
+        """Counts a Fulfillment rejected by a validation stage.
+
+            Args:
+                stage (str): One of `VALIDATION_STAGES`.
+                result (optional): The value to return.
+
+            Returns:
+                `result`
+        """
+        with Transaction._REJECTIONS_LOCK:
+            Transaction.REJECTIONS[stage] += 1
+        return result
+
+    @staticmethod
+    def _input_condition_valid(ccffill, operation, input_condition_uri=None):
+        """Checks if a Fulfillment matches the Condition it spends.
+
+            Args:
+                ccffill (:class:`cryptoconditions.Fulfillment`): The
+                    Fulfillment to be checked.
+                operation (str): The type of Transaction.
+                input_condition_uri (str, optional): The URI of the Condition
+                    to check the Fulfillment against.
+
+            Returns:
+                bool: If the Fulfillment matches the Condition.
+        """
+        if operation in (Transaction.CREATE, Transaction.GENESIS):
+            # NOTE: In the case of a `CREATE` or `GENESIS` transaction, the
+            #       input condition is always validate to `True`.
+            return True
         else:
-            # NOTE: An `asset` in a `TRANSFER` only contains the asset's id
-            asset = {'id': self.asset.data_id}
+            return input_condition_uri == ccffill.condition_uri
+
+    def to_dict(self):
+        """Transforms the object to a Python dictionary.
+
+            Note:
+                The id is always computed again and replaces the cached one,
+                so that the dictionary reflects changes to nested objects,
+                e.g. `tx.metadata.data`, too.
 
+            Returns:
+                dict: The Transaction as an alternative serialization format.
+        """
         tx_body = {
             'fulfillments': [fulfillment.to_dict(fid) for fid, fulfillment
                              in enumerate(self.fulfillments)],
@@ -1151,8 +1602,8 @@ class Transaction(object):
                            in enumerate(self.conditions)],
             'operation': str(self.operation),
             'timestamp': self.timestamp,
-            'metadata': metadata,
-            'asset': asset,
+            'metadata': self._metadata_to_dict(),
+            'asset': self._asset_to_dict(),
         }
         tx = {
             'version': self.version,
@@ -1161,16 +1612,35 @@ class Transaction(object):
 
         tx_no_signatures = Transaction._remove_signatures(tx)
         tx_serialized = Transaction._to_str(tx_no_signatures)
-        tx_id = Transaction._to_hash(tx_serialized)
+        self._id = Transaction._to_hash(tx_serialized)
 
-        tx['id'] = tx_id
+        tx['id'] = self._id
         return tx
 
+    def _metadata_to_dict(self):
+        try:
+            return self.metadata.to_dict()
+        except AttributeError:
+            # NOTE: metadata can be None and that's OK
+            return None
+
+    def _asset_to_dict(self):
+        if self.operation in (self.__class__.GENESIS, self.__class__.CREATE):
+            return self.asset.to_dict()
+        else:
+            # NOTE: An `asset` in a `TRANSFER` only contains the asset's id
+            return {'id': self.asset.data_id}
+
     @staticmethod
     # TODO: Remove `_dict` prefix of variable.
     def _remove_signatures(tx_dict):
         """Takes a Transaction dictionary and removes all signatures.
 
+            Note:
+                `tx_dict` is not modified. Only the dictionaries on the path
+                to the signatures are copied, all other values are shared
+                with `tx_dict`.
+
             Args:
                 tx_dict (dict): The Transaction to remove all signatures from.
 
@@ -1178,17 +1648,39 @@ class Transaction(object):
                 dict
 
         """
-        # NOTE: We remove the reference since we need `tx_dict` only for the
-        #       transaction's hash
-        tx_dict = deepcopy(tx_dict)
-        for fulfillment in tx_dict['transaction']['fulfillments']:
-            # NOTE: Not all Cryptoconditions return a `signature` key (e.g.
-            #       ThresholdSha256Fulfillment), so setting it to `None` in any
-            #       case could yield incorrect signatures. This is why we only
-            #       set it to `None` if it's set in the dict.
-            fulfillment['fulfillment'] = None
+        tx = dict(tx_dict['transaction'])
+        # NOTE: Not all Cryptoconditions return a `signature` key (e.g.
+        #       ThresholdSha256Fulfillment), so setting it to `None` in any
+        #       case could yield incorrect signatures. This is why we only
+        #       set it to `None` if it's set in the dict.
+        tx['fulfillments'] = [dict(fulfillment, fulfillment=None)
+                              for fulfillment in tx['fulfillments']]
+        tx_dict = dict(tx_dict)
+        tx_dict['transaction'] = tx
         return tx_dict
 
+    @staticmethod
+    def _verify_id(tx_body):
+        """Checks that a Transaction dictionary holds its correct id.
+
+            Args:
+                tx_body (dict): The Transaction to check.
+
+            Raises:
+                InvalidHash: If the Transaction's id is missing or invalid.
+        """
+        try:
+            proposed_tx_id = tx_body['id']
+        except KeyError:
+            raise InvalidHash()
+
+        tx_body_no_id = {key: value for key, value in tx_body.items()
+                         if key != 'id'}
+        tx_body_no_signatures = Transaction._remove_signatures(tx_body_no_id)
+        tx_body_serialized = Transaction._to_str(tx_body_no_signatures)
+        if proposed_tx_id != Transaction._to_hash(tx_body_serialized):
+            raise InvalidHash()
+
     @staticmethod
     def _to_hash(value):
         return hash_data(value)
@@ -1198,7 +1690,28 @@ class Transaction(object):
         return self.to_hash()
 
     def to_hash(self):
-        return self.to_dict()['id']
+        """Returns the Transaction's id, computing it only when needed.
+
+            Note:
+                The id is cached after it has been computed once. The cache is
+                invalidated when one of the `HASHED_ATTRIBUTES` is assigned to
+                or when a Fulfillment or Condition is added to the
+                Transaction. Signing does not invalidate it, as signatures are
+                not part of the hashed body.
+
+                Changing nested objects in place (e.g.
+                `tx.metadata.data[...] = ...`) is not tracked, so the id
+                returned here can be stale afterwards. Reassign the attribute
+                instead. `to_dict` and comparisons always compute the id
+                again.
+
+            Returns:
+                str: The Transaction's id.
+        """
+        if self._id is None:
+            # NOTE: `to_dict` computes and caches the id
+            self.to_dict()
+        return self._id
 
     @staticmethod
     def _to_str(value):
@@ -1210,37 +1723,532 @@ class Transaction(object):
         return Transaction._to_str(tx)
 
     @classmethod
-    # TODO: Make this method more pretty
     def from_dict(cls, tx_body):
         """Transforms a Python dictionary to a Transaction object.
 
+            Note:
+                The mutable values of `tx_body` that end up in the created
+                Transaction (the owners and the data of its Asset and
+                Metadata) are copied, so that mutating `tx_body` afterwards
+                doesn't change the Transaction or invalidate its cached id.
+
+            Args:
+                tx_body (dict): The Transaction to be transformed.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Transaction`
+
+            Raises:
+                InvalidHash: If the Transaction's id is missing or invalid.
+        """
+        # NOTE: The id is verified before any Fulfillment URI is parsed
+        Transaction._verify_id(tx_body)
+        return cls._from_verified_dict(tx_body)
+
+    @classmethod
+    def _from_verified_dict(cls, tx_body, copy_values=True):
+        """Transforms a Python dictionary whose id has already been verified
+        to a Transaction object.
+
             Args:
                 tx_body (dict): The Transaction to be transformed.
+                copy_values (bool): If the mutable values the Transaction
+                    keeps are copied. Only a dictionary that isn't referenced
+                    anywhere else (e.g. one that was just deserialized) may be
+                    shared.
+        """
+        tx = tx_body['transaction']
+        if copy_values:
+            tx = _copy_mutable_values(tx)
+        fulfillments = [Fulfillment.from_dict(fulfillment) for fulfillment
+                        in tx['fulfillments']]
+        conditions = [Condition.from_dict(condition) for condition
+                      in tx['conditions']]
+        metadata = Metadata.from_dict(tx['metadata'])
+        asset = Asset.from_dict(tx['asset'])
+
+        return cls(tx['operation'], asset, fulfillments, conditions,
+                   metadata, tx['timestamp'], tx_body['version'])
+
+    @classmethod
+    def from_json(cls, raw):
+        """Transforms a JSON formatted Transaction to a Transaction object.
+
+            Note:
+                As the deserialized dictionary isn't referenced anywhere
+                else, the Transaction shares its values instead of copying
+                them.
+
+            Args:
+                raw (str|bytes): The Transaction as JSON formatted string.
 
             Returns:
                 :class:`~bigchaindb_common.transaction.Transaction`
+
+            Raises:
+                InvalidHash: If the Transaction's id is missing or invalid.
         """
-        # NOTE: Remove reference to avoid side effects
-        tx_body = deepcopy(tx_body)
+        tx_body = deserialize(raw)
+        Transaction._verify_id(tx_body)
+        return cls._from_verified_dict(tx_body, copy_values=False)
+
+
+class LazyTransaction(object):
+    """A read-only view of a serialized Transaction.
+
+        Note:
+            The Transaction's id is verified when a LazyTransaction is
+            created. All other parts of the Transaction are only transformed
+            to objects when they are accessed for the first time. Accessing
+            e.g. only `id`, `operation` or `tx_inputs` hence never parses a
+            Fulfillment URI.
+
+            A passed-in dictionary is not copied and must not be mutated
+            afterwards. Transactions returned by `to_transaction` don't share
+            the view's lists, so they can be e.g. signed without changing
+            the view.
+
+        Attributes:
+            id (str): The Transaction's id.
+            version (int): The version number of the Transaction.
+            operation (str): The operation of the Transaction.
+            timestamp (str): The time the Transaction was created.
+    """
+
+    __slots__ = ('_tx_body', '_tx', '_materialized')
+
+    def __init__(self, tx_body):
+        """Wraps a serialized Transaction after verifying its id.
+
+            Args:
+                tx_body (dict|str|bytes): The Transaction as Python dictionary
+                    or as JSON formatted string.
+
+            Raises:
+                InvalidHash: If the Transaction's id is missing or invalid.
+        """
+        if isinstance(tx_body, (str, bytes)):
+            tx_body = deserialize(tx_body)
+        Transaction._verify_id(tx_body)
+
+        self._tx_body = tx_body
+        self._tx = tx_body['transaction']
+        self._materialized = {}
+
+    def _materialize(self, name, build):
         try:
-            proposed_tx_id = tx_body.pop('id')
+            return self._materialized[name]
         except KeyError:
-            raise InvalidHash()
+            value = self._materialized[name] = build()
+            return value
 
-        tx_body_no_signatures = Transaction._remove_signatures(tx_body)
-        tx_body_serialized = Transaction._to_str(tx_body_no_signatures)
-        valid_tx_id = Transaction._to_hash(tx_body_serialized)
+    @property
+    def id(self):
+        return self._tx_body['id']
 
-        if proposed_tx_id != valid_tx_id:
-            raise InvalidHash()
-        else:
-            tx = tx_body['transaction']
-            fulfillments = [Fulfillment.from_dict(fulfillment) for fulfillment
-                            in tx['fulfillments']]
-            conditions = [Condition.from_dict(condition) for condition
-                          in tx['conditions']]
-            metadata = Metadata.from_dict(tx['metadata'])
-            asset = Asset.from_dict(tx['asset'])
-
-            return cls(tx['operation'], asset, fulfillments, conditions,
-                       metadata, tx['timestamp'], tx_body['version'])
+    @property
+    def version(self):
+        return self._tx_body['version']
+
+    @property
+    def operation(self):
+        return self._tx['operation']
+
+    @property
+    def timestamp(self):
+        return self._tx['timestamp']
+
+    @property
+    def asset(self):
+        """:class:`~bigchaindb_common.transaction.Asset`: The Transaction's
+        Asset."""
+        return self._materialize('asset',
+                                 lambda: Asset.from_dict(self._tx['asset']))
+
+    @property
+    def metadata(self):
+        """:class:`~bigchaindb_common.transaction.Metadata`: The Transaction's
+        Metadata."""
+        return self._materialize(
+            'metadata', lambda: Metadata.from_dict(self._tx['metadata']))
+
+    @property
+    def fulfillments(self):
+        """:obj:`list` of :class:`~bigchaindb_common.transaction.Fulfillment`:
+        The Transaction's Fulfillments."""
+        return self._materialize(
+            'fulfillments', lambda: [Fulfillment.from_dict(ffill) for ffill
+                                     in self._tx['fulfillments']])
+
+    @property
+    def conditions(self):
+        """:obj:`list` of :class:`~bigchaindb_common.transaction.Condition`:
+        The Transaction's Conditions."""
+        return self._materialize(
+            'conditions', lambda: [Condition.from_dict(cond) for cond
+                                   in self._tx['conditions']])
+
+    @property
+    def tx_inputs(self):
+        """:obj:`list` of :class:`~bigchaindb_common.transaction.
+        TransactionLink`: The Conditions spent by the Transaction's
+        Fulfillments, without parsing the Fulfillments."""
+        return self._materialize(
+            'tx_inputs', lambda: [TransactionLink.from_dict(ffill['input'])
+                                  for ffill in self._tx['fulfillments']])
+
+    def to_dict(self):
+        """Returns the wrapped Transaction.
+
+            Returns:
+                dict: The Transaction as an alternative serialization format.
+        """
+        return self._tx_body
+
+    def to_transaction(self):
+        """Transforms the view to a Transaction object.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Transaction`
+        """
+        return Transaction(self.operation, self.asset, list(self.fulfillments),
+                           list(self.conditions), self.metadata,
+                           self.timestamp, self.version)
+
+    def fulfillments_valid(self, input_conditions=None):
+        """Validates the Fulfillments of the Transaction.
+
+            Args:
+                input_conditions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Condition`): A list of Conditions to check the
+                    Fulfillments against.
+
+            Returns:
+                bool: If all Fulfillments are valid.
+        """
+        return self.to_transaction().fulfillments_valid(input_conditions)
+
+
+def _parse_fulfillment_details(details):
+    """Transforms the details of a Fulfillment to a Cryptoconditions
+    Fulfillment.
+
+        Raises:
+            TypeError: If `details` is not a dict instance.
+            InvalidSignature: If the details couldn't be parsed.
+    """
+    if not isinstance(details, dict):
+        raise TypeError('`details` must be a dict instance')
+    try:
+        return CCFulfillment.from_dict(details)
+    except _CC_PARSING_ERRORS:
+        raise InvalidSignature("Fulfillment details couldn't be parsed")
+
+
+def _gen_ed25519_fulfillment(public_key):
+    """Creates an Ed25519Fulfillment, looking up its decoded VerifyingKey
+    and condition URI in `Condition.KEY_CACHE`.
+
+        Args:
+            public_key (str): A base58 encoded public key.
+
+        Returns:
+            tuple: The :class:`cryptoconditions.Ed25519Fulfillment` and its
+                condition URI, or `None` if caching is disabled.
+
+        Raises:
+            TypeError: If `public_key` is not a str or bytes instance.
+    """
+    cache = Condition.KEY_CACHE
+    if cache is None or not public_key or not isinstance(public_key, str):
+        return Ed25519Fulfillment(public_key=public_key), None
+
+    entry = cache.get(public_key)
+    if entry is None:
+        ffill = Ed25519Fulfillment(public_key=VerifyingKey(public_key))
+        cache.put(public_key, (ffill.public_key, ffill.condition_uri))
+        return ffill, ffill.condition_uri
+    verifying_key, uri = entry
+    return Ed25519Fulfillment(public_key=verifying_key), uri
+
+
+def _gen_owners(owners_after):
+    """Flattens a (nested) list of owners to its public keys."""
+    if isinstance(owners_after, tuple):
+        # NOTE: See `Condition.generate` for the tuple notation of thresholds
+        owners_after = owners_after[0]
+    for owner in owners_after or []:
+        if isinstance(owner, (list, tuple)):
+            yield from _gen_owners(owner)
+        elif isinstance(owner, str):
+            yield owner
+
+
+def _gen_public_keys(ccffill):
+    """Yields the base58 encoded public keys of all Ed25519Fulfillments in a
+    (nested) Fulfillment."""
+    if isinstance(ccffill, Ed25519Fulfillment):
+        yield ccffill.public_key.encode().decode()
+    elif isinstance(ccffill, ThresholdSha256Fulfillment):
+        for subcondition in ccffill.subconditions:
+            # NOTE: Unfulfilled subconditions don't carry a public key
+            if isinstance(subcondition['body'], CCFulfillment):
+                yield from _gen_public_keys(subcondition['body'])
+
+
+def _owners_key(owners_after):
+    """Returns a hashable key for an `owners_after` structure, as accepted by
+    `Condition.generate`, or `None` if it contains anything but public
+    keys."""
+    if isinstance(owners_after, str):
+        return owners_after
+    elif isinstance(owners_after, list):
+        keys = tuple(_owners_key(owner) for owner in owners_after)
+        if None in keys:
+            return None
+        return ('list', keys)
+    elif isinstance(owners_after, tuple) and len(owners_after) == 2 and \
+            isinstance(owners_after[1], int):
+        key = _owners_key(owners_after[0])
+        if key is None:
+            return None
+        return ('threshold', key, owners_after[1])
+    return None
+
+
+def _copy_fulfillment(ccffill):
+    """Copies the nodes of a Fulfillment tree that signing mutates.
+
+        Note:
+            Only Ed25519 and ThresholdSha256 Fulfillments are copied. Their
+            public keys and signatures, as well as all other nodes (e.g.
+            unfulfilled subconditions) are immutable and hence shared with
+            `ccffill`. Public keys are not decoded again.
+
+        Args:
+            ccffill (:class:`cryptoconditions.Fulfillment`): The Fulfillment
+                to copy.
+
+        Returns:
+            :class:`cryptoconditions.Fulfillment`
+    """
+    if isinstance(ccffill, Ed25519Fulfillment):
+        ffill = Ed25519Fulfillment(public_key=ccffill.public_key)
+        ffill.signature = ccffill.signature
+        return ffill
+    elif isinstance(ccffill, ThresholdSha256Fulfillment):
+        ffill = ThresholdSha256Fulfillment(threshold=ccffill.threshold)
+        ffill.subconditions = [
+            dict(subcondition, body=_copy_fulfillment(subcondition['body']))
+            for subcondition in ccffill.subconditions]
+        return ffill
+    return ccffill
+
+
+def _is_time_dependent(ccffill):
+    """Checks if a Cryptoconditions Fulfillment's validity depends on time.
+
+        Args:
+            ccffill (:class:`cryptoconditions.Fulfillment`): The Fulfillment
+                to check.
+
+        Returns:
+            bool: If `ccffill` or any of its subfulfillments is a
+                TimeoutFulfillment.
+    """
+    if isinstance(ccffill, TimeoutFulfillment):
+        return True
+    elif isinstance(ccffill, ThresholdSha256Fulfillment):
+        return any(_is_time_dependent(subcondition['body']) for subcondition
+                   in ccffill.subconditions
+                   if isinstance(subcondition['body'], CCFulfillment))
+    else:
+        return False
+
+
+def _copy_owners(owners):
+    """Copies a (nested) list of owners."""
+    if isinstance(owners, list):
+        return [_copy_owners(owner) for owner in owners]
+    return owners
+
+
+def _copy_mutable_values(tx):
+    """Copies the mutable values of a Transaction's body that a Transaction
+    object keeps: the owners and the data of its Asset and Metadata."""
+    tx = dict(tx)
+    tx['fulfillments'] = [dict(ffill, owners_before=_copy_owners(
+                                   ffill['owners_before']))
+                          for ffill in tx['fulfillments']]
+    tx['conditions'] = [dict(cond, owners_after=_copy_owners(
+                                 cond['owners_after']))
+                        for cond in tx['conditions']]
+    if isinstance(tx['metadata'], dict):
+        tx['metadata'] = dict(tx['metadata'],
+                              data=deepcopy(tx['metadata'].get('data')))
+    tx['asset'] = dict(tx['asset'], data=deepcopy(tx['asset'].get('data')))
+    return tx
+
+
+def validate_many(transactions, input_lookup=None, workers=None,
+                  executor=None, chunksize=16):
+    """Validates the Fulfillments of many Transactions on multiple cores.
+
+        Note:
+            Validation is CPU-bound and doesn't release the GIL, which is why
+            the Transactions are sharded across a process pool. They are sent
+            to the workers in their canonical serialized form, together with
+            the Conditions they spend.
+            `input_lookup` is only called in the calling process, so it may
+            e.g. query a database.
+
+        Args:
+            transactions (:obj:`list` of :class:`~bigchaindb_common.
+                transaction.Transaction`): The Transactions to validate.
+            input_lookup (callable, optional): Returns the
+                :class:`~bigchaindb_common.transaction.Condition` a
+                :class:`~bigchaindb_common.transaction.TransactionLink`
+                points to, or `None` if it's not available (e.g.
+                `UnspentOutputs.get_condition`). Required if `transactions`
+                contains `TRANSFER` Transactions.
+            workers (int, optional): The number of worker processes. Defaults
+                to the number of processors on the machine.
+            executor (:class:`concurrent.futures.Executor`, optional): An
+                executor to use instead of starting a new process pool.
+            chunksize (int): The number of Transactions sent to a worker at
+                once.
+
+        Returns:
+            :obj:`list` of bool: If all Fulfillments of a Transaction are
+                valid, in the order of `transactions`. A Transaction that
+                spends an unavailable input or can't be parsed is invalid.
+    """
+    payloads = [_to_validation_payload(tx, input_lookup)
+                for tx in transactions]
+    # NOTE: Transactions spending unavailable inputs are not sent to workers
+    sent = [payload for payload in payloads if payload is not None]
+    if executor is not None:
+        results = list(executor.map(_validate_payload, sent,
+                                    chunksize=chunksize))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_payload, sent,
+                                        chunksize=chunksize))
+
+    results = iter(results)
+    return [payload is not None and next(results) for payload in payloads]
+
+
+def _to_validation_payload(tx, input_lookup=None):
+    """Serializes a Transaction and the Conditions it spends for a worker.
+
+        Returns:
+            tuple: The payload or `None`, if a Condition `tx` spends is not
+                available.
+    """
+    if tx.operation == Transaction.TRANSFER:
+        input_conditions = []
+        for fulfillment in tx.fulfillments:
+            condition = input_lookup(fulfillment.tx_input)
+            if condition is None:
+                return None
+            input_conditions.append(condition.to_dict())
+    else:
+        input_conditions = None
+    return serialize(tx.to_dict()), serialize(input_conditions)
+
+
+def _validate_payload(payload):
+    """Validates a Transaction serialized by `_to_validation_payload`.
+
+        Returns:
+            bool: If all Fulfillments of the Transaction are valid. `False`,
+                if it can't be parsed or doesn't spend as many Conditions as
+                it has Fulfillments.
+    """
+    tx_serialized, input_conditions_serialized = payload
+    try:
+        tx = Transaction.from_dict(deserialize(tx_serialized))
+        input_conditions = deserialize(input_conditions_serialized)
+        if input_conditions is not None:
+            input_conditions = [Condition.from_dict(cond) for cond
+                                in input_conditions]
+        return tx.fulfillments_valid(input_conditions)
+    except (InvalidHash, InvalidSignature, ValueError):
+        return False
+
+
+def _splice_partial_messages(head, tail, pairs):
+    """Splices the parts serialized by `Transaction._partial_message_parts`
+    into the messages to sign."""
+    for condition, fulfillment in pairs:
+        tx_body = (head, condition, b'],"fulfillments":[', fulfillment, tail)
+        tx_id = hash_bytes(b''.join((b'{"transaction":',) + tx_body))
+        yield b''.join((b'{"id":"', tx_id.encode(), b'","transaction":') +
+                       tx_body)
+
+
+def _to_signing_payload(tx):
+    """Serializes what a worker needs to sign a Transaction's Fulfillments.
+
+        Note:
+            The payload consists of the Fulfillments' cryptoconditions
+            details and owners as canonical JSON, and the parts of the
+            messages to sign. The parts all messages share, e.g. the asset
+            and the metadata, are sent once. The worker splices the messages
+            together itself.
+    """
+    fulfillments = [[fulfillment.fulfillment.to_dict(),
+                     fulfillment.owners_before]
+                    for fulfillment in tx.fulfillments]
+    head, tail, pairs = tx._partial_message_parts()
+    return serialize_bytes(fulfillments), head, tail, list(pairs)
+
+
+def _sign_chunk(chunk):
+    """Signs a chunk of payloads built by `_to_signing_payload`.
+
+        Note:
+            The private keys are sent and decoded once per chunk. They are
+            not kept in the worker after the chunk has been signed.
+
+        Args:
+            chunk (tuple): The private keys and a list of payloads.
+
+        Returns:
+            :obj:`list` of :obj:`list` of :obj:`str`: The URIs of the signed
+                Fulfillments of every payload.
+    """
+    private_keys, payloads = chunk
+    keyring = Keyring(list(private_keys))
+    return [_sign_payload(payload, keyring) for payload in payloads]
+
+
+def _sign_payload(payload, keyring):
+    """Signs the Fulfillments serialized by `_to_signing_payload`.
+
+        Returns:
+            :obj:`list` of :obj:`str`: The URIs of the signed Fulfillments.
+    """
+    fulfillments_serialized, head, tail, pairs = payload
+    messages = _splice_partial_messages(head, tail, pairs)
+    uris = []
+    for (details, owners_before), message in \
+            zip(deserialize(fulfillments_serialized), messages):
+        fulfillment = Fulfillment(CCFulfillment.from_dict(details),
+                                  owners_before)
+        signed = Transaction._sign_fulfillment(fulfillment, message, keyring)
+        uris.append(signed.serialize_uri())
+    return uris
+
+
+def _apply_signed_uris(tx, uris):
+    """Replaces a Transaction's Fulfillments with the ones signed by
+    `_sign_payload`."""
+    for index, uri in enumerate(uris):
+        fulfillment = tx.fulfillments[index]
+        signed = Fulfillment(CCFulfillment.from_uri(uri),
+                             fulfillment.owners_before, fulfillment.tx_input)
+        signed._uri = uri
+        tx.fulfillments[index] = signed
+    return tx
@@ -0,0 +1,317 @@
+"""An append-only log of serialized Transactions, stored in local files."""
+import mmap
+import os
+
+from bigchaindb_common.transaction import Transaction
+from bigchaindb_common.util import deserialize, serialize_bytes
+
+
+SEGMENT_SUFFIX = '.log'
+INDEX_SUFFIX = '.idx'
+
+
+class TransactionLog(object):
+    """Stores Transactions in append-only segment files.
+
+        Note:
+            Every record is a Transaction serialized with
+            :func:`~bigchaindb_common.util.serialize` (including its id),
+            terminated by a newline. Once a segment reaches `segment_size`,
+            a new one is started.
+
+            Next to every segment, an index file holds one
+            `<id> <offset> <length>` line per record. The index is only read
+            when it is first needed, and records that were appended to a
+            segment but not to its index (e.g. because of a crash) are
+            re-indexed then.
+
+            Records are read through `mmap`, so lookups and scans are served
+            from the page cache. As the JSON parser can't read from a
+            `memoryview`, every record is copied once into `bytes` before
+            it is parsed.
+    """
+
+    def __init__(self, path, segment_size=64 * 1024 * 1024):
+        """Opens a log, creating its directory if necessary.
+
+            Args:
+                path (str): The directory holding the segment files.
+                segment_size (int): The size in bytes after which a new
+                    segment is started.
+
+            Raises:
+                ValueError: If `segment_size` is not a positive integer.
+        """
+        if not isinstance(segment_size, int) or segment_size < 1:
+            raise ValueError('`segment_size` must be a positive integer')
+        self.path = path
+        self.segment_size = segment_size
+        os.makedirs(path, exist_ok=True)
+
+        self._index = None
+        self._maps = {}
+        self._writer = None
+        self._writer_segment = None
+        self._index_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, tx_id):
+        return tx_id in self.index
+
+    def __iter__(self):
+        return self.scan()
+
+    @property
+    def index(self):
+        """dict: Maps the id of every stored Transaction to the
+        `(segment, offset, length)` of its record."""
+        if self._index is None:
+            self._load_index()
+        return self._index
+
+    def _segments(self):
+        return sorted(int(name[:-len(SEGMENT_SUFFIX)])
+                      for name in os.listdir(self.path)
+                      if name.endswith(SEGMENT_SUFFIX))
+
+    def _segment_path(self, segment, suffix=SEGMENT_SUFFIX):
+        return os.path.join(self.path, '{:08d}{}'.format(segment, suffix))
+
+    def _load_index(self):
+        index = {}
+        for segment in self._segments():
+            end = self._read_segment_index(segment, index)
+            missing = list(self._gen_records(segment, end))
+            if missing:
+                with open(self._segment_path(segment, INDEX_SUFFIX),
+                          'a') as f:
+                    for offset, record in missing:
+                        tx_id = deserialize(bytes(record))['id']
+                        index[tx_id] = (segment, offset, len(record))
+                        f.write('{} {} {}\n'.format(tx_id, offset,
+                                                    len(record)))
+        self._index = index
+
+    def _read_segment_index(self, segment, index):
+        """Adds the entries of a segment's index file to `index`.
+
+            Note:
+                Entries are only trusted up to the first one that is
+                malformed (e.g. partially written during a crash), doesn't
+                directly follow the previous record or points beyond the end
+                of the segment. The index file is truncated before it, so
+                that the records from there on are re-indexed.
+
+            Returns:
+                int: The offset in the segment up to which all records are
+                    indexed.
+        """
+        path = self._segment_path(segment, INDEX_SUFFIX)
+        size = os.path.getsize(self._segment_path(segment))
+        end = 0
+        valid_size = 0
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        tx_id, offset, length = line.decode().split()
+                        offset, length = int(offset), int(length)
+                    except ValueError:
+                        break
+                    if not line.endswith(b'\n') or offset != end or \
+                            length < 0 or offset + length >= size:
+                        break
+                    index[tx_id] = (segment, offset, length)
+                    end = offset + length + 1
+                    valid_size += len(line)
+                else:
+                    return end
+            with open(path, 'r+b') as f:
+                f.truncate(valid_size)
+        except FileNotFoundError:
+            pass
+        return end
+
+    def _map(self, segment, end=None):
+        """Returns a memory map of a segment that covers at least its first
+        `end` bytes, or all of it."""
+        if end is None:
+            end = os.path.getsize(self._segment_path(segment))
+        buffer = self._maps.get(segment)
+        if buffer is None or len(buffer) < end:
+            with open(self._segment_path(segment), 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b''
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # NOTE: Old maps are not closed, as views on them may still
+            #       exist. They are unmapped once they are garbage collected.
+            self._maps[segment] = buffer
+        return buffer
+
+    def _gen_records(self, segment, start=0):
+        """Yields the offset and a view on every complete record of a
+        segment from `start` on."""
+        buffer = self._map(segment)
+        view = memoryview(buffer)
+        while True:
+            end = buffer.find(b'\n', start)
+            if end == -1:
+                break
+            yield start, view[start:end]
+            start = end + 1
+
+    def append(self, tx):
+        """Appends a Transaction to the log.
+
+            Args:
+                tx (:class:`~bigchaindb_common.transaction.Transaction`): The
+                    Transaction to store.
+
+            Raises:
+                ValueError: If a Transaction with the same id is already
+                    stored.
+        """
+        self.extend([tx])
+
+    def extend(self, transactions):
+        """Appends a list of Transactions to the log.
+
+            Args:
+                transactions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Transaction`): The Transactions to store.
+
+            Raises:
+                ValueError: If a Transaction with the same id is already
+                    stored. All Transactions before it are stored.
+        """
+        index = self.index
+        try:
+            for tx in transactions:
+                tx_dict = tx.to_dict()
+                tx_id = tx_dict['id']
+                if tx_id in index:
+                    raise ValueError('Transaction `{}` is already stored'
+                                     .format(tx_id))
+                record = serialize_bytes(tx_dict)
+
+                self._open_writer(len(record) + 1)
+                offset = self._writer.tell()
+                self._writer.write(record + b'\n')
+                self._index_writer.write('{} {} {}\n'.format(
+                    tx_id, offset, len(record)))
+                index[tx_id] = (self._writer_segment, offset, len(record))
+        finally:
+            self.flush()
+
+    def _open_writer(self, size):
+        """Makes sure a segment with room for a record of `size` bytes is
+        open for writing.
+
+            Note:
+                A record larger than `segment_size` gets a segment of its own.
+        """
+        if self._writer is not None:
+            written = self._writer.tell()
+            if not written or written + size <= self.segment_size:
+                return
+            segment = self._writer_segment + 1
+            self._close_writer()
+        else:
+            segment = max(self._segments(), default=0)
+            path = self._segment_path(segment)
+            if os.path.exists(path) and os.path.getsize(path):
+                with open(path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    # NOTE: Never append to a segment ending in a partially
+                    #       written record
+                    complete = f.read(1) == b'\n'
+                if not complete or \
+                        os.path.getsize(path) + size > self.segment_size:
+                    segment += 1
+
+        self._writer_segment = segment
+        self._writer = open(self._segment_path(segment), 'ab')
+        self._index_writer = open(self._segment_path(segment, INDEX_SUFFIX),
+                                  'a')
+
+    def _close_writer(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._index_writer.close()
+            self._writer = None
+            self._index_writer = None
+
+    def flush(self):
+        """Flushes all appended records to the operating system."""
+        if self._writer is not None:
+            self._writer.flush()
+            self._index_writer.flush()
+
+    def close(self):
+        """Closes all open files and drops the loaded index."""
+        self._close_writer()
+        self._maps.clear()
+        self._index = None
+
+    def get_raw(self, tx_id):
+        """Returns the serialized record of a Transaction.
+
+            Note:
+                The returned view references the memory map of the segment.
+                It should not be kept around longer than necessary.
+
+            Args:
+                tx_id (str): The id of the Transaction.
+
+            Returns:
+                memoryview: The UTF-8 encoded serialized Transaction.
+
+            Raises:
+                KeyError: If no Transaction with `tx_id` is stored.
+        """
+        segment, offset, length = self.index[tx_id]
+        buffer = self._map(segment, offset + length)
+        return memoryview(buffer)[offset:offset + length]
+
+    def get(self, tx_id):
+        """Returns a stored Transaction.
+
+            Args:
+                tx_id (str): The id of the Transaction.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Transaction`
+
+            Raises:
+                KeyError: If no Transaction with `tx_id` is stored.
+        """
+        return Transaction.from_json(bytes(self.get_raw(tx_id)))
+
+    def scan_raw(self):
+        """Yields the serialized records of all Transactions, in the order
+        they were appended.
+
+            Yields:
+                memoryview: The UTF-8 encoded serialized Transactions.
+        """
+        self.flush()
+        for segment in self._segments():
+            for _, record in self._gen_records(segment):
+                yield record
+
+    def scan(self):
+        """Yields all Transactions, in the order they were appended.
+
+            Yields:
+                :class:`~bigchaindb_common.transaction.Transaction`
+        """
+        for record in self.scan_raw():
+            yield Transaction.from_json(bytes(record))
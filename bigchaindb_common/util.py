@@ -1,7 +1,41 @@
+import json
+import re
 import time
+from collections import namedtuple
 
 import rapidjson
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+Serializer = namedtuple('Serializer', ('dumps', 'dumps_bytes', 'loads'))
+
+# NOTE: All registered JSON backends, by name. See `register_serializer`.
+SERIALIZERS = {}
+
+# NOTE: Values a backend must serialize exactly like the reference backend
+#       before it can be selected. See `use_serializer`.
+CONFORMANCE_CORPUS = {
+    'unicode': {'ü': 'üñí©ødé', '😀': '\u2028\u2029\ufeff\uffff'},
+    'control characters': ''.join(chr(c) for c in range(32)) + '\x7f"\\/',
+    'escape sequences': '\\u001f \\\\u000b \\n',
+    'key order': {'b': 1, 'a': {'d': [], 'c': {}}, 'B': None, '': True,
+                  'ä': 1, '😀': 2, '\uffff': 3, 'a\x00': 4},
+    'integers': [0, -1, 2 ** 31, 2 ** 53, -2 ** 63, 2 ** 64 - 1],
+    'floats': [0.1, -0.0, 1.0, 100.0, 0.1 + 0.2, 123456789.123456789,
+               5e-324, 1e15],
+    'exponent floats': [1e16, 1e-7, 1e300, 1.5e-10],
+    'big integers': [2 ** 64, -2 ** 64 - 1],
+    'nested': [[{'a': [None, False]}]] * 3 + [{}] + [[]],
+}
+
+REFERENCE_SERIALIZER = 'rapidjson'
+
+_conformance = {}
+
 
 def gen_timestamp():
     """The Unix time, rounded to the nearest second.
@@ -13,6 +47,110 @@ def gen_timestamp():
     return str(round(time.time()))
 
 
+def register_serializer(name, dumps, loads, dumps_bytes=None):
+    """Registers a JSON backend that can be selected with `use_serializer`.
+
+        Note:
+            Transaction ids are hashes of serialized Transactions. A backend
+            must hence produce exactly the same output as the default
+            `rapidjson` backend: keys sorted, no whitespace, non-ASCII
+            characters not escaped and control characters escaped as
+            `\\u00XX` with upper case hex digits. The conformance tests in
+            `tests/test_serializers.py` check this for all registered
+            backends.
+
+        Args:
+            name (str): The name of the backend.
+            dumps (callable): Serializes a dict into a JSON formatted string.
+            loads (callable): Deserializes a JSON formatted string or
+                bytestring into a dict.
+            dumps_bytes (callable, optional): Serializes a dict into a UTF-8
+                encoded JSON formatted bytestring. Defaults to encoding the
+                result of `dumps`.
+    """
+    if dumps_bytes is None:
+        def dumps_bytes(data):
+            return dumps(data).encode()
+    SERIALIZERS[name] = Serializer(dumps, dumps_bytes, loads)
+    _conformance.pop(name, None)
+
+
+def serializer_conforms(name):
+    """Checks if a JSON backend serializes the `CONFORMANCE_CORPUS` exactly
+    like the reference backend.
+
+        Note:
+            The result is computed once per registered backend.
+
+        Args:
+            name (str): The name of a registered backend.
+
+        Returns:
+            bool: If the backend conforms.
+
+        Raises:
+            KeyError: If no backend with `name` is registered.
+    """
+    if name not in _conformance:
+        _conformance[name] = _check_conformance(SERIALIZERS[name])
+    return _conformance[name]
+
+
+def _check_conformance(serializer):
+    reference = SERIALIZERS[REFERENCE_SERIALIZER]
+    for value in CONFORMANCE_CORPUS.values():
+        data = {'metadata': value}
+        expected = reference.dumps(data)
+        try:
+            if serializer.dumps(data) != expected or \
+                    serializer.dumps_bytes(data) != expected.encode() or \
+                    serializer.loads(expected) != data or \
+                    serializer.loads(expected.encode()) != data:
+                return False
+        except (TypeError, ValueError, OverflowError):
+            return False
+    return True
+
+
+def use_serializer(name, unsafe=False):
+    """Selects the JSON backend used by `serialize`, `serialize_bytes` and
+    `deserialize`.
+
+        Note:
+            A backend that doesn't serialize the `CONFORMANCE_CORPUS` exactly
+            like the reference backend would compute different Transaction
+            ids for some Transactions than other nodes. It can only be
+            selected with `unsafe`.
+
+        Args:
+            name (str): The name of a registered backend.
+            unsafe (bool): If a backend that doesn't conform can be selected.
+
+        Raises:
+            ValueError: If no backend with `name` is registered, or the
+                backend doesn't conform and `unsafe` is not set.
+    """
+    global _serializer_name, _serializer
+    if name not in SERIALIZERS:
+        raise ValueError('`name` must be one of {}'
+                         .format(', '.join(sorted(SERIALIZERS))))
+    if not unsafe and not serializer_conforms(name):
+        raise ValueError('Serializer `{}` does not produce canonical JSON. '
+                         'Pass `unsafe=True` to select it anyway.'
+                         .format(name))
+    _serializer = SERIALIZERS[name]
+    _serializer_name = name
+
+
+def current_serializer():
+    """Returns the name of the selected JSON backend.
+
+        Returns:
+            str: The name of the backend.
+    """
+    return _serializer_name
+
+
 def serialize(data):
     """Serialize a dict into a JSON formatted string.
 
@@ -31,18 +169,79 @@ def serialize(data):
             str: JSON formatted string
 
     """
-    return rapidjson.dumps(data, skipkeys=False, ensure_ascii=False,
-                           sort_keys=True)
+    return _serializer.dumps(data)
+
+
+def serialize_bytes(data):
+    """Serialize a dict into a UTF-8 encoded JSON formatted bytestring.
+
+        Note:
+            The result is identical to `serialize(data).encode()`. Messages
+            that are signed, verified or hashed should be kept as bytes, so
+            that they are only encoded once.
+
+        Args:
+            data (dict): dict to serialize
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+
+    """
+    return _serializer.dumps_bytes(data)
 
 
 def deserialize(data):
     """Deserialize a JSON formatted string into a dict.
 
         Args:
-            data (str): JSON formatted string.
+            data (str|bytes): JSON formatted string.
 
         Returns:
             dict: dict resulting from the serialization of a JSON formatted
             string.
     """
-    return rapidjson.loads(data)
+    return _serializer.loads(data)
+
+
+def _rapidjson_dumps(data):
+    return rapidjson.dumps(data, skipkeys=False, ensure_ascii=False,
+                           sort_keys=True)
+
+
+_ESCAPE = re.compile(r'\\(?:u([0-9a-f]{4})|.)')
+_ESCAPE_BYTES = re.compile(rb'\\(?:u([0-9a-f]{4})|.)')
+
+
+def _upper_escape(match):
+    if match.group(1) is None:
+        return match.group(0)
+    return match.group(0)[:2] + match.group(1).upper()
+
+
+def _json_dumps(data):
+    serialized = json.dumps(data, ensure_ascii=False, sort_keys=True,
+                            separators=(',', ':'))
+    # NOTE: `json` escapes control characters with lower case hex digits
+    if '\\u' in serialized:
+        serialized = _ESCAPE.sub(_upper_escape, serialized)
+    return serialized
+
+
+def _orjson_dumps_bytes(data):
+    serialized = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    # NOTE: `orjson` escapes control characters with lower case hex digits
+    if b'\\u' in serialized:
+        serialized = _ESCAPE_BYTES.sub(_upper_escape, serialized)
+    return serialized
+
+
+def _orjson_dumps(data):
+    return _orjson_dumps_bytes(data).decode()
+
+
+register_serializer('rapidjson', _rapidjson_dumps, rapidjson.loads)
+register_serializer('json', _json_dumps, json.loads)
+if orjson is not None:
+    register_serializer('orjson', _orjson_dumps, orjson.loads,
+                        _orjson_dumps_bytes)
+use_serializer(REFERENCE_SERIALIZER)
@@ -0,0 +1,143 @@
+"""An in-memory index of the Conditions that haven't been spent yet."""
+from bigchaindb_common.exceptions import DoubleSpend, InputDoesNotExist
+from bigchaindb_common.transaction import (Transaction, TransactionLink,
+                                           _gen_owners)
+
+
+class UnspentOutputs(object):
+    """Tracks which Conditions of which Transactions can still be spent.
+
+        Note:
+            Every unspent Condition is referenced by the
+            :class:`~bigchaindb_common.transaction.TransactionLink` a
+            Fulfillment spending it would hold, as emitted by
+            `Transaction.to_inputs`.
+
+            Transactions have to be added in the order they depend on each
+            other, starting with the Transactions creating the spent
+            Conditions. The index remembers the ids of all added
+            Transactions and all spent Conditions, so that a Transaction
+            can neither be added twice nor spend a Condition again.
+    """
+
+    def __init__(self, transactions=None):
+        """Creates an index from a list of Transactions.
+
+            Args:
+                transactions (:obj:`list` of :class:`~bigchaindb_common.
+                    transaction.Transaction`, optional): The Transactions to
+                    add to the index, in the order they depend on each other.
+        """
+        self._conditions = {}
+        self._links_by_owner = {}
+        self._spenders = {}
+        self._tx_ids = set()
+        for tx in transactions or []:
+            self.add(tx)
+
+    def __len__(self):
+        return len(self._conditions)
+
+    def __contains__(self, link):
+        return link in self._conditions
+
+    def add(self, tx):
+        """Spends a Transaction's inputs and adds its Conditions.
+
+            Note:
+                If `tx` is rejected, the index is left unchanged.
+
+            Args:
+                tx (:class:`~bigchaindb_common.transaction.Transaction`): The
+                    Transaction to add.
+
+            Raises:
+                ValueError: If `tx` has already been added.
+                DoubleSpend: If an input of `tx` has already been spent or
+                    `tx` spends the same input twice.
+                InputDoesNotExist: If an input of `tx` spends a Condition
+                    that was never added to the index.
+        """
+        tx_id = tx.id
+        if tx_id in self._tx_ids:
+            raise ValueError('Transaction `{}` has already been added'
+                             .format(tx_id))
+
+        spent = set()
+        if tx.operation == Transaction.TRANSFER:
+            for fulfillment in tx.fulfillments:
+                link = fulfillment.tx_input
+                if link in spent or link in self._spenders:
+                    raise DoubleSpend('Input `{}` of transaction `{}` has '
+                                      'already been spent'
+                                      .format(link.to_dict(), tx_id))
+                if link not in self._conditions:
+                    tx_input = link.to_dict() if link is not None else None
+                    raise InputDoesNotExist('Input `{}` of transaction `{}` '
+                                            'does not exist'
+                                            .format(tx_input, tx_id))
+                spent.add(link)
+
+        for link in spent:
+            self._remove(link)
+            self._spenders[link] = tx_id
+        self._tx_ids.add(tx_id)
+
+        for cid, condition in enumerate(tx.conditions):
+            link = TransactionLink(tx_id, cid)
+            self._conditions[link] = condition
+            for owner in set(_gen_owners(condition.owners_after)):
+                self._links_by_owner.setdefault(owner, set()).add(link)
+
+    def _remove(self, link):
+        condition = self._conditions.pop(link)
+        for owner in set(_gen_owners(condition.owners_after)):
+            links = self._links_by_owner[owner]
+            links.discard(link)
+            if not links:
+                del self._links_by_owner[owner]
+
+    def is_unspent(self, link):
+        """Checks if a Condition hasn't been spent yet.
+
+            Args:
+                link (:class:`~bigchaindb_common.transaction.
+                    TransactionLink`): A link to the Condition.
+
+            Returns:
+                bool: If the Condition is unspent.
+        """
+        return link in self._conditions
+
+    def get_condition(self, link):
+        """Returns an unspent Condition.
+
+            Note:
+                This method can be passed as `input_lookup` to
+                :func:`~bigchaindb_common.transaction.validate_many`.
+
+            Args:
+                link (:class:`~bigchaindb_common.transaction.
+                    TransactionLink`): A link to the Condition.
+
+            Returns:
+                :class:`~bigchaindb_common.transaction.Condition`: The
+                    Condition or `None`, if it is not unspent.
+        """
+        return self._conditions.get(link)
+
+    def unspent_for(self, public_key):
+        """Returns the unspent Conditions a public key is an owner of.
+
+            Note:
+                The owners of threshold Conditions are all the public keys in
+                their (nested) `owners_after`.
+
+            Args:
+                public_key (str): The public key of an owner.
+
+            Returns:
+                :obj:`set` of :class:`~bigchaindb_common.transaction.
+                    TransactionLink`
+        """
+        return set(self._links_by_owner.get(public_key, ()))
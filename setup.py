@@ -28,6 +28,14 @@ dev_require = [
     'ipython',
 ]
 
+benchmarks_require = [
+    'pytest-benchmark',
+]
+
+orjson_require = [
+    'orjson',
+]
+
 docs_require = [
     'Sphinx>=1.3.5',
     'sphinx-autobuild',
@@ -66,5 +74,7 @@ setup(
         'test': tests_require,
         'dev': dev_require + tests_require + docs_require,
         'docs': docs_require,
+        'benchmarks': benchmarks_require + orjson_require,
+        'orjson': orjson_require,
     },
 )
@@ -0,0 +1,262 @@
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest import raises
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = Counter()
+        self.running = 0
+        self.max_running = 0
+        self.release = threading.Event()
+        self.release.set()
+        # NOTE: The names of the functions held back until `release` is set,
+        #       or `None` to hold back all of them
+        self.gated = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        name = getattr(fn, '__name__', None)
+        self.calls[name] += 1
+        gated = self.gated is None or name in self.gated
+
+        def run():
+            with self._lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            try:
+                if gated:
+                    self.release.wait()
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+        return super().submit(run)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def executor():
+    with CountingExecutor(max_workers=4) as executor:
+        yield executor
+
+
+@pytest.fixture
+def offloader(executor):
+    from bigchaindb_common.aio import Offloader
+    return Offloader(executor)
+
+
+def test_offloader_requires_positive_max_in_flight():
+    from bigchaindb_common.aio import Offloader
+
+    with raises(ValueError):
+        Offloader(max_in_flight=0)
+
+
+def test_parse(offloader, tx):
+    from bigchaindb_common.exceptions import InvalidHash
+    from bigchaindb_common.util import serialize
+
+    tx_dict = tx.to_dict()
+    assert run(offloader.parse(serialize(tx_dict))) == tx
+
+    tx_dict['id'] = 'a' * 64
+    with raises(InvalidHash):
+        run(offloader.parse(serialize(tx_dict)))
+
+
+def test_sign(offloader, utx, user_priv, user2_priv):
+    from bigchaindb_common.crypto import Keyring
+    from bigchaindb_common.exceptions import KeypairMismatchException
+    from bigchaindb_common.transaction import Transaction
+
+    copied = Transaction.from_dict(utx.to_dict())
+    assert run(offloader.sign(utx, [user_priv])) is utx
+    assert utx.fulfillments_valid() is True
+    assert run(offloader.sign(copied, Keyring([user_priv]))) == utx
+
+    with raises(KeypairMismatchException):
+        run(offloader.sign(Transaction.from_dict(utx.to_dict()),
+                           [user2_priv]))
+
+
+def test_validate(offloader, tx, transfer_tx):
+    from copy import deepcopy
+    from cryptoconditions import PreimageSha256Fulfillment
+    from bigchaindb_common.transaction import Condition
+
+    tampered_tx = deepcopy(transfer_tx)
+    tampered_tx.timestamp = '0'
+    hashlock = Condition(PreimageSha256Fulfillment(preimage=b'secret')
+                         .condition_uri)
+
+    assert run(offloader.validate(tx)) is True
+    assert run(offloader.validate(transfer_tx, tx.conditions)) is True
+    assert run(offloader.validate(tampered_tx, tx.conditions)) is False
+    assert run(offloader.validate(transfer_tx, [])) is False
+    assert run(offloader.validate(transfer_tx, [hashlock])) is False
+
+
+def test_concurrent_requests_are_coalesced(offloader, executor, tx, user_pub,
+                                           user_priv):
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.util import serialize
+
+    async def validate_twice():
+        return await asyncio.gather(offloader.validate(tx),
+                                    offloader.validate(tx))
+
+    assert run(validate_twice()) == [True, True]
+    assert executor.calls['_validate_transaction'] == 1
+
+    # NOTE: Transactions with the same id but different Fulfillments are not
+    #       coalesced
+    utx = Transaction.create([user_pub], [user_pub])
+    signed_tx = Transaction.from_dict(utx.to_dict()).sign([user_priv])
+
+    async def validate_signed_and_unsigned():
+        return await asyncio.gather(offloader.validate(signed_tx),
+                                    offloader.validate(utx))
+
+    assert run(validate_signed_and_unsigned()) == [True, False]
+    assert executor.calls['_validate_transaction'] == 3
+
+    raw = serialize(tx.to_dict())
+
+    async def parse_twice():
+        return await asyncio.gather(offloader.parse(raw),
+                                    offloader.parse(raw))
+
+    parsed, parsed_again = run(parse_twice())
+    assert parsed is parsed_again
+    assert executor.calls['from_json'] == 1
+
+    unsigned = [Transaction.from_dict(utx.to_dict()) for _ in range(2)]
+
+    async def sign_twice():
+        return await asyncio.gather(*[offloader.sign(tx_, [user_priv])
+                                      for tx_ in unsigned])
+
+    assert run(sign_twice()) == unsigned
+    assert all(tx_.fulfillments_valid() for tx_ in unsigned)
+    assert executor.calls['_sign_fulfillments'] == 1
+
+    # NOTE: Completed requests are not cached
+    run(offloader.validate(tx))
+    assert executor.calls['_validate_transaction'] == 4
+
+
+def test_work_is_done_off_the_event_loop(offloader, tx, transfer_utx,
+                                         user_priv, monkeypatch):
+    from bigchaindb_common.transaction import Transaction
+
+    threads = set()
+    to_dict = Transaction.to_dict
+
+    def recording_to_dict(self):
+        threads.add(threading.current_thread())
+        return to_dict(self)
+
+    monkeypatch.setattr(Transaction, 'to_dict', recording_to_dict)
+    # NOTE: Drop the cached ids, so that they are computed again
+    tx.timestamp = tx.timestamp
+    transfer_utx.timestamp = transfer_utx.timestamp
+
+    run(offloader.validate(tx))
+    run(offloader.sign(transfer_utx, [user_priv]))
+
+    assert threads
+    assert threading.current_thread() not in threads
+
+
+def test_in_flight_operations_are_bounded(executor, user_pub):
+    from bigchaindb_common.aio import Offloader
+    from bigchaindb_common.transaction import Transaction
+
+    offloader = Offloader(executor, max_in_flight=2)
+    transactions = [Transaction.create([user_pub], [user_pub])
+                    for _ in range(5)]
+
+    async def validate_all():
+        executor.release.clear()
+        futures = [asyncio.ensure_future(offloader.validate(tx))
+                   for tx in transactions]
+        await asyncio.sleep(0.05)
+        assert offloader.in_flight == 2
+        assert sum(executor.calls.values()) == 2
+        executor.release.set()
+        return await asyncio.gather(*futures)
+
+    assert run(validate_all()) == [False] * 5
+    assert executor.max_running == 2
+    assert offloader.in_flight == 0
+
+
+def test_cancelling_a_caller_does_not_cancel_coalesced_work(offloader,
+                                                            executor, tx):
+    executor.gated = {'_validate_transaction'}
+
+    async def validate_and_cancel():
+        executor.release.clear()
+        first = asyncio.ensure_future(offloader.validate(tx))
+        second = asyncio.ensure_future(offloader.validate(tx))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        executor.release.set()
+        return first, await second
+
+    first, result = run(validate_and_cancel())
+    assert first.cancelled()
+    assert result is True
+    assert executor.calls['_validate_transaction'] == 1
+
+
+def test_module_coroutines(executor, utx, user_priv):
+    from bigchaindb_common import aio
+    from bigchaindb_common.util import serialize
+
+    offloader = aio._offloader
+    try:
+        assert aio.configure(executor, max_in_flight=1) is aio._offloader
+        tx = run(aio.sign(utx, [user_priv]))
+        assert run(aio.validate(tx)) is True
+        assert run(aio.parse(serialize(tx.to_dict()))) == tx
+        assert executor.calls == Counter({
+            '_prepare_signing': 1,
+            '_sign_fulfillments': 1,
+            '_prepare_validation': 1,
+            '_validate_transaction': 1,
+            'from_json': 1,
+        })
+    finally:
+        aio._offloader = offloader
+
+
+def test_offloader_on_process_pool(tx, transfer_utx, user_priv):
+    from concurrent.futures import ProcessPoolExecutor
+    from bigchaindb_common.aio import Offloader
+    from bigchaindb_common.util import serialize
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        offloader = Offloader(executor)
+
+        async def parse_sign_validate():
+            parsed = await offloader.parse(serialize(tx.to_dict()))
+            await offloader.sign(transfer_utx, [user_priv])
+            return parsed, await offloader.validate(transfer_utx,
+                                                    parsed.conditions)
+
+        assert run(parse_sign_validate()) == (tx, True)
@@ -0,0 +1,50 @@
+from pytest import raises
+
+
+def test_spend_graph(tx, transfer_tx, user_pub, user_priv, user2_pub,
+                     user2_priv, user3_pub):
+    from bigchaindb_common.batch import SpendGraph
+    from bigchaindb_common.transaction import Transaction, TransactionLink
+
+    other_tx = Transaction.create([user_pub], [user_pub]).sign([user_priv])
+    other_tx.timestamp = '0'
+    other_tx.sign([user_priv])
+    second_transfer_tx = Transaction.transfer(transfer_tx.to_inputs(),
+                                              [user3_pub], tx.asset)
+    second_transfer_tx.sign([user2_priv])
+
+    graph = SpendGraph([second_transfer_tx, other_tx, transfer_tx, tx])
+
+    assert graph.dependencies == {
+        tx.id: set(),
+        other_tx.id: set(),
+        transfer_tx.id: {tx.id},
+        second_transfer_tx.id: {transfer_tx.id},
+    }
+    assert graph.external_inputs == set()
+    assert graph.groups == [[other_tx, tx], [transfer_tx],
+                            [second_transfer_tx]]
+    assert graph.order == [other_tx, tx, transfer_tx, second_transfer_tx]
+
+    graph = SpendGraph([second_transfer_tx, other_tx])
+    assert graph.external_inputs == {TransactionLink(transfer_tx.id, 0)}
+    assert graph.groups == [[second_transfer_tx, other_tx]]
+
+
+def test_spend_graph_with_double_spend(tx, transfer_tx, user_priv,
+                                       user3_pub):
+    from bigchaindb_common.batch import SpendGraph
+    from bigchaindb_common.exceptions import DoubleSpend
+    from bigchaindb_common.transaction import Transaction
+
+    double_spend = Transaction.transfer(tx.to_inputs(), [user3_pub], tx.asset)
+    double_spend.sign([user_priv])
+    with raises(DoubleSpend):
+        SpendGraph([tx, transfer_tx, double_spend])
+
+
+def test_spend_graph_with_duplicate_transaction(tx):
+    from bigchaindb_common.batch import SpendGraph
+
+    with raises(ValueError):
+        SpendGraph([tx, tx])
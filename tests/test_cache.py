@@ -0,0 +1,57 @@
+from pytest import raises
+
+
+def test_lru_cache_get_and_put():
+    from bigchaindb_common.cache import LRUCache
+
+    cache = LRUCache(2)
+    assert cache.get('a') is None
+    assert cache.get('a', 'default') == 'default'
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert len(cache) == 1
+    assert cache.stats() == {
+        'hits': 1,
+        'misses': 2,
+        'evictions': 0,
+        'size': 1,
+        'maxsize': 2,
+    }
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    from bigchaindb_common.cache import LRUCache
+
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+
+def test_lru_cache_clear():
+    from bigchaindb_common.cache import LRUCache
+
+    cache = LRUCache(1)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('b')
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats()['hits'] == cache.stats()['evictions'] == 0
+
+
+def test_lru_cache_with_invalid_maxsize():
+    from bigchaindb_common.cache import LRUCache
+
+    with raises(ValueError):
+        LRUCache(0)
+    with raises(ValueError):
+        LRUCache('1')
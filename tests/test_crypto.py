@@ -0,0 +1,33 @@
+from pytest import raises
+
+
+def test_keyring(user_priv, user_pub, user2_priv, user2_pub):
+    from bigchaindb_common.crypto import Keyring, SigningKey
+
+    keyring = Keyring([user_priv, user2_priv])
+
+    assert len(keyring) == 2
+    assert set(keyring) == {user_pub, user2_pub}
+    assert isinstance(keyring[user_pub], SigningKey)
+    assert keyring[user_pub].encode().decode() == user_priv
+    assert keyring.private_keys == [user_priv, user2_priv]
+    with raises(KeyError):
+        keyring['not a public key']
+
+
+def test_keyring_with_invalid_parameters(user_priv):
+    from bigchaindb_common.crypto import Keyring
+
+    with raises(TypeError):
+        Keyring(user_priv)
+    with raises(TypeError):
+        Keyring(None)
+
+
+def test_hash_bytes():
+    from bigchaindb_common.crypto import hash_bytes, hash_data
+    from bigchaindb_common.util import serialize, serialize_bytes
+
+    data = {'msg': 'über', 'nested': [1, 2.5, None]}
+    assert serialize_bytes(data) == serialize(data).encode()
+    assert hash_bytes(serialize_bytes(data)) == hash_data(serialize(data))
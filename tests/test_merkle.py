@@ -0,0 +1,106 @@
+from pytest import mark, raises
+
+
+def gen_tx_ids(count):
+    from bigchaindb_common.crypto import hash_data
+
+    return [hash_data(str(i)) for i in range(count)]
+
+
+def test_merkle_root_of_known_trees():
+    import sha3
+    from bigchaindb_common.merkle import MerkleTree
+
+    def sha3_256(data):
+        return sha3.sha3_256(data).digest()
+
+    leaves = [sha3_256(b'\x00' + tx_id.encode()) for tx_id in 'abc']
+    ab = sha3_256(b'\x01' + leaves[0] + leaves[1])
+
+    assert MerkleTree().root == sha3_256(b'').hex()
+    assert MerkleTree(['a']).root == leaves[0].hex()
+    assert MerkleTree(['a', 'b']).root == ab.hex()
+    assert MerkleTree(['a', 'b', 'c']).root == \
+        sha3_256(b'\x01' + ab + leaves[2]).hex()
+
+
+@mark.parametrize('count', [1, 2, 3, 5, 8, 13, 33])
+def test_merkle_proofs(count):
+    from bigchaindb_common.merkle import MerkleTree, verify_proof
+
+    tx_ids = gen_tx_ids(count)
+    tree = MerkleTree(tx_ids)
+
+    assert len(tree) == count
+    for tx_id in tx_ids:
+        proof = tree.proof(tx_id)
+        assert len(proof) <= count.bit_length()
+        assert verify_proof(tx_id, proof, tree.root)
+
+
+def test_merkle_tree_append_matches_bulk_build():
+    from bigchaindb_common.merkle import MerkleTree
+
+    tx_ids = gen_tx_ids(21)
+    tree = MerkleTree()
+    for index, tx_id in enumerate(tx_ids):
+        tree.append(tx_id)
+        assert tree.root == MerkleTree(tx_ids[:index + 1]).root
+
+    tree = MerkleTree(tx_ids[:5])
+    tree.extend(tx_ids[5:])
+    assert tree.root == MerkleTree(tx_ids).root
+
+
+def test_merkle_tree_from_iterator():
+    from bigchaindb_common.merkle import MerkleTree, verify_proof
+
+    tx_ids = gen_tx_ids(5)
+    tree = MerkleTree(tx_id for tx_id in tx_ids[:3])
+    tree.extend(iter(tx_ids[3:]))
+
+    assert len(tree) == 5
+    assert tree.root == MerkleTree(tx_ids).root
+    assert verify_proof(tx_ids[0], tree.proof(tx_ids[0]), tree.root)
+
+
+def test_merkle_tree_with_duplicate_tx_id():
+    from bigchaindb_common.merkle import MerkleTree
+
+    tree = MerkleTree(['a', 'b'])
+    root = tree.root
+    with raises(ValueError):
+        tree.extend(['c', 'a'])
+    with raises(ValueError):
+        tree.extend(['c', 'c'])
+    assert len(tree) == 2
+    assert 'c' not in tree
+    assert tree.root == root
+
+
+def test_merkle_proof_of_missing_tx_id():
+    from bigchaindb_common.merkle import MerkleTree
+
+    with raises(KeyError):
+        MerkleTree(['a']).proof('b')
+
+
+def test_invalid_merkle_proofs():
+    from bigchaindb_common.merkle import MerkleTree, verify_proof
+
+    tx_ids = gen_tx_ids(6)
+    tree = MerkleTree(tx_ids)
+    proof = tree.proof(tx_ids[2])
+
+    assert not verify_proof(tx_ids[3], proof, tree.root)
+    assert not verify_proof(tx_ids[2], proof[:-1], tree.root)
+    assert not verify_proof(tx_ids[2], proof, MerkleTree(tx_ids[:5]).root)
+
+    swapped = [dict(step) for step in proof]
+    swapped[0]['position'] = 'left'
+    assert not verify_proof(tx_ids[2], swapped, tree.root)
+
+    for step in ({'position': 'up', 'hash': proof[0]['hash']},
+                 {'position': 'left', 'hash': 'not hex'},
+                 {'position': 'left'}, None):
+        assert not verify_proof(tx_ids[2], [step] + proof[1:], tree.root)
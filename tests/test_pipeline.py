@@ -0,0 +1,296 @@
+import asyncio
+
+from pytest import raises
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_pipeline_requires_known_stages_and_positive_sizes():
+    from bigchaindb_common.pipeline import Pipeline
+
+    with raises(ValueError):
+        Pipeline(concurrency={'signature': 2})
+    with raises(ValueError):
+        Pipeline(queue_size={'id': 0})
+
+
+def test_process_accepts_valid_transactions(tx, transfer_tx):
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.util import serialize
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx])
+    pipeline = Pipeline(utxos.get_condition)
+    payloads = [serialize(tx.to_dict()), serialize(transfer_tx.to_dict())]
+
+    results = list(pipeline.process(payloads))
+
+    assert [result.accepted for result in results] == [True, True]
+    assert [result.raw for result in results] == payloads
+    assert [result.transaction for result in results] == [tx, transfer_tx]
+    assert results[0].stage is None and results[0].reason is None
+    for stats in pipeline.stats.values():
+        assert stats.processed == 2
+        assert stats.rejected == 0
+        assert stats.mean_latency > 0
+        assert stats.throughput > 0
+
+
+def test_process_rejects_with_reason(tx, transfer_tx, user_pub, user_priv):
+    from copy import deepcopy
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.util import serialize
+
+    invalid_uri = deepcopy(tx.to_dict())
+    invalid_uri['transaction']['fulfillments'][0]['fulfillment'] = 'cf:x'
+    tampered = deepcopy(tx.to_dict())
+    tampered['transaction']['timestamp'] = '0'
+    count_mismatch = deepcopy(tx.to_dict())
+    count_mismatch['transaction']['conditions'] = []
+    del count_mismatch['id']
+    count_mismatch['id'] = Transaction._to_hash(Transaction._to_str(
+        Transaction._remove_signatures(count_mismatch)))
+    other_tx = Transaction.create([user_pub], [user_pub]).sign([user_priv])
+    wrong_signature = deepcopy(tx.to_dict())
+    wrong_signature['transaction']['fulfillments'][0]['fulfillment'] = \
+        other_tx.fulfillments[0].fulfillment.serialize_uri()
+
+    payloads = {
+        'deserialize': ['{"id": ', None],
+        'id': [serialize(tampered), '[]', '{"id": "a"}'],
+        'structure': [serialize(invalid_uri), serialize(count_mismatch)],
+        'fulfillments': [serialize(wrong_signature),
+                         serialize(transfer_tx.to_dict())],
+    }
+    pipeline = Pipeline()
+    results = list(pipeline.process(raw for stage in payloads
+                                    for raw in payloads[stage]))
+
+    assert not any(result.accepted for result in results)
+    assert all(result.transaction is None for result in results)
+    assert all(result.reason for result in results)
+    for stage, raws in payloads.items():
+        assert [result.raw for result in results
+                if result.stage == stage] == raws
+        assert pipeline.stats[stage].rejected == len(raws)
+
+    reasons = {result.raw: result.reason for result in results}
+    assert reasons[serialize(tampered)] == 'InvalidHash'
+    assert reasons[serialize(wrong_signature)] == \
+        'InvalidSignature: Fulfillments are not valid'
+    assert 'not accepted' in reasons[serialize(transfer_tx.to_dict())]
+    assert pipeline.stats['deserialize'].processed == 9
+    assert pipeline.stats['fulfillments'].processed == 2
+
+
+def test_process_rejects_malformed_payloads(tx, transfer_tx, user_ffill,
+                                            user_user2_threshold_cond,
+                                            user_priv):
+    from copy import deepcopy
+    from cryptoconditions import PreimageSha256Fulfillment
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.transaction import Asset, Condition, Transaction
+    from bigchaindb_common.util import serialize
+
+    threshold_tx = Transaction(Transaction.CREATE, Asset(), [user_ffill],
+                               [user_user2_threshold_cond]).sign([user_priv])
+    hashlock = Condition(PreimageSha256Fulfillment(preimage=b'secret')
+                         .condition_uri, amount=1)
+
+    def rehash(tx_dict):
+        tx_dict = dict(tx_dict)
+        del tx_dict['id']
+        tx_dict['id'] = Transaction._to_hash(Transaction._to_str(
+            Transaction._remove_signatures(tx_dict)))
+        return tx_dict
+
+    def malformed(tx_, *path_and_value):
+        tx_dict = deepcopy(tx_.to_dict())
+        *path, key, value = path_and_value
+        target = tx_dict
+        for step in path:
+            target = target[step]
+        target[key] = value
+        return serialize(rehash(tx_dict))
+
+    payloads = {
+        'id': [
+            '{"id": 1, "transaction": {}}',
+            '{"id": "a", "transaction": {"fulfillments": {}}}',
+            '{"id": "a", "transaction": {"fulfillments": [1]}}',
+        ],
+        'structure': [
+            malformed(tx, 'version', '1'),
+            malformed(tx, 'transaction', 'conditions', None),
+            malformed(tx, 'transaction', 'fulfillments', 0, 'owners_before',
+                      'a'),
+            malformed(transfer_tx, 'transaction', 'fulfillments', 0, 'input',
+                      {'txid': tx.id}),
+            malformed(tx, 'transaction', 'conditions', 0, 'condition', []),
+            malformed(tx, 'transaction', 'conditions', 0, 'condition',
+                      'details', {'type_id': 4}),
+            malformed(tx, 'transaction', 'fulfillments', 0, 'fulfillment',
+                      'cf:4:'),
+            malformed(tx, 'transaction', 'asset', 'divisible', 'no'),
+            malformed(tx, 'transaction', 'metadata', {'data': {}}),
+            malformed(threshold_tx, 'transaction', 'conditions', 0,
+                      'condition', 'details', 'threshold', '1'),
+            malformed(tx, 'transaction', 'fulfillments', 0, 'fulfillment',
+                      {'type_id': 2, 'threshold': 1, 'subfulfillments': []}),
+        ],
+        # NOTE: Spends a hashlock Condition
+        'fulfillments': [serialize(transfer_tx.to_dict())],
+    }
+    pipeline = Pipeline(lambda tx_input: hashlock)
+    results = list(pipeline.process(raw for stage in payloads
+                                    for raw in payloads[stage]))
+
+    for stage, raws in payloads.items():
+        assert [result.raw for result in results
+                if result.stage == stage] == raws
+    reasons = [result.reason for result in results]
+    assert reasons[0] == 'ValueError: `Transaction.id` has an invalid type'
+    assert reasons[3] == \
+        'ValueError: `Transaction.version` has an invalid type'
+    assert reasons[8] == 'InvalidSignature: Fulfillment details ' \
+                         "couldn't be parsed"
+    assert reasons[11] == 'ValueError: `metadata` is missing `id`'
+    assert reasons[12] == "InvalidSignature: Condition URI couldn't be " \
+                          'computed'
+    assert reasons[13] == "InvalidSignature: Fulfillment URI couldn't be " \
+                          'computed'
+    assert reasons[14] == 'InvalidSignature: Fulfillments are not valid'
+
+
+def test_process_raises_unexpected_errors_of_stages(monkeypatch, tx):
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.util import serialize
+
+    def from_verified_dict(tx_body, copy_values=True):
+        raise TypeError('a bug')
+
+    monkeypatch.setattr(Transaction, '_from_verified_dict',
+                        from_verified_dict)
+    with raises(TypeError):
+        list(Pipeline().process([serialize(tx.to_dict())]))
+
+
+def test_process_rejects_unavailable_inputs(tx, transfer_tx):
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.util import serialize
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    pipeline = Pipeline(UnspentOutputs().get_condition)
+    result, = pipeline.process([serialize(transfer_tx.to_dict())])
+
+    assert result.stage == 'fulfillments'
+    assert result.reason.startswith('ValueError: Input ')
+
+
+def test_process_async_with_async_source_and_lookup(tx, transfer_tx):
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.util import serialize
+
+    async def input_lookup(link):
+        await asyncio.sleep(0)
+        return tx.conditions[link.cid] if link.txid == tx.id else None
+
+    async def payloads():
+        for tx_ in (tx, transfer_tx):
+            yield serialize(tx_.to_dict())
+
+    async def collect():
+        pipeline = Pipeline(input_lookup)
+        return [result async for result in pipeline.process_async(payloads())]
+
+    results = run(collect())
+    assert sorted(result.transaction.id for result in results) == \
+        sorted([tx.id, transfer_tx.id])
+
+
+def test_process_with_concurrency_bounds_buffered_payloads(user_pub,
+                                                           user_priv):
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.util import serialize
+
+    raw = [serialize(Transaction.create([user_pub], [user_pub])
+                     .sign([user_priv]).to_dict()) for _ in range(8)]
+    pulled = []
+
+    def payloads():
+        for index in range(100):
+            pulled.append(index)
+            yield raw[index % len(raw)]
+
+    pipeline = Pipeline(concurrency={'fulfillments': 2},
+                        queue_size=dict.fromkeys(['deserialize', 'id',
+                                                  'structure',
+                                                  'fulfillments'], 1))
+    results = pipeline.process(payloads())
+    assert next(results).accepted
+    # NOTE: Every stage holds at most one queued payload and one payload per
+    #       worker
+    assert len(pulled) < 15
+
+    assert sum(result.accepted for result in results) == 99
+    assert len(pulled) == 100
+    assert pipeline.stats['fulfillments'].processed == 100
+
+
+def test_process_raises_unexpected_errors(tx, transfer_tx):
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.util import serialize
+
+    def input_lookup(link):
+        raise RuntimeError('database is down')
+
+    pipeline = Pipeline(input_lookup)
+    with raises(RuntimeError):
+        list(pipeline.process([serialize(tx.to_dict()),
+                               serialize(transfer_tx.to_dict())]))
+
+
+def test_process_on_process_pool(tx):
+    from concurrent.futures import ProcessPoolExecutor
+    from bigchaindb_common.pipeline import Pipeline
+    from bigchaindb_common.util import serialize
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        pipeline = Pipeline(executor=executor)
+        result, = pipeline.process([serialize(tx.to_dict())])
+
+    assert result.transaction == tx
+
+
+def test_stage_stats():
+    from bigchaindb_common.pipeline import StageStats
+
+    stats = StageStats()
+    assert stats.to_dict() == {
+        'processed': 0,
+        'rejected': 0,
+        'busy_time': 0.0,
+        'mean_latency': 0.0,
+        'max_latency': 0.0,
+        'throughput': 0.0,
+    }
+
+    stats.record(0.0, 1.0, 2.0)
+    stats.record(1.0, 2.0, 4.0, rejected=True)
+    assert stats.to_dict() == {
+        'processed': 2,
+        'rejected': 1,
+        'busy_time': 3.0,
+        'mean_latency': 2.5,
+        'max_latency': 3.0,
+        'throughput': 2 / 3,
+    }
@@ -0,0 +1,116 @@
+"""Conformance of the JSON backends to the canonical serialization.
+
+Transaction ids are hashes of serialized Transactions. Every backend must
+hence produce byte-identical output to the reference `rapidjson` backend.
+"""
+import pytest
+
+from bigchaindb_common.util import CONFORMANCE_CORPUS as CORPUS
+from bigchaindb_common.util import SERIALIZERS
+
+
+# NOTE: Cases a backend is known to serialize differently. They are kept in
+#       the corpus, so that an upgraded backend fixing them is noticed.
+DIVERGENCES = {
+    ('orjson', 'exponent floats'): 'orjson omits the `+` of exponents',
+    ('orjson', 'big integers'): 'orjson only serializes 64 bit integers',
+}
+
+
+def gen_conformance_cases():
+    for backend in sorted(SERIALIZERS):
+        for case in sorted(CORPUS):
+            reason = DIVERGENCES.get((backend, case))
+            marks = [pytest.mark.xfail(reason=reason, strict=True)] \
+                if reason else []
+            yield pytest.param(backend, case, marks=marks,
+                               id='{}-{}'.format(backend, case))
+
+
+@pytest.fixture(params=sorted(SERIALIZERS))
+def backend(request):
+    from bigchaindb_common.util import current_serializer, use_serializer
+
+    previous = current_serializer()
+    use_serializer(request.param, unsafe=True)
+    yield request.param
+    use_serializer(previous)
+
+
+@pytest.mark.parametrize('name,case', list(gen_conformance_cases()))
+def test_serializer_conformance(name, case):
+    reference = SERIALIZERS['rapidjson']
+    serializer = SERIALIZERS[name]
+    data = {'metadata': CORPUS[case]}
+
+    expected = reference.dumps(data)
+    assert serializer.dumps(data) == expected
+    assert serializer.dumps_bytes(data) == expected.encode()
+    assert serializer.loads(expected) == reference.loads(expected)
+    assert serializer.loads(expected.encode()) == reference.loads(expected)
+
+
+def test_transaction_conformance(backend, tx, transfer_tx, user_cond,
+                                 user_pub, user_priv):
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.util import deserialize, serialize
+
+    metadata = {case: data for case, data in CORPUS.items()
+                if (backend, case) not in DIVERGENCES}
+    metadata_tx = Transaction.create([user_pub], [user_pub], metadata)
+    metadata_tx.sign([user_priv])
+
+    for expected_tx in (tx, transfer_tx, metadata_tx):
+        expected = SERIALIZERS['rapidjson'].dumps(expected_tx.to_dict())
+        assert serialize(expected_tx.to_dict()) == expected
+
+        parsed_tx = Transaction.from_dict(deserialize(expected))
+        assert parsed_tx.id == expected_tx.id
+        assert list(parsed_tx._gen_partial_messages()) == \
+            list(expected_tx._gen_partial_messages())
+
+    assert Transaction.from_json(serialize(transfer_tx.to_dict())) \
+        .fulfillments_valid([user_cond])
+
+
+def test_use_serializer():
+    from bigchaindb_common.util import current_serializer, use_serializer
+
+    assert current_serializer() == 'rapidjson'
+    with pytest.raises(ValueError):
+        use_serializer('unknown')
+    assert current_serializer() == 'rapidjson'
+
+
+def test_use_serializer_refuses_nonconformant_backends():
+    from bigchaindb_common import util
+
+    reference = util.SERIALIZERS['rapidjson']
+    util.register_serializer('lossy', lambda data: reference.dumps(data)
+                             .replace('+', ''), reference.loads)
+    try:
+        assert util.serializer_conforms('rapidjson') is True
+        assert util.serializer_conforms('json') is True
+        assert util.serializer_conforms('lossy') is False
+        with pytest.raises(ValueError):
+            util.use_serializer('lossy')
+        assert util.current_serializer() == 'rapidjson'
+
+        util.use_serializer('lossy', unsafe=True)
+        assert util.current_serializer() == 'lossy'
+    finally:
+        util.use_serializer('rapidjson')
+        del util.SERIALIZERS['lossy']
+        util._conformance.pop('lossy', None)
+
+
+@pytest.mark.skipif('orjson' not in SERIALIZERS,
+                    reason='orjson is not installed')
+def test_use_serializer_refuses_orjson():
+    from bigchaindb_common.util import (current_serializer,
+                                        serializer_conforms, use_serializer)
+
+    assert serializer_conforms('orjson') is False
+    with pytest.raises(ValueError):
+        use_serializer('orjson')
+    assert current_serializer() == 'rapidjson'
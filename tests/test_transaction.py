@@ -53,6 +53,11 @@ def test_fulfillment_deserialization_with_invalid_fulfillment_uri(user_pub):
     with raises(InvalidSignature):
         Fulfillment.from_dict(ffill)
 
+    for fulfillment in ('cf:4:', {'type_id': 4}):
+        ffill['fulfillment'] = fulfillment
+        with raises(InvalidSignature):
+            Fulfillment.from_dict(ffill)
+
 
 def test_fulfillment_deserialization_with_unsigned_fulfillment(ffill_uri,
                                                                user_pub):
@@ -104,6 +109,24 @@ def test_condition_deserialization(user_Ed25519, user_pub):
     assert cond == expected
 
 
+def test_condition_deserialization_with_invalid_details(user_Ed25519,
+                                                        user_pub):
+    from bigchaindb_common.exceptions import InvalidSignature
+    from bigchaindb_common.transaction import Condition
+
+    for details in ({}, {'type_id': 4}, {'type_id': 0, 'preimage': 1}):
+        cond = {
+            'condition': {
+                'uri': user_Ed25519.condition_uri,
+                'details': details,
+            },
+            'owners_after': [user_pub],
+            'amount': 1,
+        }
+        with raises(InvalidSignature):
+            Condition.from_dict(cond)
+
+
 def test_condition_hashlock_serialization():
     from bigchaindb_common.transaction import Condition
     from cryptoconditions import PreimageSha256Fulfillment
@@ -573,8 +596,7 @@ def test_invoke_simple_signature_fulfillment_with_invalid_params(utx,
     with raises(KeypairMismatchException):
         invalid_key_pair = {'wrong_pub_key': 'wrong_priv_key'}
         utx._sign_simple_signature_fulfillment(user_ffill,
-                                               0,
-                                               'somemessage',
+                                               b'somemessage',
                                                invalid_key_pair)
 
 
@@ -584,14 +606,12 @@ def test_sign_threshold_with_invalid_params(utx, user_user2_threshold_ffill,
 
     with raises(KeypairMismatchException):
         utx._sign_threshold_signature_fulfillment(user_user2_threshold_ffill,
-                                                  0,
-                                                  'somemessage',
+                                                  b'somemessage',
                                                   {user3_pub: user3_priv})
     with raises(KeypairMismatchException):
         user_user2_threshold_ffill.owners_before = ['somewrongvalue']
         utx._sign_threshold_signature_fulfillment(user_user2_threshold_ffill,
-                                                  0,
-                                                  'somemessage',
+                                                  b'somemessage',
                                                   None)
 
 
@@ -1104,3 +1124,703 @@ def test_cant_add_empty_fulfillment():
     tx = Transaction(Transaction.CREATE, None)
     with raises(TypeError):
         tx.add_fulfillment(None)
+
+
+def test_transaction_id_is_cached(utx, monkeypatch):
+    from bigchaindb_common.transaction import Transaction
+
+    calls = []
+    to_hash = Transaction._to_hash
+
+    def counting_to_hash(value):
+        calls.append(value)
+        return to_hash(value)
+
+    monkeypatch.setattr(Transaction, '_to_hash',
+                        staticmethod(counting_to_hash))
+    tx_id = utx.id
+    assert utx.id == tx_id
+    assert len(utx.to_inputs()) == 1
+    assert len(calls) == 1
+
+    # NOTE: `to_dict` always computes the id again
+    assert utx.to_dict()['id'] == tx_id
+    assert len(calls) == 2
+
+
+@mark.parametrize('reverse_slots', [False, True])
+def test_copies_keep_cached_ids_and_uris(user_pub, user_priv, monkeypatch,
+                                         reverse_slots):
+    import pickle
+    from copy import copy, deepcopy
+    from bigchaindb_common.transaction import (Transaction, Fulfillment,
+                                               Condition)
+
+    if reverse_slots:
+        # NOTE: `copyreg` caches the slots' names in `__slotnames__`
+        for cls in (Transaction, Fulfillment, Condition):
+            monkeypatch.setattr(cls, '__slots__', cls.__slots__[::-1])
+            monkeypatch.setattr(cls, '__slotnames__',
+                                list(cls.__slots__), raising=False)
+
+    # NOTE: Generated Conditions and parsed Fulfillments cache their URIs
+    created_tx = Transaction.create([user_pub], [user_pub]).sign([user_priv])
+    parsed_tx = Transaction.from_dict(created_tx.to_dict())
+    assert created_tx.conditions[0]._uri is not None
+    assert parsed_tx.fulfillments[0]._uri is not None
+
+    for tx in (created_tx, parsed_tx):
+        tx_id = tx.id
+        for copied in (copy(tx), deepcopy(tx),
+                       pickle.loads(pickle.dumps(tx))):
+            assert copied._id == tx_id
+            assert copied.conditions[0]._uri == tx.conditions[0]._uri
+            assert copied.fulfillments[0]._uri == tx.fulfillments[0]._uri
+            assert copied == tx
+
+
+def test_transaction_id_cache_invalidation(utx, user_priv, user2_cond,
+                                           user2_ffill):
+    tx_id = utx.id
+    utx.sign([user_priv])
+    assert utx.id == tx_id
+
+    utx.add_condition(user2_cond)
+    assert utx.id != tx_id
+    tx_id = utx.id
+
+    utx.add_fulfillment(user2_ffill)
+    assert utx.id != tx_id
+    tx_id = utx.id
+
+    utx.timestamp = '1'
+    assert utx.id != tx_id
+    assert utx.id == utx.to_dict()['id']
+
+
+def test_transaction_to_dict_reflects_changes_to_nested_objects(tx,
+                                                                user2_cond):
+    from copy import deepcopy
+    from bigchaindb_common.transaction import Transaction, Metadata
+
+    changed_tx = deepcopy(tx)
+    changed_tx.metadata = Metadata({'changed': False})
+    tx_id = changed_tx.id
+    changed_tx.metadata.data['changed'] = True
+    changed_tx.conditions.append(user2_cond)
+    changed_tx.asset.data = {'changed': True}
+
+    assert changed_tx != tx
+    tx_dict = changed_tx.to_dict()
+    assert tx_dict['id'] != tx_id
+    assert changed_tx.id == tx_dict['id']
+    assert Transaction.from_dict(tx_dict) == changed_tx
+
+
+def test_partial_messages_match_serialized_partial_transactions(
+        user_ffill, user_cond, user_user2_threshold_ffill,
+        user_user2_threshold_cond, user_priv, user2_priv, data):
+    from bigchaindb_common.transaction import (Transaction, TransactionLink,
+                                               Metadata, Asset)
+
+    user_ffill.tx_input = TransactionLink('a transaction id', 0)
+    tx = Transaction(Transaction.TRANSFER, Asset(),
+                     [user_ffill, user_user2_threshold_ffill],
+                     [user_cond, user_user2_threshold_cond],
+                     Metadata({'msg': 'über', 'nested': [1, 2.5, None]}))
+
+    def expected_messages(tx):
+        for ffill, cond in zip(tx.fulfillments, tx.conditions):
+            tx_partial = Transaction(tx.operation, tx.asset, [ffill], [cond],
+                                     tx.metadata, tx.timestamp, tx.version)
+            yield str(tx_partial).encode()
+
+    assert list(tx._gen_partial_messages()) == list(expected_messages(tx))
+    tx.sign([user_priv, user2_priv])
+    assert list(tx._gen_partial_messages()) == list(expected_messages(tx))
+
+
+def test_validate_many(tx, transfer_tx):
+    from copy import deepcopy
+    from bigchaindb_common.transaction import validate_many
+
+    tampered_tx = deepcopy(transfer_tx)
+    tampered_tx.timestamp = '0'
+
+    def input_lookup(tx_input):
+        assert tx_input.txid == tx.id
+        return tx.conditions[tx_input.cid]
+
+    transactions = [tx, transfer_tx, tampered_tx, tx]
+    assert validate_many(transactions, input_lookup, workers=2,
+                         chunksize=1) == [True, True, False, True]
+
+
+def test_validate_many_with_unavailable_inputs(tx, transfer_tx):
+    from bigchaindb_common.transaction import validate_many
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs()
+    assert validate_many([tx, transfer_tx, tx], utxos.get_condition,
+                         workers=1) == [True, False, True]
+
+
+def test_validate_many_with_hashlock_inputs(tx, transfer_tx):
+    from cryptoconditions import PreimageSha256Fulfillment
+    from bigchaindb_common.transaction import Condition, validate_many
+
+    hashlock = PreimageSha256Fulfillment(preimage=b'secret').condition_uri
+
+    def input_lookup(tx_input):
+        return Condition(hashlock, amount=1)
+
+    assert transfer_tx.fulfillments_valid([Condition(hashlock)]) is False
+    assert validate_many([tx, transfer_tx, tx], input_lookup,
+                         workers=1) == [True, False, True]
+
+
+def test_validate_payload_rejects_unparsable_transactions(tx, transfer_tx):
+    from bigchaindb_common.transaction import (_to_validation_payload,
+                                               _validate_payload)
+    from bigchaindb_common.util import deserialize, serialize
+
+    tx_dict = deserialize(_to_validation_payload(tx)[0])
+    tx_dict['transaction']['fulfillments'][0]['fulfillment'] = 'cf:x'
+    assert _validate_payload((serialize(tx_dict), 'null')) is False
+    tx_dict['id'] = 'a' * 64
+    assert _validate_payload((serialize(tx_dict), 'null')) is False
+
+    # NOTE: A `TRANSFER` Transaction spending too few Conditions
+    transfer_payload = _to_validation_payload(transfer_tx,
+                                              lambda link: tx.conditions[0])
+    assert _validate_payload(transfer_payload) is True
+    assert _validate_payload((transfer_payload[0], '[]')) is False
+
+
+def test_validate_many_with_executor(tx):
+    from concurrent.futures import ThreadPoolExecutor
+    from bigchaindb_common.transaction import validate_many
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert validate_many([tx], executor=executor) == [True]
+
+
+def test_fulfillments_valid_with_verification_cache(tx, transfer_tx,
+                                                    monkeypatch):
+    from copy import deepcopy
+    from bigchaindb_common.cache import LRUCache
+    from bigchaindb_common.transaction import Transaction
+
+    cache = LRUCache(1)
+    monkeypatch.setattr(Transaction, 'VERIFICATION_CACHE', cache)
+
+    assert tx.fulfillments_valid() is True
+    assert cache.stats()['misses'] == 1
+    assert tx.fulfillments_valid() is True
+    assert cache.hits == 1
+
+    tampered_tx = deepcopy(tx)
+    tampered_tx.timestamp = '0'
+    assert tampered_tx.fulfillments_valid() is False
+    assert len(cache) == 1
+
+    assert transfer_tx.fulfillments_valid([tx.conditions[0]]) is True
+    assert cache.evictions == 1
+    assert transfer_tx.fulfillments_valid(transfer_tx.conditions) is False
+
+
+def test_fulfillment_keeps_parsed_uri(tx, monkeypatch):
+    from cryptoconditions import Fulfillment as CCFulfillment
+    from bigchaindb_common.transaction import Fulfillment
+
+    ffill_dict = tx.fulfillments[0].to_dict()
+    ffill = Fulfillment.from_dict(ffill_dict)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('fulfillment was encoded or parsed again')
+
+    monkeypatch.setattr(type(ffill.fulfillment), 'serialize_uri', fail)
+    monkeypatch.setattr(CCFulfillment, 'from_uri', fail)
+    assert ffill.serialize_uri() == ffill_dict['fulfillment']
+    assert ffill.to_dict() == ffill_dict
+
+
+def test_validate_parsed_transaction_without_parsing_again(tx, monkeypatch):
+    from cryptoconditions import Fulfillment as CCFulfillment
+    from bigchaindb_common.transaction import Transaction
+
+    parsed_tx = Transaction.from_dict(tx.to_dict())
+
+    def fail(*args, **kwargs):
+        raise AssertionError('fulfillment was parsed again')
+
+    monkeypatch.setattr(CCFulfillment, 'from_uri', fail)
+    assert parsed_tx.fulfillments_valid() is True
+
+
+def test_fulfillment_uri_is_reset(tx, user_priv, user2_Ed25519):
+    from bigchaindb_common.transaction import Transaction
+
+    parsed_tx = Transaction.from_dict(tx.to_dict())
+    parsed_tx.timestamp = '0'
+    parsed_tx.sign([user_priv])
+    assert parsed_tx.fulfillments[0].serialize_uri() != \
+        tx.fulfillments[0].serialize_uri()
+    assert parsed_tx.fulfillments_valid() is True
+
+    ffill = parsed_tx.fulfillments[0]
+    ffill.fulfillment = user2_Ed25519
+    assert ffill.to_dict()['fulfillment'] == user2_Ed25519.to_dict()
+
+
+def test_sign_with_keyring(utx, transfer_utx, user_priv, user2_priv):
+    from bigchaindb_common.crypto import Keyring
+
+    keyring = Keyring([user_priv, user2_priv])
+    tx = utx.sign(keyring)
+    assert tx.fulfillments_valid() is True
+    transfer_tx = transfer_utx.sign(keyring)
+    assert transfer_tx.fulfillments_valid([tx.conditions[0]]) is True
+
+
+def test_lazy_transaction(transfer_tx, monkeypatch):
+    from cryptoconditions import Fulfillment as CCFulfillment
+    from bigchaindb_common.transaction import (LazyTransaction, Transaction,
+                                               TransactionLink)
+    from bigchaindb_common.util import serialize
+
+    tx_dict = transfer_tx.to_dict()
+    from_uri = CCFulfillment.from_uri
+
+    def fail(*args, **kwargs):
+        raise AssertionError('fulfillment was parsed')
+
+    monkeypatch.setattr(CCFulfillment, 'from_uri', fail)
+    lazy_tx = LazyTransaction(serialize(tx_dict))
+    assert lazy_tx.id == transfer_tx.id
+    assert lazy_tx.operation == Transaction.TRANSFER
+    assert lazy_tx.version == transfer_tx.version
+    assert lazy_tx.timestamp == transfer_tx.timestamp
+    assert lazy_tx.metadata.to_dict() is None
+    assert lazy_tx.conditions == transfer_tx.conditions
+    assert lazy_tx.tx_inputs == [transfer_tx.fulfillments[0].tx_input]
+    assert isinstance(lazy_tx.tx_inputs[0], TransactionLink)
+    assert lazy_tx.to_dict() == tx_dict
+
+    monkeypatch.setattr(CCFulfillment, 'from_uri', from_uri)
+    assert lazy_tx.fulfillments == transfer_tx.fulfillments
+    assert lazy_tx.fulfillments is lazy_tx.fulfillments
+    assert lazy_tx.to_transaction() == transfer_tx
+
+
+def test_lazy_transaction_from_bytes(transfer_tx):
+    from bigchaindb_common.transaction import LazyTransaction
+    from bigchaindb_common.util import serialize_bytes
+
+    lazy_tx = LazyTransaction(serialize_bytes(transfer_tx.to_dict()))
+    assert lazy_tx.id == transfer_tx.id
+    assert lazy_tx.to_transaction() == transfer_tx
+
+
+def test_lazy_transaction_is_not_changed_by_its_transactions(
+        tx, user2_cond, user_priv):
+    from bigchaindb_common.transaction import LazyTransaction
+
+    lazy_tx = LazyTransaction(tx.to_dict())
+    fulfillments = lazy_tx.fulfillments
+    conditions = lazy_tx.conditions
+
+    changed_tx = lazy_tx.to_transaction()
+    changed_tx.conditions.append(user2_cond)
+    changed_tx.sign([user_priv])
+
+    assert lazy_tx.fulfillments is fulfillments
+    assert lazy_tx.conditions is conditions
+    assert len(conditions) == 1
+    assert changed_tx.fulfillments[0] is not fulfillments[0]
+    assert fulfillments == tx.fulfillments
+    assert lazy_tx.to_transaction() == tx
+
+
+def test_lazy_transaction_validation(tx, transfer_tx):
+    from bigchaindb_common.transaction import LazyTransaction
+
+    assert LazyTransaction(tx.to_dict()).fulfillments_valid() is True
+    lazy_tx = LazyTransaction(transfer_tx.to_dict())
+    assert lazy_tx.fulfillments_valid([tx.conditions[0]]) is True
+
+
+def test_lazy_transaction_with_invalid_hash(utx):
+    from bigchaindb_common.exceptions import InvalidHash
+    from bigchaindb_common.transaction import LazyTransaction
+
+    utx_dict = utx.to_dict()
+    utx_dict['id'] = 'abc'
+    with raises(InvalidHash):
+        LazyTransaction(utx_dict)
+    utx_dict.pop('id')
+    with raises(InvalidHash):
+        LazyTransaction(utx_dict)
+
+
+def test_model_instances_have_no_dict(tx):
+    from bigchaindb_common.transaction import LazyTransaction, Metadata
+
+    objects = [tx, tx.fulfillments[0], tx.conditions[0], tx.asset,
+               Metadata(), tx.to_inputs()[0].tx_input,
+               LazyTransaction(tx.to_dict())]
+    for obj in objects:
+        assert not hasattr(obj, '__dict__')
+
+
+def test_transaction_link_value_semantics():
+    from bigchaindb_common.transaction import TransactionLink
+
+    assert TransactionLink('a', 0) == TransactionLink('a', 0)
+    assert TransactionLink('a', 0) != TransactionLink('a', 1)
+    assert TransactionLink('a', 0) != TransactionLink('b', 0)
+    assert TransactionLink('a', 0) != {'txid': 'a', 'cid': 0}
+    assert hash(TransactionLink('a', 0)) == hash(TransactionLink('a', 0))
+
+    links = {TransactionLink('a', 0), TransactionLink('a', 0),
+             TransactionLink('a', 1)}
+    assert links == {TransactionLink('a', 0), TransactionLink('a', 1)}
+    assert TransactionLink.from_dict({'txid': 'a', 'cid': 1}) in links
+
+
+def test_condition_value_semantics(user_cond, user2_cond, user_Ed25519,
+                                   user_pub):
+    from bigchaindb_common.transaction import Condition
+
+    assert user_cond == Condition.from_dict(user_cond.to_dict())
+    assert user_cond != user2_cond
+    assert user_cond != Condition(user_Ed25519, [user_pub], 2)
+    assert user_cond != 'invalid comparison'
+    assert user_cond.condition_uri == user_Ed25519.condition_uri
+    assert len({user_cond, Condition.from_dict(user_cond.to_dict()),
+                user2_cond}) == 2
+
+
+def test_fulfillment_comparison(tx, user_ffill):
+    from bigchaindb_common.transaction import Fulfillment
+
+    assert tx.fulfillments[0] == \
+        Fulfillment.from_dict(tx.fulfillments[0].to_dict())
+    assert tx.fulfillments[0] != user_ffill
+    assert user_ffill != 'invalid comparison'
+
+
+def test_transaction_value_semantics(tx, transfer_tx, user_ffill, user_cond):
+    from bigchaindb_common.transaction import Transaction
+
+    parsed_tx = Transaction.from_dict(tx.to_dict())
+    assert parsed_tx == tx
+    assert hash(parsed_tx) == hash(tx)
+    assert len({tx, parsed_tx, transfer_tx}) == 2
+    assert tx != 'invalid comparison'
+
+    unsigned_tx = Transaction(tx.operation, tx.asset, [user_ffill],
+                              [user_cond], tx.metadata, tx.timestamp,
+                              tx.version)
+    assert unsigned_tx.id == tx.id
+    assert unsigned_tx != tx
+
+
+def test_generate_conditions_from_cached_templates(monkeypatch, user_pub,
+                                                   user2_pub, user3_pub):
+    from bigchaindb_common.cache import LRUCache
+    from bigchaindb_common.transaction import Condition
+
+    monkeypatch.setattr(Condition, 'KEY_CACHE', LRUCache())
+    monkeypatch.setattr(Condition, 'TEMPLATE_CACHE', LRUCache())
+    owners_after = ([user_pub, ([user2_pub, user3_pub], 1)], 1)
+
+    cond = Condition.generate(owners_after)
+    cached_cond = Condition.generate(owners_after)
+    assert Condition.TEMPLATE_CACHE.stats()['hits'] == 1
+    assert Condition.KEY_CACHE.stats()['misses'] == 3
+
+    assert cached_cond == cond
+    assert cached_cond.to_dict() == cond.to_dict()
+    assert cached_cond.owners_after == cond.owners_after
+    assert cached_cond.fulfillment is not cond.fulfillment
+
+    monkeypatch.setattr(Condition, 'KEY_CACHE', None)
+    monkeypatch.setattr(Condition, 'TEMPLATE_CACHE', None)
+    assert Condition.generate(owners_after).to_dict() == cond.to_dict()
+
+
+def test_generate_conditions_with_cached_keys(monkeypatch, user_pub,
+                                              user2_pub):
+    from bigchaindb_common.cache import LRUCache
+    from bigchaindb_common.transaction import Condition, Transaction
+
+    monkeypatch.setattr(Condition, 'KEY_CACHE', LRUCache())
+    monkeypatch.setattr(Condition, 'TEMPLATE_CACHE', None)
+
+    tx = Transaction.create([user_pub], [user2_pub])
+    other_tx = Transaction.create([user2_pub], [user_pub])
+    assert Condition.KEY_CACHE.stats()['hits'] == 2
+    assert other_tx.conditions[0] == Condition.generate([user_pub])
+
+    cond = tx.conditions[0]
+    assert cond._uri == cond.fulfillment.condition_uri
+    cond.fulfillment = other_tx.conditions[0].fulfillment
+    assert cond._uri is None
+    assert cond.condition_uri == other_tx.conditions[0].condition_uri
+
+
+def test_fulfillment_validation_stages(monkeypatch, transfer_tx, user_cond,
+                                       user2_cond, user2_pub):
+    from collections import Counter
+    from copy import deepcopy
+    from cryptoconditions.crypto import Ed25519VerifyingKey
+    from bigchaindb_common.transaction import Transaction
+
+    def fail_verify(*args, **kwargs):
+        raise AssertionError('Signature must not be verified')
+
+    def rejections():
+        return {stage: count for stage, count
+                in Transaction.REJECTIONS.items() if count}
+
+    monkeypatch.setattr(Transaction, 'REJECTIONS', Counter())
+    monkeypatch.setattr(Ed25519VerifyingKey, 'verify', fail_verify)
+
+    unsigned_tx = deepcopy(transfer_tx)
+    unsigned_tx.fulfillments[0].fulfillment.signature = None
+    assert unsigned_tx.fulfillments_valid([user_cond]) is False
+    assert rejections() == {'structure': 1}
+
+    assert transfer_tx.fulfillments_valid([user2_cond]) is False
+    assert rejections() == {'structure': 1, 'condition': 1}
+
+    wrong_owner_tx = deepcopy(transfer_tx)
+    wrong_owner_tx.fulfillments[0].owners_before = [user2_pub]
+    assert wrong_owner_tx.fulfillments_valid([user_cond]) is False
+    assert rejections() == {'structure': 1, 'condition': 1, 'owners': 1}
+
+    monkeypatch.undo()
+    monkeypatch.setattr(Transaction, 'REJECTIONS', Counter())
+    forged_tx = deepcopy(transfer_tx)
+    ccffill = forged_tx.fulfillments[0].fulfillment
+    ccffill.signature = bytes(64)
+    assert forged_tx.fulfillments_valid([user_cond]) is False
+    assert rejections() == {'signature': 1}
+    assert transfer_tx.fulfillments_valid([user_cond]) is True
+
+
+def test_rejections_are_counted_across_threads(monkeypatch):
+    import sys
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+    from bigchaindb_common.transaction import Transaction
+
+    monkeypatch.setattr(Transaction, 'REJECTIONS', Counter())
+    # NOTE: Switch threads as often as possible, to provoke lost updates
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: [Transaction._reject('owners')
+                                         for _ in range(1000)], range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert Transaction.REJECTIONS == Counter({'owners': 8000})
+
+
+def test_remove_signatures_does_not_modify_input(transfer_tx):
+    from bigchaindb_common.transaction import Transaction
+
+    tx_dict = transfer_tx.to_dict()
+    fulfillment_uri = tx_dict['transaction']['fulfillments'][0]['fulfillment']
+    tx_no_signatures = Transaction._remove_signatures(tx_dict)
+
+    assert tx_no_signatures['transaction']['fulfillments'][0] == \
+        dict(tx_dict['transaction']['fulfillments'][0], fulfillment=None)
+    assert tx_dict['transaction']['fulfillments'][0]['fulfillment'] == \
+        fulfillment_uri
+    assert tx_no_signatures['transaction']['conditions'] is \
+        tx_dict['transaction']['conditions']
+
+
+def test_tx_serialization_from_json(transfer_tx):
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.util import serialize
+
+    tx_dict = transfer_tx.to_dict()
+    raw = serialize(tx_dict)
+
+    assert Transaction.from_json(raw) == transfer_tx
+    assert Transaction.from_json(raw.encode()) == transfer_tx
+    assert Transaction.from_dict(tx_dict) == transfer_tx
+    assert tx_dict == transfer_tx.to_dict()
+
+
+def test_from_dict_copies_mutable_values(user_pub, user2_pub, user3_pub):
+    from bigchaindb_common.transaction import Asset, Transaction
+
+    tx = Transaction.create([user_pub], [user2_pub, user3_pub],
+                            metadata={'a': 1}, asset=Asset({'b': [1]}))
+    tx_dict = tx.to_dict()
+    parsed = Transaction.from_dict(tx_dict)
+    tx_id = parsed.id
+
+    body = tx_dict['transaction']
+    body['metadata']['data']['a'] = 2
+    body['asset']['data']['b'].append(2)
+    body['fulfillments'][0]['owners_before'].append(user3_pub)
+    body['conditions'][0]['owners_after'].pop()
+
+    assert parsed.metadata.data == {'a': 1}
+    assert parsed.asset.data == {'b': [1]}
+    assert parsed.fulfillments[0].owners_before == [user_pub]
+    assert parsed.conditions[0].owners_after == [user2_pub, user3_pub]
+    parsed.timestamp = parsed.timestamp
+    assert parsed.id == tx_id == tx.id
+
+
+def test_signing_does_not_mutate_inputs(tx, user_priv, user2_priv,
+                                        user_user2_threshold_ffill,
+                                        user_user2_threshold_cond, user3_pub):
+    from bigchaindb_common.transaction import Transaction
+
+    inputs = tx.to_inputs()
+    transfer_tx = Transaction.transfer(inputs, [user3_pub], tx.asset)
+    assert transfer_tx.fulfillments[0] is not inputs[0]
+    assert transfer_tx.fulfillments[0] == inputs[0]
+
+    transfer_tx.sign([user_priv])
+    assert inputs[0].fulfillment.signature is None
+    assert tx.conditions[0].fulfillment.signature is None
+    assert transfer_tx.fulfillments_valid(tx.conditions)
+
+    threshold_tx = Transaction(Transaction.CREATE, tx.asset,
+                               [user_user2_threshold_ffill],
+                               [user_user2_threshold_cond])
+    threshold_tx.sign([user_priv, user2_priv])
+    assert threshold_tx.fulfillments[0] is not user_user2_threshold_ffill
+    for subcondition in \
+            user_user2_threshold_ffill.fulfillment.subconditions:
+        assert subcondition['body'].signature is None
+    for subcondition in user_user2_threshold_cond.fulfillment.subconditions:
+        assert subcondition['body'].signature is None
+    assert threshold_tx.fulfillments_valid()
+
+
+def test_create_many(user_pub, user2_pub, user3_pub, user_priv, data):
+    from bigchaindb_common.transaction import Asset, Transaction
+
+    asset = Asset(data)
+    specs = [([user_pub], [user2_pub]),
+             ([user_pub], [user2_pub, user3_pub], data),
+             ([user_pub], [user3_pub], None, asset)]
+    transactions = Transaction.create_many(specs)
+
+    assert len(transactions) == 3
+    assert len({tx.timestamp for tx in transactions}) == 1
+    assert transactions[0].conditions[0].owners_after == [user2_pub]
+    assert transactions[1].conditions[0].owners_after == \
+        [user2_pub, user3_pub]
+    assert transactions[1].metadata.data == data
+    assert transactions[2].asset is asset
+
+    assert Transaction.sign_many(transactions, [user_priv]) == transactions
+    assert all(tx.fulfillments_valid() for tx in transactions)
+
+
+def test_sign_many_on_process_pool(user_pub, user2_pub, user_priv):
+    from bigchaindb_common.transaction import Transaction
+
+    transactions = Transaction.create_many([([user_pub], [user2_pub]),
+                                            ([user_pub], [user_pub])])
+    signed = Transaction.sign_many(transactions, [user_priv], workers=2)
+
+    assert signed == transactions
+    assert all(tx.fulfillments_valid() for tx in transactions)
+
+
+def test_sign_many_transfers_with_executor(tx, user_pub, user2_pub,
+                                           user3_pub, user_priv, user2_priv,
+                                           user3_priv):
+    from concurrent.futures import ThreadPoolExecutor
+    from bigchaindb_common.crypto import Keyring
+    from bigchaindb_common.exceptions import KeypairMismatchException
+    from bigchaindb_common.transaction import Transaction
+
+    threshold_tx = Transaction.create([user_pub], [user2_pub, user3_pub])
+    threshold_tx.sign([user_priv])
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [user2_pub], tx.asset)
+    threshold_transfer_tx = Transaction.transfer(threshold_tx.to_inputs(),
+                                                 [user_pub], tx.asset)
+    create_tx = Transaction.create([user3_pub], [user3_pub])
+    transactions = [transfer_tx, threshold_transfer_tx, create_tx]
+    expected = [Transaction.from_dict(tx_.to_dict()).sign(
+                    [user_priv, user2_priv, user3_priv])
+                for tx_ in transactions]
+    keyring = Keyring([user_priv, user2_priv, user3_priv])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        signed = Transaction.sign_many(transactions, keyring,
+                                       executor=executor, chunksize=1)
+
+    assert signed == transactions
+    assert transactions == expected
+    assert transfer_tx.fulfillments_valid(tx.conditions)
+    assert threshold_transfer_tx.fulfillments_valid(threshold_tx.conditions)
+    assert create_tx.fulfillments_valid()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with raises(KeypairMismatchException):
+            Transaction.sign_many([Transaction.create([user_pub],
+                                                      [user_pub])],
+                                  [user2_priv], executor=executor)
+
+
+def test_signing_payload_is_compact(tx, user_pub, user_priv):
+    import pickle
+    from bigchaindb_common.transaction import (Transaction,
+                                               _sign_chunk,
+                                               _splice_partial_messages,
+                                               _to_signing_payload)
+    from bigchaindb_common.util import serialize_bytes
+
+    payload = _to_signing_payload(tx)
+    fulfillments, head, tail, pairs = payload
+    assert isinstance(fulfillments, bytes)
+    assert list(_splice_partial_messages(head, tail, pairs)) == \
+        list(tx._gen_partial_messages())
+    assert _sign_chunk(((user_priv,), [payload])) == \
+        [[tx.fulfillments[0].serialize_uri()]]
+
+    # NOTE: The asset and metadata are sent once, not once per Fulfillment
+    inputs = [Transaction.create([user_pub], [user_pub]).to_inputs()[0]
+              for _ in range(20)]
+    metadata = {'blob': 'x' * 100000}
+    transfer_tx = Transaction.transfer(inputs, [[user_pub]] * 20, tx.asset,
+                                       metadata)
+    payload = pickle.dumps(_to_signing_payload(transfer_tx))
+    assert payload.count(metadata['blob'].encode()) == 1
+    assert len(payload) < 2 * len(serialize_bytes(transfer_tx.to_dict()))
+
+
+def test_sign_many_sends_private_keys_once_per_chunk(user_pub, user_priv):
+    from concurrent.futures import ThreadPoolExecutor
+    from bigchaindb_common.transaction import Transaction
+
+    chunks = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def map(self, fn, *iterables, **kwargs):
+            chunks.extend(iterables[0])
+            return super().map(fn, chunks, **kwargs)
+
+    transactions = Transaction.create_many([([user_pub], [user_pub])] * 5)
+    with RecordingExecutor(max_workers=1) as executor:
+        Transaction.sign_many(transactions, [user_priv], executor=executor,
+                              chunksize=2)
+
+    assert [len(payloads) for _, payloads in chunks] == [2, 2, 1]
+    assert all(private_keys == (user_priv,) for private_keys, _ in chunks)
+    assert all(tx.fulfillments_valid() for tx in transactions)
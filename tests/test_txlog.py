@@ -0,0 +1,118 @@
+from pytest import raises
+
+
+def test_transaction_log_append_and_get(tmpdir, tx, transfer_tx):
+    from bigchaindb_common.txlog import TransactionLog
+    from bigchaindb_common.util import serialize
+
+    with TransactionLog(str(tmpdir)) as log:
+        log.append(tx)
+        log.append(transfer_tx)
+
+        assert len(log) == 2
+        assert tx.id in log
+        assert log.get(transfer_tx.id) == transfer_tx
+        assert bytes(log.get_raw(tx.id)) == serialize(tx.to_dict()).encode()
+        assert list(log) == [tx, transfer_tx]
+        with raises(KeyError):
+            log.get('missing')
+
+
+def test_transaction_log_rejects_duplicates(tmpdir, tx, transfer_tx):
+    from bigchaindb_common.txlog import TransactionLog
+
+    with TransactionLog(str(tmpdir)) as log:
+        log.append(tx)
+        with raises(ValueError):
+            log.extend([transfer_tx, tx])
+        assert list(log) == [tx, transfer_tx]
+
+
+def test_transaction_log_segments(tmpdir, tx, transfer_tx):
+    from bigchaindb_common.txlog import TransactionLog
+
+    with TransactionLog(str(tmpdir), segment_size=1) as log:
+        log.extend([tx, transfer_tx])
+        assert log.index[tx.id][0] == 0
+        assert log.index[transfer_tx.id][0] == 1
+        assert list(log) == [tx, transfer_tx]
+    assert sorted(tmpdir.listdir(fil='*.log')) == \
+        [tmpdir.join('00000000.log'), tmpdir.join('00000001.log')]
+
+
+def test_transaction_log_loads_index_lazily(tmpdir, tx, transfer_tx):
+    from bigchaindb_common.txlog import TransactionLog
+
+    with TransactionLog(str(tmpdir)) as log:
+        log.extend([tx, transfer_tx])
+        index = dict(log.index)
+
+    log = TransactionLog(str(tmpdir))
+    assert log._index is None
+    assert log.get(tx.id) == tx
+    assert log.index == index
+    log.close()
+
+
+def test_transaction_log_recovers_unindexed_records(tmpdir, tx, transfer_tx,
+                                                    user_pub, user2_pub):
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.txlog import TransactionLog
+
+    with TransactionLog(str(tmpdir)) as log:
+        log.extend([tx, transfer_tx])
+        index = dict(log.index)
+
+    # NOTE: Simulate a crash after the last record was written, before it
+    #       was indexed and before the next record was completely written
+    index_file = tmpdir.join('00000000.idx')
+    index_file.write(index_file.readlines()[0])
+    tmpdir.join('00000000.log').write('{"partial', mode='a')
+
+    with TransactionLog(str(tmpdir)) as log:
+        assert log.index == index
+        assert log.get(transfer_tx.id) == transfer_tx
+
+        other_tx = Transaction.create([user_pub], [user2_pub])
+        log.append(other_tx)
+        assert log.index[other_tx.id][0] == 1
+        assert list(log) == [tx, transfer_tx, other_tx]
+
+    with TransactionLog(str(tmpdir)) as log:
+        assert len(log) == 3
+
+
+def test_transaction_log_recovers_corrupt_index(tmpdir, tx, transfer_tx):
+    from bigchaindb_common.txlog import TransactionLog
+
+    with TransactionLog(str(tmpdir)) as log:
+        log.extend([tx, transfer_tx])
+        index = dict(log.index)
+
+    # NOTE: Simulate a crash while the index line of the last record was
+    #       written
+    index_file = tmpdir.join('00000000.idx')
+    lines = index_file.readlines()
+    index_file.write(lines[0] + 'deadbeef 12')
+
+    with TransactionLog(str(tmpdir)) as log:
+        assert log.index == index
+        assert 'deadbeef' not in log
+    assert index_file.readlines() == lines
+
+    # NOTE: An entry pointing beyond the end of the segment is not trusted
+    tx_id, offset, length = lines[1].split()
+    index_file.write(lines[0] + '{} {} {}\n'.format(tx_id, offset,
+                                                    int(length) + 100))
+
+    with TransactionLog(str(tmpdir)) as log:
+        assert log.index == index
+        assert log.get(transfer_tx.id) == transfer_tx
+    assert index_file.readlines() == lines
+
+
+def test_transaction_log_with_invalid_segment_size(tmpdir):
+    from bigchaindb_common.txlog import TransactionLog
+
+    with raises(ValueError):
+        TransactionLog(str(tmpdir), segment_size=0)
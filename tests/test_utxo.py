@@ -0,0 +1,106 @@
+from pytest import raises
+
+
+def test_add_create_transaction(tx, user_pub, user2_pub):
+    from bigchaindb_common.transaction import TransactionLink
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx])
+    link = TransactionLink(tx.id, 0)
+
+    assert len(utxos) == 1
+    assert link in utxos
+    assert utxos.is_unspent(link) is True
+    assert utxos.get_condition(link) == tx.conditions[0]
+    assert utxos.unspent_for(user_pub) == {link}
+    assert utxos.unspent_for(user2_pub) == set()
+    assert utxos.get_condition(TransactionLink(tx.id, 1)) is None
+
+
+def test_add_transfer_transaction(tx, transfer_tx, user_pub, user2_pub):
+    from bigchaindb_common.transaction import TransactionLink
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx, transfer_tx])
+    link = TransactionLink(transfer_tx.id, 0)
+
+    assert len(utxos) == 1
+    assert utxos.is_unspent(TransactionLink(tx.id, 0)) is False
+    assert utxos.is_unspent(link) is True
+    assert utxos.unspent_for(user_pub) == set()
+    assert utxos.unspent_for(user2_pub) == {link}
+
+
+def test_add_threshold_condition(user_pub, user2_pub, user3_pub):
+    from bigchaindb_common.transaction import Transaction, TransactionLink
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    tx = Transaction.create([user_pub], [user2_pub, [user2_pub, user3_pub]])
+    utxos = UnspentOutputs([tx])
+    link = TransactionLink(tx.id, 0)
+
+    assert utxos.unspent_for(user_pub) == set()
+    assert utxos.unspent_for(user2_pub) == {link}
+    assert utxos.unspent_for(user3_pub) == {link}
+
+
+def test_double_spend(tx, transfer_tx, user_priv, user3_pub):
+    from bigchaindb_common.exceptions import DoubleSpend
+    from bigchaindb_common.transaction import Transaction, TransactionLink
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx, transfer_tx])
+    double_spend = Transaction.transfer(tx.to_inputs(), [user3_pub], tx.asset)
+    with raises(DoubleSpend):
+        utxos.add(double_spend.sign([user_priv]))
+    assert len(utxos) == 1
+    assert utxos.is_unspent(TransactionLink(transfer_tx.id, 0)) is True
+
+
+def test_unknown_input(transfer_tx):
+    from bigchaindb_common.exceptions import InputDoesNotExist
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    with raises(InputDoesNotExist):
+        UnspentOutputs([transfer_tx])
+
+
+def test_replayed_transaction(tx, transfer_tx, user_priv, user3_pub):
+    from bigchaindb_common.exceptions import DoubleSpend
+    from bigchaindb_common.transaction import Transaction, TransactionLink
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx, transfer_tx])
+    with raises(ValueError):
+        utxos.add(tx)
+    with raises(ValueError):
+        utxos.add(transfer_tx)
+    assert utxos.is_unspent(TransactionLink(tx.id, 0)) is False
+    assert len(utxos) == 1
+
+    double_spend = Transaction.transfer(tx.to_inputs(), [user3_pub], tx.asset)
+    with raises(DoubleSpend):
+        utxos.add(double_spend.sign([user_priv]))
+
+
+def test_spending_the_same_input_twice(tx, user_priv, user3_pub):
+    from bigchaindb_common.exceptions import DoubleSpend
+    from bigchaindb_common.transaction import Transaction
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx])
+    inputs = tx.to_inputs() + tx.to_inputs()
+    double_spend = Transaction.transfer(inputs, [[user3_pub], [user3_pub]],
+                                        tx.asset)
+    with raises(DoubleSpend):
+        utxos.add(double_spend)
+    assert len(utxos) == 1
+
+
+def test_get_condition_as_input_lookup(tx, transfer_tx):
+    from bigchaindb_common.transaction import validate_many
+    from bigchaindb_common.utxo import UnspentOutputs
+
+    utxos = UnspentOutputs([tx])
+    assert validate_many([transfer_tx], utxos.get_condition,
+                         workers=1) == [True]